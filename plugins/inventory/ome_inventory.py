@@ -76,39 +76,81 @@ options:
     description: To include group variables in the inventory source.
     type: dict
     required: false
+  workers:
+    description:
+    - The maximum number of groups whose devices are fetched at the same time.
+    - The groups and hosts are added to the inventory in the same order whatever the number of workers.
+    type: int
+    default: 4
+    version_added: 9.8.0
+  incremental:
+    description:
+    - Refreshes the cached inventory with the changes since its last synchronization instead of rebuilding it.
+    - The groups are listed on every run, and only the devices inventoried since the last synchronization and
+      the members of the query groups and of the groups which are new or were updated are fetched.
+    - The members of the other groups are fetched again only when an unknown device is inventoried, so a
+      device which moves between groups without an update of the groups keeps its former groups until the
+      cache expires.
+    - The inventory is rebuilt from scratch when the cache expires after I(cache_timeout), which also drops
+      the devices deleted from OpenManage Enterprise.
+    - This is applicable only when I(cache) is C(true).
+    type: bool
+    default: false
+    version_added: 9.8.0
+extends_documentation_fragment:
+  - inventory_cache
 requirements:
   - "python >= 3.9.6"
 author:
   - "Felix Stephen (@felixs88)"
 notes:
   - Run this plugin on a system that has direct access to Dell OpenManage Enterprise.
+  - The plugin creates one session on OpenManage Enterprise for the whole inventory and sends all the requests
+    over the same connection, so the user needs the privilege to create sessions.
+  - When I(cache) is enabled, the groups, their hosts and their child groups are stored in the cache plugin
+    and served from it until I(cache_timeout) expires. I(host_vars) and I(group_vars) are applied on every run.
 """
 
-from ansible.plugins.inventory import BaseInventoryPlugin
+from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import get_all_data_with_pagination
+from ansible_collections.dellemc.openmanage.plugins.module_utils.transport import get_pool_size
+from ansible_collections.dellemc.openmanage.plugins.module_utils.concurrency import fan_out
+from ansible.module_utils.six.moves.urllib.error import HTTPError
 
 GROUP_API = "GroupService/Groups"
+DEVICE_API = "DeviceService/Devices"
+DEVICE_HOST_FIELDS = ["Id", "DeviceManagement", "LastInventoryTime"]
+MEMBER_FIELDS = ["Id"]
+DEVICE_DELTA_FILTER = "LastInventoryTime ge '{0}'"
+FILTER_UNSUPPORTED_CODES = (400, 501)
+USER_GROUP_TYPE_ID = 3000
+QUERY_MEMBERSHIP_TYPE_ID = 24
 
 
-class InventoryModule(BaseInventoryPlugin):
+class InventoryModule(BaseInventoryPlugin, Cacheable):
 
     NAME = "dellemc.openmanage.ome_inventory"
 
     def __init__(self):
         super(InventoryModule, self).__init__()
         self.config = None
+        self.ome = None
 
-    def _get_connection_resp(self):
+    def _get_module_params(self):
         port = self.get_option("port") if "port" in self.config else 443
         validate_certs = self.get_option("validate_certs") if "validate_certs" in self.config else False
         module_params = {"hostname": self.get_option("hostname"), "username": self.get_option("username"),
                          "password": self.get_option("password"), "port": port, "validate_certs": validate_certs}
         if "ca_path" in self.config:
             module_params.update({"ca_path": self.get_option("ca_path")})
-        with RestOME(module_params, req_session=False) as ome:
-            all_group_data = get_all_data_with_pagination(ome, GROUP_API)
-        return all_group_data
+        return module_params
+
+    def _get_workers(self):
+        return max(self.get_option("workers"), 1)
+
+    def _get_connection_resp(self):
+        return get_all_data_with_pagination(self.ome, GROUP_API)
 
     def _set_host_vars(self, host):
         self.inventory.set_variable(host, "idrac_ip", host)
@@ -136,73 +178,140 @@ class InventoryModule(BaseInventoryPlugin):
             dev_host = mgmt["DeviceManagement"][0]["NetworkAddress"]
         return dev_host
 
-    def _get_all_devices(self, device_uri):
-        device_host = []
-        device_host_uri = device_uri.strip("/api/")
-        port = self.get_option("port") if "port" in self.config else 443
-        validate_certs = self.get_option("validate_certs") if "validate_certs" in self.config else False
-        module_params = {
-            "hostname": self.get_option("hostname"),
-            "username": self.get_option("username"),
-            "password": self.get_option("password"),
-            "port": port,
-            "validate_certs": validate_certs}
-        if "ca_path" in self.config:
-            module_params.update({"ca_path": self.get_option("ca_path")})
-        with RestOME(module_params, req_session=False) as ome:
-            device_resp = get_all_data_with_pagination(ome, device_host_uri)
-            device_data = device_resp.get("report_list", [])
-            if device_data is not None:
-                for mgmt in device_data:
-                    if (len(mgmt["DeviceManagement"]) != 0):
-                        device_host.append(self._get_device_host(mgmt))
-        return device_host
-
-    def _set_child_group(self, group_data):
-        port = self.get_option("port") if "port" in self.config else 443
-        validate_certs = self.get_option("validate_certs") if "validate_certs" in self.config else False
-        module_params = {"hostname": self.get_option("hostname"), "username": self.get_option("username"),
-                         "password": self.get_option("password"), "port": port, "validate_certs": validate_certs}
-        if "ca_path" in self.config:
-            module_params.update({"ca_path": self.get_option("ca_path")})
-        with RestOME(module_params, req_session=False) as ome:
-            for gdata in group_data:
-                group_name = gdata["Name"]
-                subgroup_uri = gdata["SubGroups@odata.navigationLink"].strip("/api/")
-                sub_group = get_all_data_with_pagination(ome, subgroup_uri)
-                gdata = sub_group.get("report_list", [])
-                if gdata:
-                    self._add_group_data(gdata)
-                    self._add_child_group_data(group_name, gdata)
-
-    def _add_child_group_data(self, group_name, gdata):
-        for child_name in gdata:
-            self.inventory.add_child(group_name, child_name["Name"])
-
-    def _add_group_data(self, group_data):
-        visible_gdata = list(filter(lambda d: d.get("Visible") in [False], group_data))
-        if visible_gdata:
-            for gp in visible_gdata:
-                group_data.remove(gp)
-        for gdata in group_data:
-            self._set_group_vars(gdata["Name"])
-            device_ip = self._get_all_devices(gdata["AllLeafDevices@odata.navigationLink"])
-            for hst in device_ip:
-                self.inventory.add_host(host=hst, group=gdata["Name"])
-                self._set_host_vars(hst)
-        self._set_child_group(group_data)
-
-    def _populate(self, all_group_data):
-        group_data = all_group_data.get("report_list", [])
-        group_name = str(self.get_option("ome_group_name")) if "ome_group_name" in self.config else None
-        if group_name is not None:
-            group_data = list(filter(lambda d: d.get("Name").lower() in [group_name.lower()], group_data))
-        elif group_name is None:
-            group_data = list(filter(lambda d: d.get("Name") in ["All Devices"], group_data))
-        self._add_group_data(group_data)
+    def _get_group_members(self, gdata):
+        members_uri = gdata["AllLeafDevices@odata.navigationLink"].strip("/api/")
+        members = get_all_data_with_pagination(self.ome, members_uri, select=MEMBER_FIELDS)
+        return [member["Id"] for member in members.get("report_list") or []]
+
+    def _get_devices(self, watermark=None):
+        """Returns the devices, or only those inventoried since the watermark, or None when OME cannot filter them"""
+        query_param = {"$filter": DEVICE_DELTA_FILTER.format(watermark)} if watermark else None
+        try:
+            device_resp = get_all_data_with_pagination(self.ome, DEVICE_API, query_param=query_param,
+                                                       select=DEVICE_HOST_FIELDS)
+        except HTTPError as err:
+            if not watermark or err.code not in FILTER_UNSUPPORTED_CODES:
+                raise
+            return None
+        return device_resp.get("report_list") or []
+
+    def _get_group_tree(self, all_group_data, group_data):
+        """Returns the visible groups under group_data in inventory order and the parent and child group pairs"""
+        sub_groups = {}
+        for gdata in all_group_data:
+            sub_groups.setdefault(gdata.get("ParentId"), []).append(gdata)
+        groups, children, visited = [], [], set()
+
+        def add_groups(siblings):
+            siblings = [gdata for gdata in siblings if gdata.get("Visible") is not False and gdata["Id"] not in visited]
+            visited.update(gdata["Id"] for gdata in siblings)
+            groups.extend(siblings)
+            for gdata in siblings:
+                child_groups = add_groups(sub_groups.get(gdata["Id"], []))
+                children.extend([gdata["Name"], child["Name"]] for child in child_groups)
+            return siblings
+        add_groups(group_data)
+        return groups, children
+
+    def _is_query_group(self, gdata):
+        return gdata.get("TypeId") == USER_GROUP_TYPE_ID and gdata.get("MembershipTypeId") == QUERY_MEMBERSHIP_TYPE_ID
+
+    def _index_devices(self, state, devices):
+        for mgmt in devices:
+            if mgmt.get("DeviceManagement"):
+                state["devices"][str(mgmt["Id"])] = self._get_device_host(mgmt)
+            else:
+                state["devices"].pop(str(mgmt["Id"]), None)
+
+    def _sync(self, groups, state, full_index=True):
+        """
+        Brings the device index and the group members of state up to date. Only the devices inventoried since
+        the watermark and the members of the query groups and of the groups which are new or were updated are
+        fetched, unless the device delta has unknown devices, which may have joined any group.
+        Without full_index, the index is not built from the listing of all the devices, and the members missing
+        from it are resolved by their ids instead.
+        """
+        devices = self._get_devices(state["watermark"]) if state["watermark"] else None
+        rebuilt = devices is None
+        if rebuilt:
+            devices = self._get_devices() if full_index else []
+            state["devices"] = {}
+        new_devices = rebuilt or any(str(mgmt["Id"]) not in state["devices"] for mgmt in devices)
+        self._index_devices(state, devices)
+        stale_groups = [gdata for gdata in groups if new_devices or self._is_query_group(gdata) or
+                        str(gdata["Id"]) not in state["members"] or
+                        state["groups"].get(str(gdata["Id"])) != gdata.get("UpdatedTime")]
+        members = fan_out(self._get_group_members, stale_groups, workers=self._get_workers())
+        for gdata, device_ids in zip(stale_groups, members):
+            state["members"][str(gdata["Id"])] = device_ids
+        state["groups"] = dict((str(gdata["Id"]), gdata.get("UpdatedTime")) for gdata in groups)
+        state["members"] = dict((group_id, state["members"][group_id]) for group_id in state["groups"])
+        if not full_index:
+            missing = set(str(device_id) for device_ids in state["members"].values() for device_id in device_ids)
+            missing = sorted(int(device_id) for device_id in missing.difference(state["devices"]))
+            resolved = list(self.ome.resolve_devices(device_ids=missing, select=DEVICE_HOST_FIELDS)["Id"].values())
+            self._index_devices(state, resolved)
+            devices = devices + resolved
+        timestamps = [mgmt.get("LastInventoryTime") for mgmt in devices] + [state["watermark"]]
+        state["watermark"] = max([stamp for stamp in timestamps if stamp] or [None])
+        return state
+
+    def _build_graph(self, state=None):
+        """
+        Returns the groups with their hosts and the parent and child group pairs, in inventory order, and
+        the sync state of the devices and group members from which the hosts are resolved.
+        The group tree is built from the ParentId of the groups in one listing and the members of every group
+        are resolved from one index of the devices, so the requests do not grow with the depth of the tree.
+        The index is built from the listing of all the devices for the All Devices group, and from a lookup
+        of the members by id for the groups under ome_group_name.
+        When the sync state of the cached inventory is given, only the changes since then are fetched.
+        All the requests share one session and the keep-alive connections of one pool.
+        """
+        state = state or {"watermark": None, "devices": {}, "members": {}, "groups": {}}
+        pool_size = max(get_pool_size(), self._get_workers())
+        with RestOME(self._get_module_params(), req_session=True, pool_size=pool_size) as self.ome:
+            all_group_data = self._get_connection_resp().get("report_list", [])
+            group_name = str(self.get_option("ome_group_name")) if "ome_group_name" in self.config else None
+            if group_name is not None:
+                group_data = list(filter(lambda d: d.get("Name").lower() in [group_name.lower()], all_group_data))
+            elif group_name is None:
+                group_data = list(filter(lambda d: d.get("Name") in ["All Devices"], all_group_data))
+            groups, children = self._get_group_tree(all_group_data, group_data)
+            full_index = group_name is None or group_name.lower() == "all devices"
+            state = self._sync(groups, state, full_index=full_index)
+        self.ome = None
+        graph = {"groups": [], "children": children, "sync": state}
+        for gdata in groups:
+            device_host = []
+            for device_id in state["members"][str(gdata["Id"])]:
+                hst = state["devices"].get(str(device_id))
+                if hst is not None and hst not in device_host:
+                    device_host.append(hst)
+            graph["groups"].append({"name": gdata["Name"], "hosts": device_host})
+        return graph
+
+    def _populate(self, graph):
+        hosts = set()
+        for group in graph["groups"]:
+            self._set_group_vars(group["name"])
+            for hst in group["hosts"]:
+                self.inventory.add_host(host=hst, group=group["name"])
+                if hst not in hosts:
+                    self._set_host_vars(hst)
+                    hosts.add(hst)
+        for group_name, child_name in graph["children"]:
+            self.inventory.add_child(group_name, child_name)
 
     def parse(self, inventory, loader, path, cache=True):
         super(InventoryModule, self).parse(inventory, loader, path, cache)
         self.config = self._read_config_data(path)
-        all_group_data = self._get_connection_resp()
-        self._populate(all_group_data)
+        cache_key = self.get_cache_key(path)
+        use_cache = self.get_option("cache")
+        graph = None
+        if use_cache and cache:
+            graph = self._cache.get(cache_key)
+        if graph is None or (use_cache and self.get_option("incremental")):
+            graph = self._build_graph(graph.get("sync") if graph else None)
+            if use_cache:
+                self._cache[cache_key] = graph
+        self._populate(graph)
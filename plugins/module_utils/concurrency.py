@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 9.8.0
+# Copyright (C) 2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from ansible_collections.dellemc.openmanage.plugins.module_utils.transport import get_env_int
+
+FAN_OUT_WORKERS_ENV = "OMAM_FAN_OUT_WORKERS"
+
+
+def fan_out_workers(default=1):
+    """Returns the number of concurrent requests of a fan out configured in OMAM_FAN_OUT_WORKERS"""
+    return max(get_env_int(FAN_OUT_WORKERS_ENV, default), 1)
+
+
+@contextmanager
+def bounded_executor(workers):
+    """
+    Yields a pool of at most workers threads. When the block exits, the calls which have not started
+    are cancelled and the running ones are waited for, so that no thread outlives the block.
+    The clients shared by the calls must be thread safe, as RestOME, iDRACRedfishAPI and Redfish are.
+    """
+    executor = ThreadPoolExecutor(max_workers=max(workers, 1))
+    try:
+        yield executor
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def map_bounded(func, items, workers):
+    """
+    Calls func with every item, with at most workers calls running at the same time, and returns the
+    results in the order of items. The calls are made one after the other with one worker. As in a
+    loop, the exception of the first failed item is raised.
+    """
+    items = list(items)
+    if workers <= 1 or len(items) <= 1:
+        return [func(item) for item in items]
+    with bounded_executor(min(workers, len(items))) as executor:
+        futures = [executor.submit(func, item) for item in items]
+        return [future.result() for future in futures]
+
+
+def fan_out(func, items, workers=None):
+    """
+    Calls func, which sends the requests of one item, with every item and returns the results in the
+    order of items, with at most OMAM_FAN_OUT_WORKERS items in progress unless workers is given.
+    """
+    return map_bounded(func, items, fan_out_workers() if workers is None else workers)
@@ -32,12 +32,20 @@ __metaclass__ = type
 import json
 import re
 import time
-import os
-from ansible.module_utils.urls import open_url, ConnectionError, SSLValidationError
+from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.six.moves.urllib.parse import urlencode
 from ansible.module_utils.common.parameters import env_fallback
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import config_ipv6
+from ansible_collections.dellemc.openmanage.plugins.module_utils.transport import open_url
+from ansible_collections.dellemc.openmanage.plugins.module_utils.rest_transport import OpenURLResponse, \
+    OpenURLBackend, RestTransport, get_omam_ca_env
+from ansible_collections.dellemc.openmanage.plugins.module_utils.metadata_cache import MetadataCache, invoke_cached
+from ansible_collections.dellemc.openmanage.plugins.module_utils.session_cache import SessionCache
+from ansible_collections.dellemc.openmanage.plugins.module_utils.instrumentation import InstrumentedModuleMixin
+from ansible_collections.dellemc.openmanage.plugins.module_utils.job_events import job_events
+from ansible_collections.dellemc.openmanage.plugins.module_utils.job_state import JobStateMap, JobStateEngine, \
+    IDRAC_JOB_STATES, json_document
 from ansible.module_utils.basic import AnsibleModule
 
 idrac_auth_params = {
@@ -56,43 +64,21 @@ SESSION_RESOURCE_COLLECTION = {
     "SESSION_ID": "/redfish/v1/Sessions/{Id}",
 }
 MANAGER_URI = "/redfish/v1/Managers/iDRAC.Embedded.1"
+FIRMWARE_VERSION_URI = "/redfish/v1/Managers/iDRAC.Embedded.1?$select=FirmwareVersion"
 EXPORT_URI = "/redfish/v1/Managers/iDRAC.Embedded.1/Actions/Oem/EID_674_Manager.ExportSystemConfiguration"
 IMPORT_URI = "/redfish/v1/Managers/iDRAC.Embedded.1/Actions/Oem/EID_674_Manager.ImportSystemConfiguration"
 IMPORT_PREVIEW = "/redfish/v1/Managers/iDRAC.Embedded.1/Actions/Oem/EID_674_Manager.ImportSystemConfigurationPreview"
 
 
-class OpenURLResponse(object):
-    """Handles HTTPResponse"""
+IDRAC_TASK_STATES = JobStateMap("idrac_task", ("TaskState",), running_states=("Running",))
 
-    def __init__(self, resp):
-        self.body = None
-        self.resp = resp
-        if self.resp:
-            self.body = self.resp.read()
 
-    @property
-    def json_data(self):
-        try:
-            return json.loads(self.body)
-        except ValueError:
-            raise ValueError("Unable to parse json")
-
-    @property
-    def status_code(self):
-        return self.resp.getcode()
-
-    @property
-    def success(self):
-        status = self.status_code
-        return status >= 200 & status <= 299
-
-    @property
-    def headers(self):
-        return self.resp.headers
-
-    @property
-    def reason(self):
-        return self.resp.reason
+def task_document(resp):
+    """Returns the task of a response, or None once the task URI serves the exported content instead"""
+    try:
+        return resp.json_data
+    except ValueError:
+        return None
 
 
 class iDRACRedfishAPI(object):
@@ -113,6 +99,11 @@ class iDRACRedfishAPI(object):
         self.protocol = 'https'
         self._headers = {'Content-Type': 'application/json', 'Accept': 'application/json'}
         self.ipaddress = config_ipv6(self.ipaddress)
+        self.metadata_cache = MetadataCache.from_env()
+        self.firmware_version = None
+        self.session_cache = SessionCache.from_env()
+        self.cached_session = False
+        self.transport = RestTransport(self, "iDRACRedfishAPI", self.ipaddress, response_class=OpenURLResponse)
 
     def _get_url(self, uri):
         return "{0}://{1}:{2}{3}".format(self.protocol, self.ipaddress, self.port, uri)
@@ -129,43 +120,41 @@ class iDRACRedfishAPI(object):
 
     def _url_common_args_spec(self, method, api_timeout, headers=None):
         """Creates an argument common spec"""
-        req_header = self._headers
-        if headers:
-            req_header.update(headers)
-        if api_timeout is None:
-            api_timeout = self.timeout
-        if self.ca_path is None:
-            self.ca_path = self._get_omam_ca_env()
-        url_kwargs = {
-            "method": method,
-            "validate_certs": self.validate_certs,
-            "ca_path": self.ca_path,
-            "use_proxy": self.use_proxy,
-            "headers": req_header,
-            "timeout": api_timeout,
-            "follow_redirects": 'all',
-        }
-        return url_kwargs
+        return self.transport.common_args(method, api_timeout, headers=headers)
 
     def _args_without_session(self, path, method, api_timeout, headers=None):
-        """Creates an argument spec in case of basic authentication"""
-        req_header = self._headers
-        if headers:
-            req_header.update(headers)
-        url_kwargs = self._url_common_args_spec(method, api_timeout, headers=headers)
-        if not (path == SESSION_RESOURCE_COLLECTION["SESSION"] and method == 'POST'):
-            url_kwargs["url_username"] = self.username
-            url_kwargs["url_password"] = self.password
-            url_kwargs["force_basic_auth"] = True
-        return url_kwargs
+        """Creates an argument spec in case of basic authentication, except for the session login"""
+        login = path == SESSION_RESOURCE_COLLECTION["SESSION"] and method == 'POST'
+        return self.transport.args_without_session(method, api_timeout, headers=headers, basic_auth=not login)
 
     def _args_with_session(self, method, api_timeout, headers=None):
         """Creates an argument spec, in case of authentication with session"""
-        url_kwargs = self._url_common_args_spec(method, api_timeout, headers=headers)
-        url_kwargs["force_basic_auth"] = False
-        return url_kwargs
-
-    def invoke_request(self, uri, method, data=None, query_param=None, headers=None, api_timeout=None, dump=True):
+        return self.transport.args_with_session(method, api_timeout, headers=headers)
+
+    def _send_conditional(self, uri, query_param, headers):
+        return self.invoke_request(uri, 'GET', query_param=query_param, headers=headers)
+
+    def _get_firmware_version(self):
+        """Returns the iDRAC firmware version of the metadata cache keys, cached with the version TTL and
+        revalidated with its ETag afterwards, so that the keys follow firmware updates"""
+        if self.firmware_version is None:
+            key = [self.ipaddress, self.port, FIRMWARE_VERSION_URI]
+            resp = invoke_cached(self.metadata_cache, key,
+                                 lambda headers: self._send_conditional(FIRMWARE_VERSION_URI, None, headers),
+                                 OpenURLResponse, ttl=self.metadata_cache.version_ttl)
+            self.firmware_version = resp.json_data.get("FirmwareVersion")
+        return self.firmware_version
+
+    def _invoke_cached_request(self, uri, query_param=None):
+        key = [self.ipaddress, self.port, self._build_url(uri, query_param=query_param)[len(self._get_url("")):],
+               self._get_firmware_version()]
+        return invoke_cached(self.metadata_cache, key,
+                             lambda headers: self._send_conditional(uri, query_param, headers), OpenURLResponse)
+
+    def invoke_request(self, uri, method, data=None, query_param=None, headers=None, api_timeout=None, dump=True,
+                       cache=False, retry_policy=None):
+        if cache and method == 'GET' and self.metadata_cache is not None:
+            return self._invoke_cached_request(uri, query_param=query_param)
         try:
             if 'X-Auth-Token' in self._headers:
                 url_kwargs = self._args_with_session(method, api_timeout, headers=headers)
@@ -174,32 +163,61 @@ class iDRACRedfishAPI(object):
             if data and dump:
                 data = json.dumps(data)
             url = self._build_url(uri, query_param=query_param)
-            resp = open_url(url, data=data, **url_kwargs)
-            resp_data = OpenURLResponse(resp)
+            resp_data = self.transport.send(method, url, data, url_kwargs, backend=OpenURLBackend(open_url),
+                                            retry_policy=retry_policy)
         except (HTTPError, URLError, SSLValidationError, ConnectionError) as err:
             raise err
         return resp_data
 
+    def _login(self):
+        """Creates a session and returns its ID and token"""
+        payload = {'UserName': self.username,
+                   'Password': self.password}
+        path = SESSION_RESOURCE_COLLECTION["SESSION"]
+        resp = self.invoke_request(path, 'POST', data=payload)
+        if resp and resp.success:
+            return resp.json_data.get("Id"), resp.headers.get('X-Auth-Token')
+        msg = "Could not create the session"
+        raise ConnectionError(msg)
+
+    def _validate_session(self, session_id, token):
+        """Tells whether the iDRAC still accepts a cached session, any failed request tells that it does not"""
+        self._headers["X-Auth-Token"] = token
+        try:
+            self.invoke_request(SESSION_RESOURCE_COLLECTION["SESSION_ID"].format(Id=session_id), 'GET')
+        except (URLError, HTTPError, SSLValidationError, ConnectionError):
+            self._headers.pop("X-Auth-Token", None)
+            return False
+        return True
+
+    def _logout(self, session_id, token):
+        """Deletes a cached session which is not reused, ignoring the failures as it may have expired already"""
+        self._headers["X-Auth-Token"] = token
+        try:
+            self.invoke_request(SESSION_RESOURCE_COLLECTION["SESSION_ID"].format(Id=session_id), 'DELETE')
+        except (URLError, HTTPError, SSLValidationError, ConnectionError):
+            pass
+        finally:
+            self._headers.pop("X-Auth-Token", None)
+
     def __enter__(self):
         """Creates sessions by passing it to header"""
         if self.req_session and not self.x_auth_token:
-            payload = {'UserName': self.username,
-                       'Password': self.password}
-            path = SESSION_RESOURCE_COLLECTION["SESSION"]
-            resp = self.invoke_request(path, 'POST', data=payload)
-            if resp and resp.success:
-                self.session_id = resp.json_data.get("Id")
-                self._headers["X-Auth-Token"] = resp.headers.get('X-Auth-Token')
+            if self.session_cache is not None:
+                self.session_id, token = self.session_cache.session(
+                    ["idrac", self.ipaddress, self.port, self.username], self.password, self._login,
+                    self._validate_session, self._logout)
+                self.cached_session = True
             else:
-                msg = "Could not create the session"
-                raise ConnectionError(msg)
+                self.session_id, token = self._login()
+            self._headers["X-Auth-Token"] = token
         elif self.x_auth_token is not None:
             self._headers["X-Auth-Token"] = self.x_auth_token
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
-        """Deletes a session id, which is in use for request"""
-        if self.session_id:
+        """Deletes a session id, which is in use for request, unless the session cache keeps it"""
+        if self.session_id and not self.cached_session:
             path = SESSION_RESOURCE_COLLECTION["SESSION_ID"].format(Id=self.session_id)
             self.invoke_request(path, 'DELETE')
         return False
@@ -224,18 +242,13 @@ class iDRACRedfishAPI(object):
         :param job_wait: True or False decide whether to wait till the job completion.
         :return: object
         """
-        response = None
-        while job_wait:
-            try:
-                response = self.invoke_request(task_uri, "GET")
-                if response.json_data.get("TaskState") == "Running":
-                    time.sleep(10)
-                else:
-                    break
-            except ValueError:
-                response = response.body
-                break
-        return response
+        if not job_wait:
+            return None
+        outcome = JobStateEngine(IDRAC_TASK_STATES, float("inf"), 10, document=task_document).wait(
+            lambda: self.invoke_request(task_uri, "GET"), job_id=task_uri)
+        if task_document(outcome.job) is None:
+            return outcome.job.body
+        return outcome.job
 
     def wait_for_job_completion(self, job_uri, job_wait=False, reboot=False, apply_update=False):
         """
@@ -244,16 +257,18 @@ class iDRACRedfishAPI(object):
         :param job_wait: True or False decide whether to wait till the job completion.
         :return: object
         """
+        def is_done(job):
+            if job.get("PercentComplete") == 100 and job.get("JobState") == "Completed":
+                return True
+            return job.get("JobState") == "Starting" and not reboot and apply_update
+
+        state_map = JobStateMap(IDRAC_JOB_STATES.name, ("JobState",), terminal=is_done)
         time.sleep(5)
         response = self.invoke_request(job_uri, "GET")
-        while job_wait:
-            response = self.invoke_request(job_uri, "GET")
-            if response.json_data.get("PercentComplete") == 100 and \
-                    response.json_data.get("JobState") == "Completed":
-                break
-            if response.json_data.get("JobState") == "Starting" and not reboot and apply_update:
-                break
-            time.sleep(30)
+        if job_wait and not is_done(response.json_data):
+            with job_events(self, job_uri) as events:
+                response = JobStateEngine(state_map, float("inf"), 30, events=events, document=json_document).wait(
+                    lambda: self.invoke_request(job_uri, "GET"), job_id=job_uri).job
         return response
 
     def export_scp(self, export_format=None, export_use=None, target=None,
@@ -436,10 +451,10 @@ class iDRACRedfishAPI(object):
 
     def _get_omam_ca_env(self):
         """Check if the value is set in REQUESTS_CA_BUNDLE or CURL_CA_BUNDLE or OMAM_CA_BUNDLE or returns None"""
-        return os.environ.get("REQUESTS_CA_BUNDLE") or os.environ.get("CURL_CA_BUNDLE") or os.environ.get("OMAM_CA_BUNDLE")
+        return get_omam_ca_env()
 
 
-class IdracAnsibleModule(AnsibleModule):
+class IdracAnsibleModule(InstrumentedModuleMixin, AnsibleModule):
     def __init__(self, argument_spec, bypass_checks=False, no_log=False,
                  mutually_exclusive=None, required_together=None,
                  required_one_of=None, add_file_common_args=False,
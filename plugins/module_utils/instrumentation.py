@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 9.8.0
+# Copyright (C) 2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import json
+import os
+import re
+import threading
+import time
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible.module_utils.six.moves.urllib.parse import urlparse
+
+INSTRUMENTATION_ENV = "OMAM_INSTRUMENTATION"
+SPANS_FILE_ENV = "OMAM_INSTRUMENTATION_SPANS"
+DEBUG_KEY = "debug"
+
+_PATH_PATTERNS = [
+    (re.compile(r"\('[^']*'\)"), "('{id}')"),
+    (re.compile(r"\(\d+\)"), "({id})"),
+    (re.compile(r"\b[A-Z]+_\d+\b"), "{job_id}"),
+    (re.compile(r"/[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}(?=/|$)"), "/{id}"),
+    (re.compile(r"/\d+(?=/|$)"), "/{id}"),
+]
+
+_spans = []
+_jobs = []
+_lock = threading.Lock()
+
+
+def instrumentation_enabled():
+    """Returns True when OMAM_INSTRUMENTATION asks for request spans to be recorded"""
+    return os.environ.get(INSTRUMENTATION_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def template_path(url):
+    """Returns the path of the url without the query and with resource identifiers replaced by placeholders"""
+    path = urlparse(url).path or "/"
+    for pattern, placeholder in _PATH_PATTERNS:
+        path = pattern.sub(placeholder, path)
+    return path
+
+
+def _content_length(headers, default=0):
+    try:
+        return int(headers.get("Content-Length"))
+    except (AttributeError, TypeError, ValueError):
+        return default
+
+
+def _payload_bytes(data):
+    if not data:
+        return 0
+    if isinstance(data, bytes):
+        return len(data)
+    return len(str(data).encode("utf-8"))
+
+
+class RequestSpan(object):
+    """Times one request and records it once the request completes or fails"""
+
+    def __init__(self, client, method, url, data=None):
+        self.span = {"client": client, "method": method, "path": template_path(url), "status": None,
+                     "latency": 0.0, "request_bytes": _payload_bytes(data), "response_bytes": 0, "retries": 0}
+        self._start = None
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def set_response(self, resp):
+        self.span["status"] = resp.status_code
+        self.span["response_bytes"] = _content_length(getattr(getattr(resp, "resp", None), "headers", None),
+                                                      len(resp.body or b""))
+
+    def add_retry(self):
+        self.span["retries"] += 1
+
+    def __exit__(self, exc_type, exc, tb):
+        self.span["latency"] = round(time.perf_counter() - self._start, 6)
+        if isinstance(exc, HTTPError):
+            self.span["status"] = exc.code
+            self.span["response_bytes"] = _content_length(exc.headers)
+        elif exc is not None:
+            self.span["status"] = exc_type.__name__
+        record_span(self.span)
+        return False
+
+
+class _NullSpan(object):
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set_response(self, resp):
+        pass
+
+    def add_retry(self):
+        pass
+
+
+NULL_SPAN = _NullSpan()
+
+
+def request_span(client, method, url, data=None):
+    """Returns the span timing a request, which does nothing unless OMAM_INSTRUMENTATION is set"""
+    if not instrumentation_enabled():
+        return NULL_SPAN
+    return RequestSpan(client, method, url, data)
+
+
+def record_span(span):
+    """Keeps the span for the module summary and appends it to OMAM_INSTRUMENTATION_SPANS when set"""
+    spans_file = os.environ.get(SPANS_FILE_ENV)
+    with _lock:
+        _spans.append(span)
+        if spans_file:
+            with open(os.path.expanduser(spans_file), "a") as jsonl:
+                jsonl.write(json.dumps(span, sort_keys=True) + "\n")
+
+
+def get_spans():
+    with _lock:
+        return list(_spans)
+
+
+def reset_spans():
+    with _lock:
+        del _spans[:]
+        del _jobs[:]
+
+
+def record_job(metrics):
+    """Keeps the timing of a tracked job for the module summary when instrumentation is enabled"""
+    if instrumentation_enabled():
+        with _lock:
+            _jobs.append(dict(metrics))
+
+
+def get_jobs():
+    with _lock:
+        return list(_jobs)
+
+
+def _percentile(values, percent):
+    ordered = sorted(values)
+    rank = max(int(-(-percent * len(ordered) // 100)) - 1, 0)
+    return ordered[rank]
+
+
+def request_summary(spans=None):
+    """Returns the request count, p50 and p95 latency in milliseconds, bytes and retries per endpoint"""
+    spans = get_spans() if spans is None else spans
+    endpoints = {}
+    for span in spans:
+        endpoints.setdefault((span["method"], span["path"]), []).append(span)
+    summary = []
+    for (method, path), calls in sorted(endpoints.items()):
+        latencies = [call["latency"] * 1000 for call in calls]
+        summary.append({
+            "method": method, "path": path, "count": len(calls),
+            "p50_ms": round(_percentile(latencies, 50), 3), "p95_ms": round(_percentile(latencies, 95), 3),
+            "request_bytes": sum(call["request_bytes"] for call in calls),
+            "response_bytes": sum(call["response_bytes"] for call in calls),
+            "retries": sum(call["retries"] for call in calls),
+            "statuses": sorted(set(str(call["status"]) for call in calls)),
+        })
+    return {"total_requests": len(spans),
+            "total_request_bytes": sum(span["request_bytes"] for span in spans),
+            "total_response_bytes": sum(span["response_bytes"] for span in spans),
+            "endpoints": summary}
+
+
+def add_debug_summary(result):
+    """Adds the request summary and the job timings under the debug key of a module result when instrumentation is enabled"""
+    if instrumentation_enabled():
+        spans = get_spans()
+        if spans:
+            result.setdefault(DEBUG_KEY, {})["requests"] = request_summary(spans)
+        jobs = get_jobs()
+        if jobs:
+            result.setdefault(DEBUG_KEY, {})["jobs"] = jobs
+    return result
+
+
+class InstrumentedModuleMixin(object):
+    """Returns the request summary with the module result when OMAM_INSTRUMENTATION is set"""
+
+    def exit_json(self, **kwargs):
+        add_debug_summary(kwargs)
+        super(InstrumentedModuleMixin, self).exit_json(**kwargs)
+
+    def fail_json(self, msg, **kwargs):
+        add_debug_summary(kwargs)
+        super(InstrumentedModuleMixin, self).fail_json(msg=msg, **kwargs)
@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 9.8.0
+# Copyright (C) 2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import json
+import os
+import ssl
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from ansible.module_utils.six.moves.urllib.parse import urlparse
+from ansible_collections.dellemc.openmanage.plugins.module_utils.transport import get_env_int
+
+LISTENER_ENV = "OMAM_JOB_EVENTS_LISTENER"
+CERT_ENV = "OMAM_JOB_EVENTS_CERT"
+KEY_ENV = "OMAM_JOB_EVENTS_KEY"
+GRACE_ENV = "OMAM_JOB_EVENTS_GRACE"
+DEFAULT_GRACE = 30
+SUBSCRIPTION_URI = "/redfish/v1/EventService/Subscriptions"
+# The iDRAC only accepts the Alert event type, it refuses the deprecated StatusChange and ResourceUpdated
+# types, and posts the job control messages, such as JCP037 for a completed job, as Alert events.
+JOB_EVENT_TYPES = ["Alert"]
+
+
+class _EventHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        self.server.listener.receive(self.rfile.read(length) if length else b"")
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+
+class JobEventListener(object):
+    """
+    Short-lived HTTPS listener which receives the events that an iDRAC posts to a Redfish event
+    subscription. The address must be reachable from the iDRAC, port 0 picks a free port.
+    """
+
+    def __init__(self, address, certfile, keyfile=None, grace=DEFAULT_GRACE):
+        host, dummy, port = address.rpartition(":")
+        self.host = host.strip("[]") or address
+        self.port = int(port) if host else 0
+        self.certfile = certfile
+        self.keyfile = keyfile
+        self.grace = grace
+        self.events = []
+        self._condition = threading.Condition()
+        self._server = None
+
+    @classmethod
+    def from_env(cls):
+        """Returns the listener configured in OMAM_JOB_EVENTS_LISTENER or None when job events are disabled"""
+        address = os.environ.get(LISTENER_ENV)
+        certfile = os.environ.get(CERT_ENV)
+        if not (address and certfile):
+            return None
+        return cls(address, os.path.expanduser(certfile), keyfile=os.environ.get(KEY_ENV),
+                   grace=get_env_int(GRACE_ENV, DEFAULT_GRACE))
+
+    @property
+    def destination(self):
+        host = "[{0}]".format(self.host) if ":" in self.host else self.host
+        return "https://{0}:{1}/".format(host, self._server.server_address[1])
+
+    def start(self):
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(self.certfile, self.keyfile and os.path.expanduser(self.keyfile))
+        server = ThreadingHTTPServer((self.host, self.port), _EventHandler)
+        server.daemon_threads = True
+        server.socket = context.wrap_socket(server.socket, server_side=True)
+        server.listener = self
+        thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.1})
+        thread.daemon = True
+        thread.start()
+        self._server = server
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def receive(self, body):
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            return
+        events = payload.get("Events") if isinstance(payload, dict) else None
+        with self._condition:
+            self.events.extend(events if isinstance(events, list) else [payload])
+            self._condition.notify_all()
+
+    def watch(self, job_id):
+        return JobEvents(self, job_id)
+
+
+class JobEvents(object):
+    """
+    Waits for the events of one job, as used by JobPoller in place of its sleeps. An event is about the job
+    when the job ID is one of its MessageArgs or the last segment of its OriginOfCondition.
+    """
+
+    def __init__(self, listener, job_id):
+        self.listener = listener
+        self.job_id = job_id
+        self.grace = listener.grace
+        self._seen = 0
+
+    def _about_job(self, event):
+        if not isinstance(event, dict):
+            return False
+        args = event.get("MessageArgs")
+        if isinstance(args, list) and self.job_id in args:
+            return True
+        origin = event.get("OriginOfCondition")
+        if isinstance(origin, dict):
+            origin = origin.get("@odata.id")
+        return isinstance(origin, str) and origin.rstrip("/").split("/")[-1] == self.job_id
+
+    def _arrived(self):
+        events = self.listener.events[self._seen:]
+        self._seen += len(events)
+        return any(self._about_job(event) for event in events)
+
+    def wait(self, timeout):
+        """Returns True once an event about the job arrived, or False after timeout seconds"""
+        with self.listener._condition:
+            return self.listener._condition.wait_for(self._arrived, timeout)
+
+
+def subscribe(rest_obj, destination):
+    """Registers the destination for iDRAC alerts and returns the URI of the subscription"""
+    payload = {"Destination": destination, "EventTypes": JOB_EVENT_TYPES, "Context": "RedfishEvent",
+               "Protocol": "Redfish", "EventFormatType": "Event"}
+    resp = rest_obj.invoke_request(uri=SUBSCRIPTION_URI, method="POST", data=payload)
+    location = resp.headers.get("Location")
+    if not location:
+        location = resp.json_data.get("@odata.id")
+    return urlparse(location).path if location else None
+
+
+@contextmanager
+def job_events(rest_obj, job_uri):
+    """
+    Yields the JobEvents of the job when OMAM_JOB_EVENTS_LISTENER is set and the iDRAC accepted the
+    subscription, or None so that the caller polls. The subscription and the listener are removed on exit.
+    The requests are sent with the uri and method keywords of the iDRAC clients, iDRACRedfishAPI and
+    SessionAPI, so a client which takes other arguments fails to subscribe and polls.
+    """
+    listener = JobEventListener.from_env()
+    subscription = None
+    try:
+        if listener is not None:
+            listener.start()
+            subscription = subscribe(rest_obj, listener.destination)
+    except Exception:
+        listener.stop()
+        listener = None
+    try:
+        yield listener.watch(urlparse(job_uri).path.rstrip("/").split("/")[-1]) if listener else None
+    finally:
+        if listener is not None:
+            if subscription:
+                try:
+                    rest_obj.invoke_request(uri=subscription, method="DELETE")
+                except Exception:
+                    pass
+            listener.stop()
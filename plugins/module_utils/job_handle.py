@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 9.8.0
+# Copyright (C) 2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, wait
+from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
+from ansible.module_utils.urls import ConnectionError, SSLValidationError
+from ansible_collections.dellemc.openmanage.plugins.module_utils.concurrency import bounded_executor
+from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI
+from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME
+from ansible_collections.dellemc.openmanage.plugins.module_utils.redfish import Redfish
+from ansible_collections.dellemc.openmanage.plugins.module_utils.instrumentation import record_job
+from ansible_collections.dellemc.openmanage.plugins.module_utils.job_poller import JobPoller
+from ansible_collections.dellemc.openmanage.plugins.module_utils.job_state import STATE_MAPS, json_document
+
+JOB_HANDLE_KEYS = ("api", "host", "port", "job_uri", "job_id", "state_map")
+DEFAULT_STATE_MAPS = {"idrac": "idrac", "ome": "ome_info", "redfish": "redfish_task"}
+DEFAULT_PORT = 443
+FLEET_WORKERS = 16
+# errors which end tracking of a job at once instead of being retried at the next poll
+PERMANENT_HTTP_ERRORS = (400, 401, 403, 404, 405)
+TRANSIENT_ERRORS = (HTTPError, URLError, SSLValidationError, ConnectionError, OSError)
+
+
+def job_handle(api, module_params, job_uri, job_id=None, state_map=None):
+    """
+    Returns a serializable handle of a submitted job, which the ome_idrac_job_wait module tracks later on. The handle
+    holds the host and port of the appliance but no credentials.
+    :param api: C(idrac), C(ome) or C(redfish), the client which fetches job_uri
+    :param module_params: parameters of the module which submitted the job
+    :param job_uri: path of the job resource for the client of api
+    :param state_map: name of a job state map, which defaults to the usual map of api
+    """
+    if api == "ome":
+        host, port = module_params.get("hostname"), module_params.get("port")
+    elif api == "idrac":
+        host = module_params.get("idrac_ip") or module_params.get("hostname")
+        port = module_params.get("idrac_port") or module_params.get("port")
+    else:
+        host, port = module_params.get("baseuri"), None
+    return {"api": api, "host": host, "port": port, "job_uri": job_uri, "job_id": job_id,
+            "state_map": state_map or DEFAULT_STATE_MAPS[api]}
+
+
+def _client(handle, credentials):
+    params = {"validate_certs": credentials.get("validate_certs", True), "ca_path": credentials.get("ca_path"),
+              "timeout": credentials.get("timeout", 30)}
+    username = handle.get("username") or credentials.get("username")
+    password = handle.get("password") or credentials.get("password")
+    port = handle.get("port") or DEFAULT_PORT
+    if handle["api"] == "idrac":
+        params.update({"idrac_ip": handle["host"], "idrac_port": port, "idrac_user": username,
+                       "idrac_password": password})
+        return iDRACRedfishAPI(params)
+    if handle["api"] == "ome":
+        params.update({"hostname": handle["host"], "port": port, "username": username, "password": password})
+        return RestOME(params)
+    baseuri = handle["host"] if not handle.get("port") else "{0}:{1}".format(handle["host"], handle["port"])
+    params.update({"baseuri": baseuri, "username": username, "password": password})
+    return Redfish(params)
+
+
+def fetch_job(client, handle):
+    """Fetches the job resource of a handle with an open client of its api"""
+    if handle["api"] == "idrac":
+        return client.invoke_request(handle["job_uri"], "GET")
+    return client.invoke_request("GET", handle["job_uri"])
+
+
+class _FleetClients(object):
+    """
+    Opens one client per appliance and user the first time one of its jobs is polled, and keeps it for
+    all the following polls of the fleet. A client whose session was rejected is opened again once.
+    """
+
+    def __init__(self, credentials):
+        self.credentials = credentials
+        self._clients = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(handle):
+        return handle["api"], handle["host"], handle.get("port"), handle.get("username")
+
+    def _get(self, handle):
+        key = self._key(handle)
+        with self._lock:
+            lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            if key not in self._clients:
+                client = _client(handle, self.credentials)
+                self._clients[key] = (client, client.__enter__())
+            return self._clients[key][1]
+
+    def _discard(self, handle, opened):
+        key = self._key(handle)
+        with self._locks[key]:
+            client, current = self._clients.get(key, (None, None))
+            if current is not opened:
+                return
+            del self._clients[key]
+        self._exit(client)
+
+    @staticmethod
+    def _exit(client):
+        try:
+            client.__exit__(None, None, None)
+        except TRANSIENT_ERRORS:
+            pass
+
+    def fetch(self, handle):
+        client = self._get(handle)
+        try:
+            return fetch_job(client, handle)
+        except HTTPError as err:
+            if err.code != 401:
+                raise
+        self._discard(handle, client)
+        return fetch_job(self._get(handle), handle)
+
+    def close(self):
+        """Closes the sessions of all clients, an appliance which does not answer any more is skipped"""
+        with self._lock:
+            clients, self._clients = [client for client, opened in self._clients.values()], {}
+        for client in clients:
+            self._exit(client)
+
+
+class _TrackedJob(object):
+
+    def __init__(self, handle, timeout, max_interval):
+        self.handle = handle
+        self.state_map = STATE_MAPS[handle["state_map"]]
+        self.poller = JobPoller(timeout, max_interval)
+        self.delays = self.poller.intervals()
+        self.due = next(self.delays)
+        self.document = None
+        self.status = "timeout"
+        self.error = None
+
+    def update(self, future, now):
+        """Applies the outcome of one poll and tells whether the job is over"""
+        try:
+            self.document = json_document(future.result())
+        except HTTPError as err:
+            return self._error(err, err.code in PERMANENT_HTTP_ERRORS, now)
+        except TRANSIENT_ERRORS as err:
+            return self._error(err, False, now)
+        except Exception as err:
+            return self._error(err, True, now)
+        self.poller.polls += 1
+        self.error = None
+        if self.state_map.is_terminal(self.document):
+            self.status = "failed" if self.state_map.is_failed(self.document) else "completed"
+            return True
+        self.due = now + next(self.delays)
+        return False
+
+    def _error(self, err, permanent, now):
+        self.poller.errors += 1
+        self.error = str(err)
+        if permanent:
+            self.status = "error"
+            return True
+        self.due = now + next(self.delays)
+        return False
+
+    def result(self, elapsed):
+        result = dict((key, self.handle.get(key)) for key in JOB_HANDLE_KEYS)
+        result.update({"status": self.status, "state": self.state_map.state(self.document or {}),
+                       "job": self.document, "polls": self.poller.polls, "errors": self.poller.errors,
+                       "error": self.error, "elapsed": round(elapsed, 3)})
+        record_job({"job": self.handle.get("job_id") or self.handle["job_uri"], "state_map": self.state_map.name,
+                    "outcome": self.status, "state": result["state"], "polls": self.poller.polls,
+                    "errors": self.poller.errors, "event_wakeups": 0, "elapsed": result["elapsed"]})
+        return result
+
+
+class JobFleet(object):
+    """
+    Waits for the jobs of many job handles, possibly on hundreds of iDRACs and OpenManage Enterprise
+    appliances, from one process. Every job keeps its own adaptive poll interval as in JobPoller, due
+    polls run on a bounded thread pool and at most one request per job is in flight at any time.
+    All the jobs of an appliance are polled through one client, which is closed when the fleet is over.
+    Unreachable hosts are retried until the deadline, since appliances often restart while a job runs.
+    """
+
+    def __init__(self, handles, credentials, timeout, max_interval, workers=FLEET_WORKERS):
+        self.handles = handles
+        self.credentials = credentials
+        self.timeout = timeout
+        self.max_interval = max_interval
+        self.workers = max(workers, 1)
+        self._start = None
+        self._slept = 0
+
+    @property
+    def elapsed(self):
+        if self._start is None:
+            return 0
+        return max(time.monotonic() - self._start, self._slept)
+
+    def _sleep(self, seconds):
+        if seconds > 0:
+            self._slept = self.elapsed + seconds
+            time.sleep(seconds)
+
+    def wait(self):
+        """
+        Polls all jobs until every one is over or the timeout expires.
+        :returns: one result per handle in the order of the handles, with the handle, the status
+            C(completed), C(failed), C(timeout) or C(error), the last job document and the poll counts
+        """
+        self._start = time.monotonic()
+        self._slept = 0
+        jobs = [_TrackedJob(handle, self.timeout, self.max_interval) for handle in self.handles]
+        finished = {}
+        idle, in_flight = list(jobs), {}
+        if jobs:
+            clients = _FleetClients(self.credentials)
+            try:
+                with bounded_executor(min(self.workers, len(jobs))) as executor:
+                    while idle or in_flight:
+                        now = self.elapsed
+                        if now >= self.timeout:
+                            idle = []
+                        for job in [job for job in idle if job.due <= now]:
+                            idle.remove(job)
+                            in_flight[executor.submit(clients.fetch, job.handle)] = job
+                        next_due = min([job.due for job in idle] + [self.timeout])
+                        if in_flight:
+                            done = wait(list(in_flight), timeout=None if not idle else max(next_due - now, 0),
+                                        return_when=FIRST_COMPLETED)[0]
+                            for future in done:
+                                job = in_flight.pop(future)
+                                if job.update(future, self.elapsed):
+                                    finished[id(job)] = self.elapsed
+                                else:
+                                    idle.append(job)
+                        elif idle:
+                            self._sleep(next_due - now)
+            finally:
+                clients.close()
+        return [job.result(finished.get(id(job), self.elapsed)) for job in jobs]
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 9.8.0
+# Copyright (C) 2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import time
+
+POLL_INITIAL_INTERVAL = 1
+POLL_BACKOFF_FACTOR = 2
+
+
+class JobPoller(object):
+    """
+    Polls a job until it reaches a terminal state or the timeout expires. The first polls follow each
+    other closely and the interval then doubles up to max_interval, so that short jobs return within
+    seconds while long jobs are not polled more often than before. The deadline is measured with a
+    monotonic clock. When events of the job are given, every poll after the first waits for the next
+    event instead of sleeping, and polling resumes once no event arrived within the grace window.
+    """
+
+    def __init__(self, timeout, max_interval, initial_interval=POLL_INITIAL_INTERVAL, first_delay=None,
+                 factor=POLL_BACKOFF_FACTOR, max_errors=0, tolerated=Exception, events=None):
+        self.timeout = timeout
+        self.max_interval = max(max_interval, 0)
+        self.initial_interval = max(min(initial_interval, self.max_interval), 0)
+        self.first_delay = self.initial_interval if first_delay is None else first_delay
+        self.factor = factor
+        self.max_errors = max_errors
+        self.tolerated = tolerated
+        self.events = events
+        self.polls = 0
+        self.errors = 0
+        self.event_wakeups = 0
+        self._start = None
+        self._slept = 0
+
+    @property
+    def elapsed(self):
+        """Seconds spent polling, which include the requested sleeps even when time.sleep does not block"""
+        if self._start is None:
+            return 0
+        return max(time.monotonic() - self._start, self._slept)
+
+    def intervals(self):
+        """Yields the delay before every poll"""
+        yield self.first_delay
+        interval = self.initial_interval
+        while True:
+            yield interval
+            interval = min(max(interval * self.factor, POLL_INITIAL_INTERVAL), self.max_interval)
+
+    def _sleep(self, seconds):
+        if seconds > 0:
+            time.sleep(seconds)
+            self._slept += seconds
+
+    def _wait(self, interval, remaining):
+        if self.events is not None and self.polls:
+            if self.events.wait(min(self.events.grace, remaining)):
+                self.event_wakeups += 1
+            else:
+                self.events = None
+            return
+        self._sleep(min(interval, remaining))
+
+    def poll(self, fetch, is_terminal):
+        """
+        Calls fetch until is_terminal accepts its result.
+        :param fetch: callable returning the job state, usually the job response
+        :param is_terminal: callable telling whether the job reached a terminal state
+        :returns: tuple of the last result, or None when none was fetched, and whether it is terminal
+        :raises: the error of fetch once it failed more than max_errors times, which None leaves unlimited,
+            or at once when it is not one of the tolerated errors
+        """
+        self._start = time.monotonic()
+        self._slept = 0
+        result, errors = None, 0
+        for interval in self.intervals():
+            remaining = self.timeout - self.elapsed
+            if remaining <= 0:
+                break
+            self._wait(interval, remaining)
+            try:
+                result = fetch()
+            except self.tolerated:
+                errors += 1
+                self.errors += 1
+                if self.max_errors is not None and errors > self.max_errors:
+                    raise
+                continue
+            self.polls += 1
+            if is_terminal(result):
+                return result, True
+        return result, False
@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 9.8.0
+# Copyright (C) 2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+from collections import namedtuple
+from ansible_collections.dellemc.openmanage.plugins.module_utils.instrumentation import record_job
+from ansible_collections.dellemc.openmanage.plugins.module_utils.job_poller import JobPoller
+
+OME_JOB_STATUS_NAMES = {
+    2020: "Scheduled", 2030: "Queued", 2040: "Starting", 2050: "Running", 2060: "Completed",
+    2070: "Failed", 2090: "Warning", 2080: "New", 2100: "Aborted", 2101: "Paused", 2102: "Stopped",
+    2103: "Canceled"
+}
+
+JobOutcome = namedtuple("JobOutcome", ["job", "state", "done", "failed"])
+
+
+class JobStateMap(object):
+    """
+    Tells where a job document keeps its state and which states end the job. A job is over once
+    its state is complete or failed and not running. Without complete and failed states every state
+    outside running_states ends the job, and the terminal and failed callables replace the state tables
+    altogether.
+    """
+
+    def __init__(self, name, state_path, complete_states=(), failed_states=(), running_states=(),
+                 default=None, terminal=None, failed=None):
+        self.name = name
+        self.state_path = tuple(state_path)
+        self.complete_states = tuple(complete_states)
+        self.failed_states = tuple(failed_states)
+        self.running_states = tuple(running_states)
+        self.default = default
+        self.terminal = terminal
+        self.failed = failed
+
+    def state(self, job):
+        """Returns the state found at state_path of the job or the default"""
+        for key in self.state_path:
+            if not isinstance(job, dict) or key not in job:
+                return self.default
+            job = job[key]
+        return job
+
+    def is_terminal(self, job):
+        if self.terminal is not None:
+            return self.terminal(job)
+        state = self.state(job)
+        if state in self.running_states:
+            return False
+        if self.complete_states or self.failed_states:
+            return state in self.complete_states or state in self.failed_states
+        return True
+
+    def is_failed(self, job):
+        if self.failed is not None:
+            return self.failed(job)
+        return self.state(job) in self.failed_states
+
+
+OME_JOB_STATES = JobStateMap(
+    "ome", ("LastRunStatus", "Id"), complete_states=(2060, 2020, 2090), failed_states=(2070, 2101, 2102, 2103))
+OME_JOB_INFO_STATES = JobStateMap(
+    "ome_info", ("LastRunStatus", "Id"), complete_states=(2060, 2020),
+    failed_states=(2070, 2090, 2100, 2101, 2102, 2103))
+OME_JOB_PROGRESS_STATES = JobStateMap(
+    "ome_progress", ("LastRunStatus", "Id"), running_states=(2050, 2030, 2040, 2080))
+IDRAC_COMPLETE_STATES = ("Completed", "Downloaded", "CompletedWithErrors", "RebootCompleted")
+IDRAC_FAILED_STATES = ("Failed", "RebootFailed", "Unknown")
+IDRAC_RUNNING_STATES = ("Running", "RebootPending", "Scheduling", "Scheduled", "Downloading", "Waiting", "Paused",
+                        "New", "PendingActivation", "ReadyForExecution")
+IDRAC_JOB_STATES = JobStateMap(
+    "idrac", ("JobState",), complete_states=IDRAC_COMPLETE_STATES, failed_states=IDRAC_FAILED_STATES,
+    running_states=IDRAC_RUNNING_STATES, default="Unknown")
+IDRAC_JOB_STAGED_STATES = JobStateMap(
+    "idrac_staged", ("JobState",), complete_states=IDRAC_COMPLETE_STATES + ("Scheduled",),
+    failed_states=IDRAC_FAILED_STATES,
+    running_states=tuple(state for state in IDRAC_RUNNING_STATES if state != "Scheduled"), default="Unknown")
+REDFISH_TASK_STATES = JobStateMap(
+    "redfish_task", ("TaskState",), complete_states=("Completed",),
+    failed_states=("Exception", "Killed", "Cancelled"),
+    running_states=("New", "Starting", "Running", "Suspended", "Interrupted", "Pending", "Stopping", "Service",
+                    "Cancelling"))
+REDFISH_JOB_PROGRESS_STATES = JobStateMap(
+    "redfish_progress", ("PercentComplete",), complete_states=(100,))
+IDRAC_JOB_PROGRESS_STATES = JobStateMap(
+    "idrac_progress", ("JobState",), failed_states=("RebootFailed",),
+    terminal=lambda job: job.get("PercentComplete") == 100 or job.get("JobState") == "RebootFailed")
+REDFISH_JOB_STATES = JobStateMap(
+    "redfish_job", ("JobState",),
+    terminal=lambda job: job.get("PercentComplete") == 100 and job.get("JobState") == "Completed",
+    failed=lambda job: job.get("JobStatus") != "OK")
+
+STATE_MAPS = dict((state_map.name, state_map) for state_map in (
+    OME_JOB_STATES, OME_JOB_INFO_STATES, OME_JOB_PROGRESS_STATES, IDRAC_JOB_STATES, IDRAC_JOB_STAGED_STATES,
+    REDFISH_TASK_STATES, REDFISH_JOB_PROGRESS_STATES, IDRAC_JOB_PROGRESS_STATES, REDFISH_JOB_STATES))
+
+
+def json_document(resp):
+    """Returns the job document of a response for JobStateEngine"""
+    return resp.json_data
+
+
+class JobStateEngine(object):
+    """
+    Waits for one job with JobPoller and interprets its state with a JobStateMap, so OME jobs, iDRAC
+    jobs and Redfish tasks share backoff, deadline and unresponsive host handling. The timing of every
+    job is recorded for the instrumentation summary.
+    """
+
+    def __init__(self, state_map, timeout, max_interval, first_delay=None, max_errors=0, tolerated=Exception,
+                 events=None, document=None):
+        self.state_map = state_map
+        self.document = document or (lambda result: result)
+        self.poller = JobPoller(timeout, max_interval, first_delay=first_delay, max_errors=max_errors,
+                                tolerated=tolerated, events=events)
+        self.metrics = {}
+        self.last_document = None
+
+    def wait(self, fetch, job_id=None):
+        """
+        Calls fetch until the job is over or the timeout expires. fetch returns the job document, or a
+        response from which the document callable of the engine extracts it. The document of the last
+        successful fetch is kept in last_document, also when the poller gives up.
+        :returns: JobOutcome of the last fetch result, the job state, whether the job is over and whether it failed
+        :raises: the error of fetch once the poller gave up on it
+        """
+        def fetch_document():
+            result = fetch()
+            self.last_document = self.document(result)
+            return result
+
+        outcome, state = "error", None
+        try:
+            result, done = self.poller.poll(fetch_document, lambda res: self.state_map.is_terminal(self.document(res)))
+            if result is not None:
+                state = self.state_map.state(self.document(result))
+            failed = done and self.state_map.is_failed(self.document(result))
+            outcome = ("failed" if failed else "completed") if done else "timeout"
+            return JobOutcome(result, state, done, failed)
+        finally:
+            self.metrics = {"job": job_id, "state_map": self.state_map.name, "outcome": outcome, "state": state,
+                            "polls": self.poller.polls, "errors": self.poller.errors,
+                            "event_wakeups": self.poller.event_wakeups, "elapsed": round(self.poller.elapsed, 3)}
+            record_job(self.metrics)
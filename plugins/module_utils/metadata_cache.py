@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 9.8.0
+# Copyright (C) 2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible_collections.dellemc.openmanage.plugins.module_utils.transport import PooledResponse, get_env_int
+
+CACHE_DIR_ENV = "OMAM_METADATA_CACHE_DIR"
+CACHE_TTL_ENV = "OMAM_METADATA_CACHE_TTL"
+CACHE_MAX_SIZE_ENV = "OMAM_METADATA_CACHE_MAX_SIZE"
+CACHE_VERSION_TTL_ENV = "OMAM_METADATA_CACHE_VERSION_TTL"
+DEFAULT_TTL = 86400
+DEFAULT_VERSION_TTL = 300
+DEFAULT_MAX_SIZE = 64
+ENTRY_SUFFIX = ".json"
+
+
+class MetadataCache(object):
+    """
+    Controller side cache of near static appliance metadata. Every entry is a file holding the
+    response body and its ETag, keyed by appliance, endpoint and firmware version. Entries are
+    served without a request until they are older than the TTL, then revalidated with
+    If-None-Match. The firmware version of the keys is cached the same way with the shorter
+    version TTL, so that an update is noticed soon without a request on every run.
+    The least recently used entries are removed once the size cap is exceeded.
+    """
+
+    def __init__(self, directory, ttl=DEFAULT_TTL, max_size=DEFAULT_MAX_SIZE * 1024 * 1024,
+                 version_ttl=DEFAULT_VERSION_TTL):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_size = max_size
+        self.version_ttl = version_ttl
+
+    @classmethod
+    def from_env(cls):
+        """Returns the cache configured in OMAM_METADATA_CACHE_DIR or None when caching is disabled"""
+        directory = os.environ.get(CACHE_DIR_ENV)
+        if not directory:
+            return None
+        return cls(os.path.expanduser(directory), ttl=get_env_int(CACHE_TTL_ENV, DEFAULT_TTL),
+                   max_size=get_env_int(CACHE_MAX_SIZE_ENV, DEFAULT_MAX_SIZE) * 1024 * 1024,
+                   version_ttl=get_env_int(CACHE_VERSION_TTL_ENV, DEFAULT_VERSION_TTL))
+
+    def _path(self, key):
+        digest = hashlib.sha256(json.dumps(key, sort_keys=True).encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, digest + ENTRY_SUFFIX)
+
+    def get(self, key):
+        """Returns the stored entry of the key, fresh or not, or None"""
+        path = self._path(key)
+        try:
+            with open(path) as entry_file:
+                entry = json.load(entry_file)
+            os.utime(path, None)
+        except (IOError, OSError, ValueError):
+            return None
+        if entry.get("key") != key:
+            return None
+        return entry
+
+    def is_fresh(self, entry, ttl=None):
+        return time.time() - entry.get("stored", 0) < (self.ttl if ttl is None else ttl)
+
+    def put(self, key, body, etag=None):
+        """Stores the body and ETag of the key, then enforces the size cap"""
+        if isinstance(body, bytes):
+            body = body.decode("utf-8", "surrogateescape")
+        self._write(key, {"key": key, "etag": etag, "stored": time.time(), "body": body})
+        self._evict()
+
+    def touch(self, key, entry):
+        """Marks a revalidated entry as fresh again"""
+        entry["stored"] = time.time()
+        self._write(key, entry)
+
+    def _write(self, key, entry):
+        try:
+            if not os.path.isdir(self.directory):
+                os.makedirs(self.directory, 0o700)
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w") as entry_file:
+                json.dump(entry, entry_file)
+            os.replace(tmp_path, self._path(key))
+        except (IOError, OSError):
+            pass
+
+    def _evict(self):
+        """Removes expired entries without an ETag and then the least recently used ones above the size cap"""
+        entries, total = [], 0
+        now = time.time()
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return
+        for name in names:
+            if not name.endswith(ENTRY_SUFFIX):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+        for mtime, size, path in sorted(entries):
+            if total <= self.max_size and now - mtime < self.ttl:
+                continue
+            if total <= self.max_size and self._has_etag(path):
+                continue
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                pass
+
+    @staticmethod
+    def _has_etag(path):
+        try:
+            with open(path) as entry_file:
+                return bool(json.load(entry_file).get("etag"))
+        except (IOError, OSError, ValueError):
+            return False
+
+
+def cached_response(entry):
+    """Builds an open_url like response of a cached entry"""
+    headers = {"Content-Type": "application/json", "ETag": entry.get("etag") or ""}
+    return PooledResponse(None, 200, "OK", headers, entry["body"].encode("utf-8", "surrogateescape"))
+
+
+def invoke_cached(cache, key, send, response_class, ttl=None):
+    """
+    Returns the response of a GET request through the cache.
+    :param cache: MetadataCache object
+    :param key: list which identifies the appliance, endpoint and firmware version
+    :param send: callable which sends the request with the given extra headers
+    :param response_class: response wrapper class of the client, like OpenURLResponse
+    :param ttl: (optional) seconds for which the entry is served without a request instead of the cache TTL
+    :return: response_class object
+    """
+    entry = cache.get(key)
+    if entry is not None and cache.is_fresh(entry, ttl):
+        return response_class(cached_response(entry))
+    headers = {"If-None-Match": entry["etag"]} if entry and entry.get("etag") else None
+    try:
+        resp = send(headers)
+    except HTTPError as err:
+        if err.code != 304 or entry is None:
+            raise
+        cache.touch(key, entry)
+        return response_class(cached_response(entry))
+    if resp.success:
+        cache.put(key, resp.body, resp.resp.headers.get("ETag"))
+    return resp
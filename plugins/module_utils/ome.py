@@ -31,14 +31,25 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 import json
-import os
-import time
-from ansible.module_utils.urls import open_url, ConnectionError, SSLValidationError
+import threading
+from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.common.parameters import env_fallback
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.six.moves.urllib.parse import urlencode
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import config_ipv6
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import strip_substr_dict
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import invoke_select_request, select_fields
+from ansible_collections.dellemc.openmanage.plugins.module_utils.transport import HTTPSConnectionPool, \
+    get_env_int, get_pool_size, open_url
+from ansible_collections.dellemc.openmanage.plugins.module_utils.rest_transport import OpenURLResponse, \
+    OpenURLBackend, RestTransport, get_omam_ca_env
+from ansible_collections.dellemc.openmanage.plugins.module_utils.concurrency import map_bounded
+from ansible_collections.dellemc.openmanage.plugins.module_utils.metadata_cache import MetadataCache, invoke_cached
+from ansible_collections.dellemc.openmanage.plugins.module_utils.session_cache import SessionCache
+from ansible_collections.dellemc.openmanage.plugins.module_utils.instrumentation import InstrumentedModuleMixin
+from ansible_collections.dellemc.openmanage.plugins.module_utils.job_poller import JobPoller
+from ansible_collections.dellemc.openmanage.plugins.module_utils.job_state import JobStateEngine, \
+    OME_JOB_INFO_STATES, OME_JOB_PROGRESS_STATES, OME_JOB_STATUS_NAMES
 from ansible.module_utils.basic import AnsibleModule
 
 ome_auth_params = {
@@ -60,41 +71,19 @@ JOB_URI = "JobService/Jobs({job_id})"
 JOB_SERVICE_URI = "JobService/Jobs"
 HOST_UNRESOLVED_MSG = "Unable to resolve hostname or IP {0}."
 JOB_EXEC_HISTORY = "JobService/Jobs({job_id})/ExecutionHistories"
-
-
-class OpenURLResponse(object):
-    """Handles HTTPResponse"""
-
-    def __init__(self, resp):
-        self.body = None
-        self.resp = resp
-        if self.resp:
-            self.body = self.resp.read()
-
-    @property
-    def json_data(self):
-        try:
-            return json.loads(self.body)
-        except ValueError:
-            raise ValueError("Unable to parse json")
-
-    @property
-    def status_code(self):
-        return self.resp.getcode()
-
-    @property
-    def success(self):
-        return self.status_code in (200, 201, 202, 204)
-
-    @property
-    def token_header(self):
-        return self.resp.headers.get('X-Auth-Token')
+APPLICATION_INFO_URI = "ApplicationService/Info"
+PAGE_WORKERS_ENV = "OMAM_PAGE_WORKERS"
+DEVICE_URI = "DeviceService/Devices"
+DEVICE_FILTER_THRESHOLD_ENV = "OMAM_DEVICE_FILTER_THRESHOLD"
+DEVICE_FILTER_THRESHOLD = 20
+DEVICE_FILTER_BATCH = 10
+DEVICE_IDENTITY_FIELDS = ["Id", "DeviceServiceTag"]
 
 
 class RestOME(object):
     """Handles OME API requests"""
 
-    def __init__(self, module_params=None, req_session=False):
+    def __init__(self, module_params=None, req_session=False, pool_size=None, page_workers=None):
         self.module_params = module_params
         self.hostname = str(self.module_params["hostname"]).strip('][')
         self.username = self.module_params["username"]
@@ -109,6 +98,18 @@ class RestOME(object):
         self.protocol = 'https'
         self._headers = {'Content-Type': 'application/json', 'Accept': 'application/json'}
         self.hostname = config_ipv6(self.hostname)
+        self.pool_size = get_pool_size() if pool_size is None else pool_size
+        self._pool = None
+        self.page_workers = get_env_int(PAGE_WORKERS_ENV, 1) if page_workers is None else page_workers
+        self.select_supported = None
+        self.device_resolutions = []
+        self.requests_sent = 0
+        self._requests_lock = threading.Lock()
+        self.metadata_cache = MetadataCache.from_env()
+        self.firmware_version = None
+        self.session_cache = SessionCache.from_env()
+        self.cached_session = False
+        self.transport = RestTransport(self, "RestOME", self.hostname, response_class=OpenURLResponse)
 
     def _get_base_url(self):
         """builds base url"""
@@ -128,43 +129,38 @@ class RestOME(object):
 
     def _url_common_args_spec(self, method, api_timeout, headers=None):
         """Creates an argument common spec"""
-        req_header = self._headers
-        if headers:
-            req_header.update(headers)
-        if api_timeout is None:
-            api_timeout = self.timeout
-        if self.ca_path is None:
-            self.ca_path = self._get_omam_ca_env()
-        url_kwargs = {
-            "method": method,
-            "validate_certs": self.validate_certs,
-            "ca_path": self.ca_path,
-            "use_proxy": True,
-            "headers": req_header,
-            "timeout": api_timeout,
-            "follow_redirects": 'all',
-        }
-        return url_kwargs
+        return self.transport.common_args(method, api_timeout, headers=headers)
 
     def _args_without_session(self, method, api_timeout, headers=None):
         """Creates an argument spec in case of basic authentication"""
-        req_header = self._headers
-        if headers:
-            req_header.update(headers)
-        url_kwargs = self._url_common_args_spec(method, api_timeout, headers=headers)
-        url_kwargs["url_username"] = self.username
-        url_kwargs["url_password"] = self.password
-        url_kwargs["force_basic_auth"] = True
-        return url_kwargs
+        return self.transport.args_without_session(method, api_timeout, headers=headers)
 
     def _args_with_session(self, method, api_timeout, headers=None):
         """Creates an argument spec, in case of authentication with session"""
-        url_kwargs = self._url_common_args_spec(method, api_timeout, headers=headers)
-        url_kwargs["force_basic_auth"] = False
-        return url_kwargs
+        return self.transport.args_with_session(method, api_timeout, headers=headers)
+
+    def _send_conditional(self, path, query_param, headers):
+        return self.invoke_request('GET', path, query_param=query_param, headers=headers)
+
+    def _get_firmware_version(self):
+        """Returns the appliance version of the metadata cache keys, cached with the version TTL and
+        revalidated with its ETag afterwards, so that the keys follow upgrades"""
+        if self.firmware_version is None:
+            key = [self.hostname, self.port, APPLICATION_INFO_URI]
+            resp = invoke_cached(self.metadata_cache, key,
+                                 lambda headers: self._send_conditional(APPLICATION_INFO_URI, None, headers),
+                                 OpenURLResponse, ttl=self.metadata_cache.version_ttl)
+            self.firmware_version = resp.json_data.get("Version")
+        return self.firmware_version
+
+    def _invoke_cached_request(self, path, query_param=None):
+        key = [self.hostname, self.port, self._build_url(path, query_param=query_param)[len(self._get_base_url()):],
+               self._get_firmware_version()]
+        return invoke_cached(self.metadata_cache, key,
+                             lambda headers: self._send_conditional(path, query_param, headers), OpenURLResponse)
 
     def invoke_request(self, method, path, data=None, query_param=None, headers=None,
-                       api_timeout=None, dump=True):
+                       api_timeout=None, dump=True, cache=False):
         """
         Sends a request through open_url
         Returns :class:`OpenURLResponse` object.
@@ -177,8 +173,12 @@ class RestOME(object):
         :arg api_timeout: (optional) How long to wait for the server to send
             data before giving up
         :arg dump: (Optional) boolean value for dumping payload data.
+        :arg cache: (Optional) serves a GET of near static metadata from the metadata cache
+            when OMAM_METADATA_CACHE_DIR is set.
         :returns: OpenURLResponse
         """
+        if cache and method == 'GET' and self.metadata_cache is not None:
+            return self._invoke_cached_request(path, query_param=query_param)
         try:
             if 'X-Auth-Token' in self._headers:
                 url_kwargs = self._args_with_session(method, api_timeout, headers=headers)
@@ -187,53 +187,114 @@ class RestOME(object):
             if data and dump:
                 data = json.dumps(data)
             url = self._build_url(path, query_param=query_param)
-            resp = open_url(url, data=data, **url_kwargs)
-            resp_data = OpenURLResponse(resp)
+            with self._requests_lock:
+                self.requests_sent += 1
+            backend = self._pool if self._pool is not None else OpenURLBackend(open_url)
+            resp_data = self.transport.send(method, url, data, url_kwargs, backend=backend)
         except (HTTPError, URLError, SSLValidationError, ConnectionError) as err:
             raise err
         return resp_data
 
+    def _close_pool(self):
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+
+    def _login(self):
+        """Creates a session and returns its ID and token"""
+        payload = {'UserName': self.username,
+                   'Password': self.password,
+                   'SessionType': 'API', }
+        path = SESSION_RESOURCE_COLLECTION["SESSION"]
+        resp = self.invoke_request('POST', path, data=payload)
+        if resp and resp.success:
+            return resp.json_data.get("Id"), resp.token_header
+        msg = "Could not create the session"
+        raise ConnectionError(msg)
+
+    def _validate_session(self, session_id, token):
+        """Tells whether the appliance still accepts a cached session, any failed request tells that it does not"""
+        self._headers["X-Auth-Token"] = token
+        try:
+            self.invoke_request('GET', SESSION_RESOURCE_COLLECTION["SESSION_ID"].format(Id=session_id))
+        except (URLError, HTTPError, SSLValidationError, ConnectionError):
+            self._headers.pop("X-Auth-Token", None)
+            return False
+        return True
+
+    def _logout(self, session_id, token):
+        """Deletes a cached session which is not reused, ignoring the failures as it may have expired already"""
+        self._headers["X-Auth-Token"] = token
+        try:
+            self.invoke_request('DELETE', SESSION_RESOURCE_COLLECTION["SESSION_ID"].format(Id=session_id))
+        except (URLError, HTTPError, SSLValidationError, ConnectionError):
+            pass
+        finally:
+            self._headers.pop("X-Auth-Token", None)
+
     def __enter__(self):
         """Creates sessions by passing it to header"""
+        if self.pool_size:
+            self._pool = HTTPSConnectionPool(self._get_base_url(), maxsize=self.pool_size)
         if self.req_session and not self.x_auth_token:
-            payload = {'UserName': self.username,
-                       'Password': self.password,
-                       'SessionType': 'API', }
-            path = SESSION_RESOURCE_COLLECTION["SESSION"]
-            resp = self.invoke_request('POST', path, data=payload)
-            if resp and resp.success:
-                self.session_id = resp.json_data.get("Id")
-                self._headers["X-Auth-Token"] = resp.token_header
-            else:
-                msg = "Could not create the session"
-                raise ConnectionError(msg)
+            try:
+                if self.session_cache is not None:
+                    self.session_id, token = self.session_cache.session(
+                        ["ome", self.hostname, self.port, self.username], self.password, self._login,
+                        self._validate_session, self._logout)
+                    self.cached_session = True
+                else:
+                    self.session_id, token = self._login()
+            except Exception:
+                self._close_pool()
+                raise
+            self._headers["X-Auth-Token"] = token
         elif self.x_auth_token is not None:
             self._headers["X-Auth-Token"] = self.x_auth_token
         return self
 
     def __exit__(self, exc_type, exc_value, traceback):
-        """Deletes a session id, which is in use for request"""
-        if self.session_id:
-            path = SESSION_RESOURCE_COLLECTION["SESSION_ID"].format(Id=self.session_id)
-            self.invoke_request('DELETE', path)
+        """Deletes a session id, which is in use for request, unless the session cache keeps it"""
+        try:
+            if self.session_id and not self.cached_session:
+                path = SESSION_RESOURCE_COLLECTION["SESSION_ID"].format(Id=self.session_id)
+                self.invoke_request('DELETE', path)
+        finally:
+            self._close_pool()
         return False
 
-    def get_all_report_details(self, uri):
+    def _get_report_page(self, uri, page_size, skip, select=None):
+        """Fetches one $top/$skip page of the report"""
+        return invoke_select_request(self, uri, query_param={"$top": page_size, "$skip": skip}, select=select)
+
+    def _get_remaining_pages(self, uri, page_size, total_count, workers, select=None):
+        """Fetches the $top/$skip pages after the first one in parallel and returns them in page order"""
+        return map_bounded(lambda skip: self._get_report_page(uri, page_size, skip, select),
+                           range(page_size, total_count, page_size), workers)
+
+    def get_all_report_details(self, uri, page_workers=None, select=None):
         """
         This implementation mainly dependent on '@odata.count' value.
         Currently first request without query string, always returns total number of available
         reports in '@odata.count'.
+        When more than one page worker is configured, the remaining pages are requested in parallel
+        by at most that many threads and reassembled in order.
+        When select is provided, only those top level fields of each report are requested and returned.
         """
         try:
-            resp = self.invoke_request('GET', uri)
+            resp = invoke_select_request(self, uri, select=select)
             data = resp.json_data
             report_list = data["value"]
             total_count = data['@odata.count']
             remaining_count = total_count - len(report_list)
             first_page_count = len(report_list)
+            workers = self.page_workers if page_workers is None else page_workers
+            if workers > 1 and 0 < first_page_count < remaining_count:
+                for resp in self._get_remaining_pages(uri, first_page_count, total_count, workers, select):
+                    report_list.extend(resp.json_data["value"])
+                return {"resp_obj": resp, "report_list": report_list}
             while remaining_count > 0:
-                resp = self.invoke_request('GET', uri,
-                                           query_param={"$top": first_page_count, "$skip": len(report_list)})
+                resp = self._get_report_page(uri, first_page_count, len(report_list), select)
                 data = resp.json_data
                 value = data["value"]
                 report_list.extend(value)
@@ -245,7 +306,7 @@ class RestOME(object):
     def get_job_type_id(self, jobtype_name):
         """This provides an ID of the job type."""
         job_type_id = None
-        resp = self.invoke_request('GET', "JobService/JobTypes")
+        resp = self.invoke_request('GET', "JobService/JobTypes", cache=True)
         data = resp.json_data["value"]
         for each in data:
             if each["Name"] == jobtype_name:
@@ -271,25 +332,102 @@ class RestOME(object):
             device_id = device_info["Id"]
         return {"Id": device_id, "value": device_info}
 
-    def get_all_items_with_pagination(self, uri, query_param=None):
+    def _filter_devices(self, clauses, select=None):
+        """Looks up devices with '$filter' queries of at most DEVICE_FILTER_BATCH 'or' clauses each"""
+        devices = []
+        for start in range(0, len(clauses), DEVICE_FILTER_BATCH):
+            query_param = {"$filter": " or ".join(clauses[start:start + DEVICE_FILTER_BATCH])}
+            devices.extend(self.iter_items_with_pagination(DEVICE_URI, query_param=query_param, select=select))
+        return devices
+
+    def resolve_devices(self, device_ids=None, service_tags=None, select=None):
+        """
+        Resolves device ids and service tags to the device details.
+        Up to OMAM_DEVICE_FILTER_THRESHOLD identifiers are looked up with batched '$filter' queries,
+        more identifiers or an appliance which rejects the filter fall back to one fetch of all the
+        devices indexed by id and service tag. The strategy of every call is recorded in
+        ``device_resolutions``.
+        :param device_ids: list of device ids
+        :param service_tags: list of device service tags
+        :param select: list of the top level fields to request for each device
+        :return: dict
+        Id: dict: device details of every resolved device id
+        DeviceServiceTag: dict: device details of every resolved service tag
+        """
+        device_ids = [int(each) for each in device_ids or []]
+        service_tags = [str(each) for each in service_tags or []]
+        if select:
+            select = list(select) + [key for key in ("Id", "DeviceServiceTag") if key not in select]
+        clauses = ["Id eq {0}".format(each) for each in device_ids]
+        clauses.extend("DeviceServiceTag eq '{0}'".format(each.replace("'", "''")) for each in service_tags)
+        stats = {"strategy": "filter", "identifiers": len(clauses)}
+        requests_sent, devices = self.requests_sent, None
+        if clauses and len(clauses) <= get_env_int(DEVICE_FILTER_THRESHOLD_ENV, DEVICE_FILTER_THRESHOLD):
+            try:
+                devices = self._filter_devices(clauses, select=select)
+            except HTTPError as err:
+                if err.code != 400:
+                    raise
+                stats["filter_rejected"] = True
+        if clauses and devices is None:
+            stats["strategy"] = "index"
+            devices = self.get_all_report_details(DEVICE_URI, select=select)["report_list"]
+        stats["requests"] = self.requests_sent - requests_sent
+        id_index = dict((device["Id"], device) for device in devices or [])
+        tag_index = dict((device["DeviceServiceTag"], device) for device in devices or [])
+        resolved = {"Id": dict((each, id_index[each]) for each in device_ids if each in id_index),
+                    "DeviceServiceTag": dict((each, tag_index[each]) for each in service_tags if each in tag_index)}
+        stats["resolved"] = len(resolved["Id"]) + len(resolved["DeviceServiceTag"])
+        self.device_resolutions.append(stats)
+        return resolved
+
+    def iter_pages_with_pagination(self, uri, query_param=None, select=None):
+        """
+        Yields the json data of every page of a pagination supported GET uri, following
+        '@odata.nextLink', so that only one page is held in memory at a time.
+        :param uri: uri which supports pagination
+        :param query_param: query parameters of the first page
+        :param select: list of the top level fields to request for each item
+        :return: generator of dict.
+        """
+        data = invoke_select_request(self, uri, query_param=query_param, select=select).json_data
+        next_link = data.get('@odata.nextLink', '')
+        yield data
+        while next_link:
+            next_path = next_link.split('/api')[-1]
+            if select and self.select_supported and "select=" not in next_path:
+                next_path += "{0}$select={1}".format("&" if "?" in next_path else "?", ",".join(select))
+            data = select_fields(self.invoke_request('GET', next_path), select).json_data
+            next_link = data.get('@odata.nextLink', '')
+            yield data
+
+    def iter_items_with_pagination(self, uri, query_param=None, select=None):
+        """
+        Yields the items of a pagination supported GET uri page by page.
+        :param uri: uri which supports pagination
+        :param query_param: query parameters of the first page
+        :param select: list of the top level fields to request for each item
+        :return: generator of items.
+        """
+        for data in self.iter_pages_with_pagination(uri, query_param=query_param, select=select):
+            for item in data.get("value", []):
+                yield item
+
+    def get_all_items_with_pagination(self, uri, query_param=None, select=None):
         """
          This implementation mainly to get all available items from ome for pagination
          supported GET uri
         :param uri: uri which supports pagination
+        :param select: list of the top level fields to request for each item
         :return: dict.
         """
         try:
-            resp = self.invoke_request('GET', uri, query_param=query_param)
-            data = resp.json_data
+            pages = self.iter_pages_with_pagination(uri, query_param=query_param, select=select)
+            data = next(pages)
             total_items = data.get("value", [])
             total_count = data.get('@odata.count', 0)
-            next_link = data.get('@odata.nextLink', '')
-            while next_link:
-                resp = self.invoke_request('GET', next_link.split('/api')[-1])
-                data = resp.json_data
-                value = data["value"]
-                next_link = data.get('@odata.nextLink', '')
-                total_items.extend(value)
+            for data in pages:
+                total_items.extend(data["value"])
             return {"total_count": total_count, "value": total_items}
         except (URLError, HTTPError, SSLValidationError, ConnectionError, TypeError, ValueError) as err:
             raise err
@@ -301,34 +439,23 @@ class RestOME(object):
         :return: dict, first item dict gives device type map
         """
         device_map = {}
-        response = self.invoke_request("GET", "DeviceService/DeviceType")
+        response = self.invoke_request("GET", "DeviceService/DeviceType", cache=True)
         if response.json_data.get("value"):
             device_map = dict([(item["DeviceType"], item["Name"]) for item in response.json_data["value"]])
         return device_map
 
+    def _get_job_info(self, job_dict):
+        status = OME_JOB_INFO_STATES.state(job_dict)
+        if status in OME_JOB_INFO_STATES.complete_states:
+            return True, False, "Job {0} successfully.".format(OME_JOB_STATUS_NAMES[status])
+        if status in OME_JOB_INFO_STATES.failed_states:
+            return True, True, "Job is in {0} state, and is not completed.".format(OME_JOB_STATUS_NAMES[status])
+        return False, False, None
+
     def get_job_info(self, job_id):
         try:
-            job_status_map = {
-                2020: "Scheduled", 2030: "Queued", 2040: "Starting", 2050: "Running", 2060: "Completed",
-                2070: "Failed", 2090: "Warning", 2080: "New", 2100: "Aborted", 2101: "Paused", 2102: "Stopped",
-                2103: "Canceled"
-            }
-            failed_job_status = [2070, 2090, 2100, 2101, 2102, 2103]
-            job_url = JOB_URI.format(job_id=job_id)
-            job_resp = self.invoke_request('GET', job_url)
-            job_dict = job_resp.json_data
-            job_status = job_dict['LastRunStatus']['Id']
-            if job_status in [2060, 2020]:
-                job_failed = False
-                message = "Job {0} successfully.".format(job_status_map[job_status])
-                exit_poll = True
-                return exit_poll, job_failed, message
-            elif job_status in failed_job_status:
-                exit_poll = True
-                job_failed = True
-                message = "Job is in {0} state, and is not completed.".format(job_status_map[job_status])
-                return exit_poll, job_failed, message
-            return False, False, None
+            job_resp = self.invoke_request('GET', JOB_URI.format(job_id=job_id))
+            return self._get_job_info(job_resp.json_data)
         except HTTPError:
             job_failed = True
             message = "Unable to track the job status of {0}.".format(job_id)
@@ -339,20 +466,17 @@ class RestOME(object):
         """
         job_id: job id
         job_wait_sec: Maximum time to wait to fetch the final job details in seconds
-        sleep_time: Maximum time to sleep in seconds in each job details fetch
+        sleep_time: Maximum time to sleep in seconds between two job details fetches
         """
-        max_sleep_time = job_wait_sec
-        sleep_interval = sleep_time
-        while max_sleep_time:
-            if max_sleep_time > sleep_interval:
-                max_sleep_time = max_sleep_time - sleep_interval
-            else:
-                sleep_interval = max_sleep_time
-                max_sleep_time = 0
-            time.sleep(sleep_interval)
-            exit_poll, job_failed, job_message = self.get_job_info(job_id)
-            if exit_poll is True:
-                return job_failed, job_message
+        engine = JobStateEngine(OME_JOB_INFO_STATES, job_wait_sec, sleep_time)
+        try:
+            outcome = engine.wait(lambda: self.invoke_request('GET', JOB_URI.format(job_id=job_id)).json_data,
+                                  job_id=job_id)
+        except HTTPError:
+            return True, "Unable to track the job status of {0}.".format(job_id)
+        if outcome.done:
+            exit_poll, job_failed, job_message = self._get_job_info(outcome.job)
+            return job_failed, job_message
         return True, "The job is not complete after {0} seconds.".format(job_wait_sec)
 
     def strip_substr_dict(self, odata_dict, chkstr='@odata.'):
@@ -406,7 +530,7 @@ class RestOME(object):
 
     def _get_omam_ca_env(self):
         """Check if the value is set in REQUESTS_CA_BUNDLE or CURL_CA_BUNDLE or OMAM_CA_BUNDLE or returns None"""
-        return os.environ.get("REQUESTS_CA_BUNDLE") or os.environ.get("CURL_CA_BUNDLE") or os.environ.get("OMAM_CA_BUNDLE")
+        return get_omam_ca_env()
 
     def get_job_execution_details(self, job_id):
         try:
@@ -427,7 +551,58 @@ class RestOME(object):
         return job_detail_status
 
 
-class OmeAnsibleModule(AnsibleModule):
+class JobBatchTracker(object):
+    """
+    Tracks several OME jobs with one JobService request per poll. The jobs still running are
+    selected with $filter=Id eq a or Id eq b, and finished jobs are left out of the next query.
+    """
+
+    def __init__(self, rest_obj, job_ids, state_map=OME_JOB_PROGRESS_STATES):
+        self.rest_obj = rest_obj
+        self.state_map = state_map
+        self.pending = set(job_ids)
+        self.jobs = {}
+        self.transitions = []
+
+    def _filter(self):
+        return " or ".join("Id eq {0}".format(job_id) for job_id in sorted(self.pending))
+
+    def status(self, job_id):
+        """Returns the LastRunStatus Id last seen for the job or None"""
+        return self.state_map.state(self.jobs.get(job_id, {}))
+
+    def refresh(self):
+        """Fetches the pending jobs once, records their state changes and returns the jobs still pending"""
+        if not self.pending:
+            return self.pending
+        resp = self.rest_obj.invoke_request("GET", JOB_SERVICE_URI, query_param={"$filter": self._filter()})
+        for job in resp.json_data.get("value", []):
+            job_id = job.get("Id")
+            if job_id not in self.pending:
+                continue
+            previous = self.status(job_id)
+            self.jobs[job_id] = job
+            current = self.status(job_id)
+            if current != previous:
+                self.transitions.append({"Id": job_id, "From": previous, "To": current})
+            if self.state_map.is_terminal(job):
+                self.pending.discard(job_id)
+        return self.pending
+
+    def wait(self, job_wait_sec=600, sleep_time=10, max_errors=0, initial_wait=None):
+        """
+        Polls until every job finished or job_wait_sec expires.
+        :arg initial_wait: seconds before the first poll, by default the initial poll interval
+        :returns: True when no job is pending any more
+        :raises HTTPError: once more than max_errors polls failed
+        """
+        if self.pending:
+            JobPoller(job_wait_sec, sleep_time, first_delay=initial_wait,
+                      max_errors=max_errors).poll(self.refresh, lambda pending: not pending)
+        return not self.pending
+
+
+class OmeAnsibleModule(InstrumentedModuleMixin, AnsibleModule):
     def __init__(self, argument_spec, bypass_checks=False, no_log=False,
                  mutually_exclusive=None, required_together=None,
                  required_one_of=None, add_file_common_args=False,
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 9.8.0
+# Copyright (C) 2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import hashlib
+import json
+import os
+import time
+from contextlib import contextmanager
+from ansible.module_utils.six.moves.urllib.error import URLError
+from ansible_collections.dellemc.openmanage.plugins.module_utils.transport import get_env_int
+
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+RATE_LIMIT_DIR_ENV = "OMAM_RATE_LIMIT_DIR"
+MAX_CONCURRENT_ENV = "OMAM_MAX_CONCURRENT_REQUESTS"
+MAX_RATE_ENV = "OMAM_MAX_REQUESTS_PER_SECOND"
+SLOT_TIMEOUT_ENV = "OMAM_REQUEST_SLOT_TIMEOUT"
+DEFAULT_RATE_LIMIT_DIR = "~/.ansible/tmp/omam_rate_limit"
+DEFAULT_SLOT_TIMEOUT = 300
+SLOT_POLL_INTERVAL = 0.05
+SLOT_SUFFIX = ".slot{0}"
+BUCKET_SUFFIX = ".bucket"
+
+
+class _NullLimiter(object):
+    """Limiter used when no limit is configured, which sends every request at once"""
+
+    def call(self, func, *args, **kwargs):
+        return func(*args, **kwargs)
+
+
+NULL_LIMITER = _NullLimiter()
+
+
+class ApplianceLimiter(object):
+    """
+    Limits the requests sent to one appliance by all the processes of the controller, so that many
+    Ansible forks do not overwhelm a shared OME. The limits are kept in lock files named by a digest
+    of the hostname. A request first takes a token from a bucket refilled at the given rate, whose
+    state is shared in a file, and then holds one of max_concurrent slot files with an exclusive lock
+    until its response arrives. The locks are released by the system when a process dies, a request
+    which finds no free slot within slot_timeout seconds fails with a URLError.
+    """
+
+    def __init__(self, directory, host, max_concurrent=0, rate=0, slot_timeout=DEFAULT_SLOT_TIMEOUT):
+        self.directory = directory
+        self.host = host
+        self.max_concurrent = max_concurrent
+        self.rate = rate
+        self.slot_timeout = slot_timeout
+
+    @classmethod
+    def from_env(cls, host):
+        """
+        Returns the limiter of the host configured in OMAM_MAX_CONCURRENT_REQUESTS, OMAM_MAX_REQUESTS_PER_SECOND
+        and OMAM_REQUEST_SLOT_TIMEOUT, or NULL_LIMITER when no limit is set or file locks are not supported
+        """
+        max_concurrent = get_env_int(MAX_CONCURRENT_ENV, 0)
+        rate = get_env_int(MAX_RATE_ENV, 0)
+        if not HAS_FCNTL or (max_concurrent <= 0 and rate <= 0):
+            return NULL_LIMITER
+        directory = os.path.expanduser(os.environ.get(RATE_LIMIT_DIR_ENV) or DEFAULT_RATE_LIMIT_DIR)
+        return cls(directory, host, max_concurrent=max(max_concurrent, 0), rate=max(rate, 0),
+                   slot_timeout=max(get_env_int(SLOT_TIMEOUT_ENV, DEFAULT_SLOT_TIMEOUT), 0))
+
+    def _path(self, suffix):
+        digest = hashlib.sha256(str(self.host).lower().encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, digest + suffix)
+
+    def _open(self, suffix):
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory, 0o700)
+        return os.fdopen(os.open(self._path(suffix), os.O_RDWR | os.O_CREAT, 0o600), "r+")
+
+    def reserve(self):
+        """Takes a token from the bucket of the host and returns the seconds to wait before using it"""
+        try:
+            bucket = self._open(BUCKET_SUFFIX)
+        except (IOError, OSError):
+            return 0
+        with bucket:
+            fcntl.flock(bucket, fcntl.LOCK_EX)
+            try:
+                try:
+                    state = json.loads(bucket.read())
+                except ValueError:
+                    state = {}
+                now = time.time()
+                burst = max(self.rate, 1)
+                tokens = state.get("tokens", burst) + (now - state.get("updated", now)) * self.rate
+                tokens = min(tokens, burst) - 1
+                bucket.seek(0)
+                bucket.truncate()
+                json.dump({"tokens": tokens, "updated": now}, bucket)
+                bucket.flush()
+            finally:
+                fcntl.flock(bucket, fcntl.LOCK_UN)
+        return max(-tokens / float(self.rate), 0)
+
+    def _lock_free_slot(self):
+        """Returns the file of a free slot locked for this process, or None when all the slots are taken"""
+        for index in range(self.max_concurrent):
+            slot_file = self._open(SLOT_SUFFIX.format(index))
+            try:
+                fcntl.flock(slot_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                slot_file.close()
+                continue
+            return slot_file
+        return None
+
+    @contextmanager
+    def slot(self):
+        """Holds one of the concurrent request slots of the host, waiting at most slot_timeout seconds for a free one"""
+        slot_file = None
+        deadline = time.monotonic() + self.slot_timeout
+        while self.max_concurrent:
+            try:
+                slot_file = self._lock_free_slot()
+            except (IOError, OSError):
+                break
+            if slot_file is not None:
+                break
+            if time.monotonic() >= deadline:
+                raise URLError("Timed out waiting for a free request slot to {0}.".format(self.host))
+            time.sleep(SLOT_POLL_INTERVAL)
+        if slot_file is None:
+            yield
+            return
+        with slot_file:
+            try:
+                yield
+            finally:
+                fcntl.flock(slot_file, fcntl.LOCK_UN)
+
+    def call(self, func, *args, **kwargs):
+        """Calls func within the limits of the host and returns its result"""
+        if self.rate:
+            wait = self.reserve()
+            if wait:
+                time.sleep(wait)
+        with self.slot():
+            return func(*args, **kwargs)
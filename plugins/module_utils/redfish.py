@@ -30,12 +30,15 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 import json
-import os
-from ansible.module_utils.urls import open_url, ConnectionError, SSLValidationError
+from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.six.moves.urllib.parse import urlencode
 from ansible.module_utils.common.parameters import env_fallback
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import config_ipv6
+from ansible_collections.dellemc.openmanage.plugins.module_utils.transport import open_url
+from ansible_collections.dellemc.openmanage.plugins.module_utils.rest_transport import OpenURLResponse, \
+    OpenURLBackend, RestTransport, get_omam_ca_env
+from ansible_collections.dellemc.openmanage.plugins.module_utils.instrumentation import InstrumentedModuleMixin
 from ansible.module_utils.basic import AnsibleModule
 
 redfish_auth_params = {
@@ -55,40 +58,6 @@ SESSION_RESOURCE_COLLECTION = {
 HOST_UNRESOLVED_MSG = "Unable to resolve hostname or IP {0}."
 
 
-class OpenURLResponse(object):
-    """Handles HTTPResponse"""
-
-    def __init__(self, resp):
-        self.body = None
-        self.resp = resp
-        if self.resp:
-            self.body = self.resp.read()
-
-    @property
-    def json_data(self):
-        try:
-            return json.loads(self.body)
-        except ValueError:
-            raise ValueError("Unable to parse json")
-
-    @property
-    def status_code(self):
-        return self.resp.getcode()
-
-    @property
-    def success(self):
-        status = self.status_code
-        return status >= 200 & status <= 299
-
-    @property
-    def headers(self):
-        return self.resp.headers
-
-    @property
-    def reason(self):
-        return self.resp.reason
-
-
 class Redfish(object):
     """Handles iDRAC Redfish API requests"""
 
@@ -108,6 +77,7 @@ class Redfish(object):
         self.root_uri = '/redfish/v1/'
         self._headers = {'Content-Type': 'application/json', 'Accept': 'application/json'}
         self.hostname = config_ipv6(self.hostname)
+        self.transport = RestTransport(self, "Redfish", self.hostname, response_class=OpenURLResponse)
 
     def _get_base_url(self):
         """builds base url"""
@@ -125,41 +95,16 @@ class Redfish(object):
 
     def _url_common_args_spec(self, method, api_timeout, headers=None):
         """Creates an argument common spec"""
-        req_header = self._headers
-        if headers:
-            req_header.update(headers)
-        if api_timeout is None:
-            api_timeout = self.timeout
-        if self.ca_path is None:
-            self.ca_path = self._get_omam_ca_env()
-        url_kwargs = {
-            "method": method,
-            "validate_certs": self.validate_certs,
-            "ca_path": self.ca_path,
-            "use_proxy": self.use_proxy,
-            "headers": req_header,
-            "timeout": api_timeout,
-            "follow_redirects": 'all',
-        }
-        return url_kwargs
+        return self.transport.common_args(method, api_timeout, headers=headers)
 
     def _args_without_session(self, path, method, api_timeout, headers=None):
-        """Creates an argument spec in case of basic authentication"""
-        req_header = self._headers
-        if headers:
-            req_header.update(headers)
-        url_kwargs = self._url_common_args_spec(method, api_timeout, headers=headers)
-        if not (path == SESSION_RESOURCE_COLLECTION["SESSION"] and method == 'POST'):
-            url_kwargs["url_username"] = self.username
-            url_kwargs["url_password"] = self.password
-            url_kwargs["force_basic_auth"] = True
-        return url_kwargs
+        """Creates an argument spec in case of basic authentication, except for the session login"""
+        login = path == SESSION_RESOURCE_COLLECTION["SESSION"] and method == 'POST'
+        return self.transport.args_without_session(method, api_timeout, headers=headers, basic_auth=not login)
 
     def _args_with_session(self, method, api_timeout, headers=None):
         """Creates an argument spec, in case of authentication with session"""
-        url_kwargs = self._url_common_args_spec(method, api_timeout, headers=headers)
-        url_kwargs["force_basic_auth"] = False
-        return url_kwargs
+        return self.transport.args_with_session(method, api_timeout, headers=headers)
 
     def invoke_request(self, method, path, data=None, query_param=None, headers=None,
                        api_timeout=None, dump=True):
@@ -185,8 +130,7 @@ class Redfish(object):
             if data and dump:
                 data = json.dumps(data)
             url = self._build_url(path, query_param=query_param)
-            resp = open_url(url, data=data, **url_kwargs)
-            resp_data = OpenURLResponse(resp)
+            resp_data = self.transport.send(method, url, data, url_kwargs, backend=OpenURLBackend(open_url))
         except (HTTPError, URLError, SSLValidationError, ConnectionError) as err:
             raise err
         return resp_data
@@ -225,10 +169,10 @@ class Redfish(object):
 
     def _get_omam_ca_env(self):
         """Check if the value is set in REQUESTS_CA_BUNDLE or CURL_CA_BUNDLE or OMAM_CA_BUNDLE or returns None"""
-        return os.environ.get("REQUESTS_CA_BUNDLE") or os.environ.get("CURL_CA_BUNDLE") or os.environ.get("OMAM_CA_BUNDLE")
+        return get_omam_ca_env()
 
 
-class RedfishAnsibleModule(AnsibleModule):
+class RedfishAnsibleModule(InstrumentedModuleMixin, AnsibleModule):
     def __init__(self, argument_spec, bypass_checks=False, no_log=False,
                  mutually_exclusive=None, required_together=None,
                  required_one_of=None, add_file_common_args=False,
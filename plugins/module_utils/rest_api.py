@@ -31,58 +31,11 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 import json
-import os
-from ansible.module_utils.urls import open_url
 from ansible.module_utils.six.moves.urllib.parse import urlencode
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import config_ipv6
-
-
-class OpenURLResponse(object):
-    """Handles HTTPResponse"""
-
-    def __init__(self, response):
-        """
-        Initializes a new instance of the class.
-
-        Args:
-            response (object): The response object to read the body from.
-
-        Returns:
-            None
-        """
-        self.body = None
-        self.resp = response
-        if self.resp:
-            self.body = self.resp.read()
-
-    @property
-    def json_data(self):
-        """
-        Returns the JSON data parsed from the `body` attribute of the object.
-
-        Returns:
-            dict: The parsed JSON data.
-
-        Raises:
-            ValueError: If the `body` attribute cannot be parsed as JSON.
-        """
-        try:
-            return json.loads(self.body)
-        except ValueError:
-            raise ValueError("Unable to parse json")
-
-    @property
-    def status_code(self):
-        return self.resp.getcode()
-
-    @property
-    def success(self):
-        status = self.status_code
-        return status >= 200 & status <= 299
-
-    @property
-    def token_header(self):
-        return self.resp.headers.get('X-Auth-Token')
+from ansible_collections.dellemc.openmanage.plugins.module_utils.transport import open_url
+from ansible_collections.dellemc.openmanage.plugins.module_utils.rest_transport import OpenURLResponse, \
+    OpenURLBackend, RestTransport, get_omam_ca_env, JSON_HEADERS
 
 
 class RestAPI:
@@ -100,6 +53,8 @@ class RestAPI:
         self.protocol = protocol
         self.root_uri = root_uri
         self._headers = basic_headers or {}
+        self.transport = RestTransport(self, "RestAPI", self.hostname, response_class=OpenURLResponse,
+                                       base_headers=JSON_HEADERS)
 
     def __build_url(self, path, query_param=None):
         url = '{0}://{1}:{2}'.format(self.protocol, self.hostname, self.port)
@@ -111,37 +66,19 @@ class RestAPI:
 
     def _get_omam_ca_env(self):
         """Check if the value is set in REQUESTS_CA_BUNDLE or CURL_CA_BUNDLE or OMAM_CA_BUNDLE or returns None"""
-        return os.environ.get("REQUESTS_CA_BUNDLE") or os.environ.get("CURL_CA_BUNDLE") or os.environ.get("OMAM_CA_BUNDLE")
+        return get_omam_ca_env()
 
     def _url_common_args_spec(self, method, api_timeout=None, headers=None):
         """Creates an argument common spec"""
-        base_headers = {'Content-Type': 'application/json', 'Accept': 'application/json'}
-        self._headers.update(base_headers)
-        if isinstance(headers, dict):
-            self._headers.update(headers)
-        return {
-            "method": method,
-            "validate_certs": self.validate_certs,
-            "ca_path": self.ca_path or self._get_omam_ca_env(),
-            "use_proxy": True,
-            "headers": self._headers,
-            "timeout": api_timeout or self.timeout,
-            "follow_redirects": 'all',
-        }
+        return self.transport.common_args(method, api_timeout, headers=headers)
 
     def _args_without_session(self, method, api_timeout, headers=None):
         """Creates an argument spec in case of basic authentication"""
-        url_kwargs = self._url_common_args_spec(method, api_timeout, headers=headers)
-        url_kwargs["url_username"] = self.username
-        url_kwargs["url_password"] = self.password
-        url_kwargs["force_basic_auth"] = True
-        return url_kwargs
+        return self.transport.args_without_session(method, api_timeout, headers=headers)
 
     def _args_with_session(self, method, api_timeout, headers=None):
         """Creates an argument spec, in case of authentication with session"""
-        url_kwargs = self._url_common_args_spec(method, api_timeout, headers=headers)
-        url_kwargs["force_basic_auth"] = False
-        return url_kwargs
+        return self.transport.args_with_session(method, api_timeout, headers=headers)
 
     def _base_invoke_request(self, method, path, data=None, query_param=None, headers=None,
                              api_timeout=None, dump=True, auth_token_header='X-Auth-Token'):
@@ -167,9 +104,7 @@ class RestAPI:
             data = json.dumps(data)
         path = self.root_uri + path
         url = self.__build_url(path, query_param=query_param)
-        resp = open_url(url, data=data, **url_kwargs)
-        resp_data = OpenURLResponse(resp)
-        return resp_data
+        return self.transport.send(method, url, data, url_kwargs, backend=OpenURLBackend(open_url))
 
     def __enter__(self):
         return self
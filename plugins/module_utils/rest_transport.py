@@ -0,0 +1,229 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 9.8.0
+# Copyright (C) 2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import json
+import os
+import threading
+from abc import ABC, abstractmethod
+from functools import partial
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible_collections.dellemc.openmanage.plugins.module_utils.transport import open_url, decode_content, HTTPSConnectionPool
+from ansible_collections.dellemc.openmanage.plugins.module_utils.instrumentation import request_span
+from ansible_collections.dellemc.openmanage.plugins.module_utils.retry_policy import RetryPolicy
+from ansible_collections.dellemc.openmanage.plugins.module_utils.rate_limit import ApplianceLimiter
+
+CA_BUNDLE_ENVS = ("REQUESTS_CA_BUNDLE", "CURL_CA_BUNDLE", "OMAM_CA_BUNDLE")
+JSON_HEADERS = {'Content-Type': 'application/json', 'Accept': 'application/json'}
+
+
+def get_omam_ca_env():
+    """Check if the value is set in REQUESTS_CA_BUNDLE or CURL_CA_BUNDLE or OMAM_CA_BUNDLE or returns None"""
+    for name in CA_BUNDLE_ENVS:
+        if os.environ.get(name):
+            return os.environ.get(name)
+    return None
+
+
+class OpenURLResponse(object):
+    """Handles HTTPResponse"""
+
+    def __init__(self, resp):
+        self.body = None
+        self.resp = resp
+        self._json_body = None
+        self._json_data = None
+        if self.resp:
+            self.body = decode_content(self.resp.read(), getattr(self.resp, "headers", None))
+
+    @property
+    def json_data(self):
+        """Parses the body once and returns the cached result until the body changes"""
+        if self._json_body is None or self._json_body is not self.body:
+            try:
+                self._json_data = json.loads(self.body)
+            except ValueError:
+                raise ValueError("Unable to parse json")
+            self._json_body = self.body
+        return self._json_data
+
+    @property
+    def status_code(self):
+        return self.resp.getcode()
+
+    @property
+    def success(self):
+        return 200 <= self.status_code <= 299
+
+    @property
+    def headers(self):
+        return self.resp.headers
+
+    @property
+    def reason(self):
+        return self.resp.reason
+
+    @property
+    def token_header(self):
+        return self.resp.headers.get('X-Auth-Token')
+
+
+class TransportBackend(ABC):
+    """
+    Interface of the backends which send the requests of a RestTransport. A backend takes the
+    arguments of open_url and returns a response with read, getcode and headers, or raises the
+    errors of open_url. HTTPSConnectionPool of the transport module is a pooled backend.
+    """
+
+    @abstractmethod
+    def open(self, url, data=None, **url_kwargs):
+        """Sends a request and returns its response"""
+
+    def close(self):
+        pass
+
+
+TransportBackend.register(HTTPSConnectionPool)
+
+
+class OpenURLBackend(TransportBackend):
+    """Sends every request on a connection of its own through open_url"""
+
+    def __init__(self, opener=None):
+        self.opener = opener
+
+    def open(self, url, data=None, **url_kwargs):
+        return (self.opener or open_url)(url, data=data, **url_kwargs)
+
+
+class RecordingBackend(TransportBackend):
+    """Sends the requests through another backend and records their method, URL, payload and status"""
+
+    def __init__(self, backend=None):
+        self.backend = backend or OpenURLBackend()
+        self.records = []
+        self._lock = threading.Lock()
+
+    def _record(self, url, data, url_kwargs, status):
+        with self._lock:
+            self.records.append({"method": url_kwargs.get("method") or "GET", "url": url, "data": data,
+                                 "status": status})
+
+    def open(self, url, data=None, **url_kwargs):
+        try:
+            resp = self.backend.open(url, data=data, **url_kwargs)
+        except HTTPError as err:
+            self._record(url, data, url_kwargs, err.code)
+            raise
+        self._record(url, data, url_kwargs, resp.getcode())
+        return resp
+
+    def close(self):
+        self.backend.close()
+
+
+class RestTransport(object):
+    """
+    Transport core shared by the REST clients. It builds the open_url arguments of a request from
+    the settings of its client, and sends the request through a backend within the instrumentation,
+    retry policy and per appliance limits. The settings are read from the client on every request,
+    so that changes of its headers, timeout or certificates apply at once. Every request gets its own
+    copy of the client headers updated with the base headers, when given, and the headers of the
+    request, so that the concurrent requests of a client do not change the headers of each other.
+    A backend set on the transport replaces the backend of the client for every request.
+    """
+
+    def __init__(self, client, name, host, response_class=OpenURLResponse, backend=None, base_headers=None):
+        self.client = client
+        self.name = name
+        self.response_class = response_class
+        self.backend = backend
+        self.base_headers = base_headers
+        self.retry_policy = RetryPolicy.from_env()
+        self.limiter = ApplianceLimiter.from_env(host)
+
+    def common_args(self, method, api_timeout=None, headers=None, url_kwargs=None):
+        """Creates the open_url arguments common to all the requests of the client"""
+        client = self.client
+        req_headers = dict(client._headers)
+        if self.base_headers:
+            req_headers.update(self.base_headers)
+        if isinstance(headers, dict):
+            req_headers.update(headers)
+        if client.ca_path is None:
+            client.ca_path = get_omam_ca_env()
+        args = {
+            "method": method,
+            "validate_certs": client.validate_certs,
+            "ca_path": client.ca_path,
+            "use_proxy": getattr(client, "use_proxy", True),
+            "headers": req_headers,
+            "timeout": client.timeout if api_timeout is None else api_timeout,
+            "follow_redirects": 'all',
+        }
+        if url_kwargs:
+            args.update(url_kwargs)
+        return args
+
+    def args_without_session(self, method, api_timeout=None, headers=None, basic_auth=True):
+        """Creates the open_url arguments of a request authenticated with the username and password"""
+        args = self.common_args(method, api_timeout, headers=headers)
+        if basic_auth:
+            args["url_username"] = self.client.username
+            args["url_password"] = self.client.password
+            args["force_basic_auth"] = True
+        return args
+
+    def args_with_session(self, method, api_timeout=None, headers=None):
+        """Creates the open_url arguments of a request authenticated with the session token in the headers"""
+        args = self.common_args(method, api_timeout, headers=headers)
+        args["force_basic_auth"] = False
+        return args
+
+    def send(self, method, url, data=None, url_kwargs=None, backend=None, retry_policy=None):
+        """
+        Sends a request and returns the response wrapped in the response class of the transport.
+        :param method: HTTP method of the request
+        :param url: URL of the request
+        :param data: encoded payload of the request
+        :param url_kwargs: open_url arguments of the request
+        :param backend: backend of the client, used unless the transport has one
+        :param retry_policy: retry policy of this request instead of the one of the transport
+        """
+        backend = self.backend or backend or OpenURLBackend()
+        with request_span(self.name, method, url, data) as span:
+            send = partial(self.limiter.call, self._open, backend, url, data, url_kwargs or {})
+            resp_data = (retry_policy or self.retry_policy).call(method, send, span)
+            span.set_response(resp_data)
+        return resp_data
+
+    def _open(self, backend, url, data, url_kwargs):
+        """Sends the request and reads the whole response, so that the limiter slot is held until the body arrived"""
+        return self.response_class(backend.open(url, data=data, **url_kwargs))
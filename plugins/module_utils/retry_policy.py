@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 9.8.0
+# Copyright (C) 2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import os
+import random
+import socket
+import time
+from email.utils import parsedate_to_datetime
+from ansible.module_utils.six.moves import http_client
+from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
+from ansible.module_utils.urls import ConnectionError, SSLValidationError
+from ansible_collections.dellemc.openmanage.plugins.module_utils.instrumentation import NULL_SPAN
+from ansible_collections.dellemc.openmanage.plugins.module_utils.transport import get_env_int
+
+RETRY_ATTEMPTS_ENV = "OMAM_RETRY_ATTEMPTS"
+RETRY_STATUS_CODES_ENV = "OMAM_RETRY_STATUS_CODES"
+RETRY_METHODS_ENV = "OMAM_RETRY_METHODS"
+RETRY_BACKOFF_ENV = "OMAM_RETRY_BACKOFF"
+RETRY_MAX_BACKOFF_ENV = "OMAM_RETRY_MAX_BACKOFF"
+RETRY_STATUS_CODES = (429, 502, 503, 504)
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+RETRY_ATTEMPTS = 2
+RETRY_BACKOFF = 1
+RETRY_MAX_BACKOFF = 30
+CONNECTION_ERRORS = (URLError, ConnectionError, http_client.RemoteDisconnected, ConnectionResetError,
+                     ConnectionAbortedError, BrokenPipeError, socket.timeout)
+
+
+def _env_list(name, default):
+    value = os.environ.get(name)
+    if not value:
+        return default
+    return tuple(item.strip() for item in value.split(",") if item.strip())
+
+
+def retry_after(err):
+    """Returns the seconds asked for in the Retry-After header of an HTTP error, or None"""
+    headers = getattr(err, "headers", None)
+    value = headers.get("Retry-After") if headers is not None else None
+    if not value:
+        return None
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0)
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+
+
+class RetryPolicy(object):
+    """
+    Decides whether a failed request is sent again and how long to wait before. Only the given
+    methods are retried, which are the idempotent ones by default, on the given errors, which are
+    the connection errors by default, and on the given HTTP status codes. A certificate error is never
+    retried. The wait is an exponential backoff with full jitter, or the time asked for in Retry-After,
+    both capped at max_backoff. Every retry is counted on the request span.
+    """
+
+    def __init__(self, attempts=0, status_codes=RETRY_STATUS_CODES, methods=IDEMPOTENT_METHODS,
+                 backoff=RETRY_BACKOFF, max_backoff=RETRY_MAX_BACKOFF, errors=CONNECTION_ERRORS):
+        self.attempts = attempts
+        self.status_codes = tuple(status_codes)
+        self.methods = tuple(method.upper() for method in methods)
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.errors = errors
+
+    @classmethod
+    def from_env(cls):
+        """
+        Returns the policy configured in the OMAM_RETRY variables. By default the safe methods are
+        retried twice, so that a busy or restarting appliance does not fail a task on one read, while
+        the requests which change the appliance are sent once unless OMAM_RETRY_METHODS adds them.
+        """
+        try:
+            status_codes = tuple(int(code) for code in _env_list(RETRY_STATUS_CODES_ENV, RETRY_STATUS_CODES))
+        except ValueError:
+            status_codes = RETRY_STATUS_CODES
+        return cls(attempts=get_env_int(RETRY_ATTEMPTS_ENV, RETRY_ATTEMPTS), status_codes=status_codes,
+                   methods=_env_list(RETRY_METHODS_ENV, SAFE_METHODS),
+                   backoff=get_env_int(RETRY_BACKOFF_ENV, RETRY_BACKOFF),
+                   max_backoff=get_env_int(RETRY_MAX_BACKOFF_ENV, RETRY_MAX_BACKOFF))
+
+    def is_retryable(self, method, err):
+        if (method or "GET").upper() not in self.methods:
+            return False
+        if isinstance(err, HTTPError):
+            return err.code in self.status_codes
+        return isinstance(err, self.errors) and not isinstance(err, SSLValidationError)
+
+    def delay(self, attempt, err=None):
+        """Returns the seconds to wait before the retry following the given zero based attempt"""
+        requested = retry_after(err) if isinstance(err, HTTPError) else None
+        if requested is not None:
+            return min(requested, self.max_backoff)
+        return random.uniform(0, min(self.max_backoff, self.backoff * (2 ** attempt)))
+
+    def call(self, method, send, span=NULL_SPAN):
+        """
+        Calls send until it returns, the error is not retryable or the attempts are used up.
+        :param method: HTTP method of the request
+        :param send: callable sending the request and returning the response
+        :param span: request span which counts the retries
+        :returns: the response of send
+        """
+        attempt = 0
+        while True:
+            try:
+                return send()
+            except Exception as err:
+                if attempt >= self.attempts or not self.is_retryable(method, err):
+                    raise
+                if isinstance(err, HTTPError):
+                    err.close()
+                time.sleep(self.delay(attempt, err))
+                attempt += 1
+                span.add_retry()
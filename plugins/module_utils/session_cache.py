@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 9.8.0
+# Copyright (C) 2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import base64
+import hashlib
+import json
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from ansible_collections.dellemc.openmanage.plugins.module_utils.transport import get_env_int
+
+try:
+    from cryptography.fernet import Fernet, InvalidToken
+    HAS_CRYPTOGRAPHY = True
+except ImportError:
+    HAS_CRYPTOGRAPHY = False
+
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+SESSION_CACHE_DIR_ENV = "OMAM_SESSION_CACHE_DIR"
+SESSION_CACHE_TTL_ENV = "OMAM_SESSION_CACHE_TTL"
+DEFAULT_SESSION_TTL = 1200
+KDF_ITERATIONS = 100000
+ENTRY_SUFFIX = ".session"
+LOCK_SUFFIX = ".lock"
+
+
+class SessionCache(object):
+    """
+    Controller side cache of OME and iDRAC session tokens, so that the tasks of a play reuse one
+    session per host and user instead of creating and deleting a session each. Every entry is a file
+    named by a digest of the host, port and user. The token is encrypted with a key derived from the
+    password, so reading it requires the same credentials as creating a new session. An entry is
+    reused after a successful validation request while it was used within the TTL, and replaced by a
+    new session otherwise. Cached sessions are not deleted at the end of a task; the appliance ends
+    them after its idle timeout, which should be longer than the TTL.
+    """
+
+    def __init__(self, directory, ttl=DEFAULT_SESSION_TTL):
+        self.directory = directory
+        self.ttl = ttl
+
+    @classmethod
+    def from_env(cls):
+        """
+        Returns the cache configured in OMAM_SESSION_CACHE_DIR, or None when caching is disabled or
+        the cryptography library is not installed
+        """
+        directory = os.environ.get(SESSION_CACHE_DIR_ENV)
+        if not directory or not HAS_CRYPTOGRAPHY:
+            return None
+        return cls(os.path.expanduser(directory), ttl=get_env_int(SESSION_CACHE_TTL_ENV, DEFAULT_SESSION_TTL))
+
+    def _path(self, key, suffix=ENTRY_SUFFIX):
+        digest = hashlib.sha256(json.dumps(key, sort_keys=True).encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, digest + suffix)
+
+    @staticmethod
+    def _fernet(key, secret, salt):
+        material = hashlib.pbkdf2_hmac("sha256", secret.encode("utf-8"),
+                                       salt + json.dumps(key, sort_keys=True).encode("utf-8"), KDF_ITERATIONS)
+        return Fernet(base64.urlsafe_b64encode(material))
+
+    @contextmanager
+    def lock(self, key):
+        """Serializes the session lookup of one host and user across processes"""
+        lock_file = None
+        if HAS_FCNTL:
+            try:
+                self._makedirs()
+                lock_file = open(self._path(key, LOCK_SUFFIX), "a")
+            except (IOError, OSError):
+                lock_file = None
+        if lock_file is None:
+            yield
+            return
+        with lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def load(self, key, secret):
+        """Returns the cached session of the key, a dict with session_id, token and used, or None"""
+        try:
+            with open(self._path(key)) as entry_file:
+                entry = json.load(entry_file)
+            session = json.loads(self._fernet(key, secret, base64.b64decode(entry["salt"])).decrypt(
+                entry["token"].encode("ascii")).decode("utf-8"))
+        except (IOError, OSError, ValueError, KeyError, TypeError, InvalidToken):
+            return None
+        if session.get("key") != key:
+            return None
+        session["used"] = entry.get("used", 0)
+        return session
+
+    def is_fresh(self, session):
+        return time.time() - session.get("used", 0) < self.ttl
+
+    def store(self, key, secret, session_id, token):
+        """Encrypts and stores a session of the key"""
+        salt = os.urandom(16)
+        payload = json.dumps({"key": key, "session_id": session_id, "token": token}).encode("utf-8")
+        self._write(key, {"salt": base64.b64encode(salt).decode("ascii"), "used": time.time(),
+                          "token": self._fernet(key, secret, salt).encrypt(payload).decode("ascii")})
+
+    def touch(self, key):
+        """Marks the session of the key as used now, which the appliance does as well"""
+        try:
+            with open(self._path(key)) as entry_file:
+                entry = json.load(entry_file)
+        except (IOError, OSError, ValueError):
+            return
+        entry["used"] = time.time()
+        self._write(key, entry)
+
+    def remove(self, key):
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def _makedirs(self):
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory, 0o700)
+
+    def _write(self, key, entry):
+        try:
+            self._makedirs()
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w") as entry_file:
+                json.dump(entry, entry_file)
+            os.replace(tmp_path, self._path(key))
+        except (IOError, OSError):
+            pass
+
+    @staticmethod
+    def _accepted(validate, cached):
+        """Tells whether a cached session is still accepted, a validation which fails in any way makes it stale"""
+        try:
+            return validate(cached["session_id"], cached["token"])
+        except Exception:
+            return False
+
+    def session(self, key, secret, login, validate, logout=None):
+        """
+        Returns a reusable session of the key, or a new one from login, which is then cached.
+        :param login: callable creating a session and returning its ID and token
+        :param validate: callable telling whether a cached session ID and token are still accepted
+        :param logout: (optional) callable deleting a cached session ID with its token on a best effort basis,
+            called for a session which is not reused because it was idle for longer than the TTL or was not
+            accepted by the validation
+        :returns: tuple of the session ID and token
+        """
+        with self.lock(key):
+            cached = self.load(key, secret)
+            if cached is not None:
+                if self.is_fresh(cached) and self._accepted(validate, cached):
+                    self.touch(key)
+                    return cached["session_id"], cached["token"]
+                if logout is not None:
+                    logout(cached["session_id"], cached["token"])
+            self.remove(key)
+            session_id, token = login()
+            self.store(key, secret, session_id, token)
+            return session_id, token
@@ -30,94 +30,16 @@ from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
 import json
-import os
-from ansible.module_utils.urls import open_url
 from ansible.module_utils.six.moves.urllib.parse import urlencode
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import config_ipv6
-from ansible.module_utils.urls import open_url
+from ansible_collections.dellemc.openmanage.plugins.module_utils.transport import open_url
+from ansible_collections.dellemc.openmanage.plugins.module_utils.rest_transport import OpenURLResponse, \
+    OpenURLBackend, RestTransport, get_omam_ca_env
 from abc import ABC, abstractmethod
 
 HEADER_TYPE = "application/json"
 
 
-class OpenURLResponse():
-    """
-    HTTP response handler class.
-    """
-    def __init__(self, resp):
-        """
-        Initializes a new instance of the class.
-
-        Args:
-            resp (Response): The response object to read the body from.
-
-        Initializes the following instance variables:
-            - body (bytes): The body of the response, or None if the response is None.
-            - resp (Response): The response object.
-
-        If the response is not None, the body is set to the content of the response.
-        """
-        self.body = None
-        self.resp = resp
-        if self.resp:
-            self.body = self.resp.read()
-
-    @property
-    def json_data(self):
-        """
-        Returns the JSON data parsed from the `body` attribute of the object.
-
-        :return: The parsed JSON data.
-        :raises ValueError: If the `body` attribute cannot be parsed as JSON.
-        """
-        try:
-            return json.loads(self.body)
-        except ValueError as exc:
-            raise ValueError("Unable to parse json") from exc
-
-    @property
-    def status_code(self):
-        """
-        Get the status code of the response.
-
-        Returns:
-            int: The status code of the response.
-        """
-        return self.resp.getcode()
-
-    @property
-    def success(self):
-        """
-        Returns a boolean indicating whether the status code of the response is within the range
-          of 200-299.
-
-        :return: True if the status code is within the range of 200-299, False otherwise.
-        :rtype: bool
-        """
-        status = self.status_code
-        return status >= 200 & status <= 299
-
-    @property
-    def headers(self):
-        """
-        Returns the headers of the response object.
-
-        :return: A dictionary containing the headers of the response object.
-        :rtype: dict
-        """
-        return self.resp.headers
-
-    @property
-    def reason(self):
-        """
-        Get the reason for the response.
-
-        Returns:
-            str: The reason for the response.
-        """
-        return self.resp.reason
-
-
 class SessionAPI():
     """
     Main class for session operations.
@@ -151,6 +73,7 @@ class SessionAPI():
         self.use_proxy = module_params.get("use_proxy", True)
         self.protocol = 'https'
         self.ipaddress = config_ipv6(self.ipaddress)
+        self.transport = RestTransport(self, "SessionAPI", self.ipaddress, response_class=OpenURLResponse)
         self.set_headers(module_params)
 
     def set_headers(self, module_params):
@@ -244,25 +167,7 @@ class SessionAPI():
                 - follow_redirects (str): The policy for following redirects.
 
         """
-        if api_timeout is None:
-            api_timeout = self.timeout
-        if self.ca_path is None:
-            self.ca_path = self._get_omam_ca_env()
-        req_header = self._headers
-        if headers:
-            req_header.update(headers)
-        url_params = {
-            "method": method,
-            "validate_certs": self.validate_certs,
-            "ca_path": self.ca_path,
-            "use_proxy": self.use_proxy,
-            "headers": req_header,
-            "timeout": api_timeout,
-            "follow_redirects": 'all'
-        }
-        if url_kwargs:
-            url_params.update(url_kwargs)
-        return url_params
+        return self.transport.common_args(method, api_timeout, headers=headers, url_kwargs=url_kwargs)
 
     def _args_session(self, method, api_timeout, headers=None, url_kwargs=None):
         """
@@ -276,11 +181,7 @@ class SessionAPI():
         :return: A dictionary containing the arguments needed to establish a session, including the
         URL arguments, headers, and API timeout.
         """
-        req_header = self._headers
-        if headers:
-            req_header.update(headers)
-        url_kwargs = self._url_common_args_spec(method, api_timeout, headers=headers, url_kwargs=url_kwargs)
-        return url_kwargs
+        return self._url_common_args_spec(method, api_timeout, headers=headers, url_kwargs=url_kwargs)
 
     def invoke_request(self, uri, method, data=None, query_param=None, headers=None,
                        api_timeout=None, dump=True, url_kwargs=None):
@@ -308,9 +209,7 @@ class SessionAPI():
         if data and dump:
             data = json.dumps(data)
         url = self._build_url(uri, query_param=query_param)
-        resp = open_url(url, data=data, **url_kwargs)
-        resp_data = OpenURLResponse(resp)
-        return resp_data
+        return self.transport.send(method, url, data, url_kwargs, backend=OpenURLBackend(open_url))
 
     def _get_omam_ca_env(self):
         """
@@ -321,9 +220,7 @@ class SessionAPI():
         :return: The value of the environment variable, or None if none of the variables are set.
         :rtype: str or None
         """
-        return (os.environ.get("REQUESTS_CA_BUNDLE") or
-                os.environ.get("CURL_CA_BUNDLE") or
-                os.environ.get("OMAM_CA_BUNDLE"))
+        return get_omam_ca_env()
 
 
 class Session(ABC):
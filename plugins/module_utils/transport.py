@@ -0,0 +1,390 @@
+# -*- coding: utf-8 -*-
+
+# Dell OpenManage Ansible Modules
+# Version 9.8.0
+# Copyright (C) 2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# Redistribution and use in source and binary forms, with or without modification,
+# are permitted provided that the following conditions are met:
+
+#    * Redistributions of source code must retain the above copyright notice,
+#      this list of conditions and the following disclaimer.
+
+#    * Redistributions in binary form must reproduce the above copyright notice,
+#      this list of conditions and the following disclaimer in the documentation
+#      and/or other materials provided with the distribution.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE DISCLAIMED.
+# IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE
+# USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import base64
+import gzip
+import io
+import os
+import socket
+import ssl
+import threading
+import zlib
+from ansible.module_utils.six.moves import http_client, queue
+from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
+from ansible.module_utils.six.moves.urllib.parse import urlparse, urljoin
+from ansible.module_utils.six.moves.urllib.request import getproxies, proxy_bypass
+from ansible.module_utils.common.text.converters import to_bytes, to_native
+from ansible.module_utils.urls import Request, make_context, SSLValidationError
+
+POOL_SIZE_ENV = "OMAM_CONNECTION_POOL_SIZE"
+COMPRESSION_ENV = "OMAM_HTTP_COMPRESSION"
+ACCEPT_ENCODING = "gzip, deflate"
+MAX_REDIRECTS = 10
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+STALE_CONNECTION_ERRORS = (http_client.RemoteDisconnected, BrokenPipeError, ConnectionResetError,
+                           ConnectionAbortedError)
+SSL_VALIDATION_MSG = "Failed to validate the SSL certificate for {0}:{1}. {2}"
+CONTEXT_ARGS = ("ciphers", "client_cert", "client_key")
+
+_SSL_CONTEXTS = {}
+_TLS_SESSIONS = {}
+_SSL_LOCK = threading.Lock()
+
+
+class _ResumableSSLSocket(ssl.SSLSocket):
+    """
+    Client socket which offers the last TLS session of the same appliance and stores the
+    session, including TLS 1.3 tickets which arrive after the handshake, on the first read.
+    """
+
+    _session_saved = False
+
+    @classmethod
+    def _create(cls, sock, *args, **kwargs):
+        if not kwargs.get("server_side") and kwargs.get("session") is None:
+            kwargs["session"] = _TLS_SESSIONS.get(_session_key(kwargs.get("context"), sock))
+        return super(_ResumableSSLSocket, cls)._create(sock, *args, **kwargs)
+
+    def read(self, len=1024, buffer=None):
+        data = super(_ResumableSSLSocket, self).read(len, buffer)
+        if not self._session_saved and not self.server_side:
+            self._session_saved = True
+            session = self.session
+            if session is not None and (session.has_ticket or session.id):
+                _TLS_SESSIONS[_session_key(self.context, self)] = session
+        return data
+
+
+def _session_key(context, sock):
+    try:
+        return id(context), sock.getpeername()[:2]
+    except (OSError, AttributeError):
+        return None
+
+
+def get_ssl_context(validate_certs=True, ca_path=None):
+    """
+    Returns the SSLContext shared by all the clients for a validate_certs and ca_path pair.
+    Certificate bundles are loaded once per process and TLS sessions are resumed across connections.
+    """
+    key = (bool(validate_certs), ca_path)
+    with _SSL_LOCK:
+        context = _SSL_CONTEXTS.get(key)
+        if context is None:
+            context = make_context(cafile=ca_path, validate_certs=validate_certs)
+            context.sslsocket_class = _ResumableSSLSocket
+            _SSL_CONTEXTS[key] = context
+    return context
+
+
+def compression_enabled():
+    """Returns True when OMAM_HTTP_COMPRESSION asks for compressed responses"""
+    return os.environ.get(COMPRESSION_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def accept_encoding_headers(headers):
+    """Returns a copy of the headers which negotiates gzip or deflate when compression is enabled"""
+    req_headers = dict(headers or {})
+    if compression_enabled() and not any(key.lower() == "accept-encoding" for key in req_headers):
+        req_headers["Accept-Encoding"] = ACCEPT_ENCODING
+    return req_headers
+
+
+def decode_content(body, headers):
+    """Decodes a gzip or deflate encoded response body, other bodies are returned as is"""
+    try:
+        encoding = headers.get("Content-Encoding")
+    except AttributeError:
+        return body
+    if not body or not isinstance(body, bytes) or not isinstance(encoding, str):
+        return body
+    encoding = encoding.strip().lower()
+    if encoding in ("gzip", "x-gzip"):
+        return gzip.decompress(body)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    return body
+
+
+def decode_http_error(err):
+    """Returns an HTTPError whose body can be read without knowing the content encoding"""
+    headers = err.hdrs
+    if headers is None or not isinstance(headers.get("Content-Encoding"), str):
+        return err
+    body = decode_content(err.read(), headers)
+    return HTTPError(err.url, err.code, err.msg, headers, io.BytesIO(body))
+
+
+def open_url(url, data=None, headers=None, method=None, validate_certs=True, ca_path=None, **kwargs):
+    """
+    open_url which validates certificates with the shared SSLContext of :func:`get_ssl_context`.
+    When compression is enabled the body is left encoded for OpenURLResponse to decode.
+    """
+    method = method or ('POST' if data else 'GET')
+    if not any(kwargs.get(arg) for arg in CONTEXT_ARGS):
+        kwargs["context"] = get_ssl_context(validate_certs, ca_path)
+    if compression_enabled():
+        headers = accept_encoding_headers(headers)
+        kwargs["decompress"] = False
+    try:
+        return Request().open(method, url, data=data, headers=headers, validate_certs=validate_certs,
+                              ca_path=ca_path, **kwargs)
+    except HTTPError as err:
+        raise decode_http_error(err)
+
+
+def get_env_int(name, default=0):
+    """Returns the non-negative integer set in the environment variable or the default"""
+    try:
+        return max(int(os.environ.get(name, default)), 0)
+    except ValueError:
+        return default
+
+
+def get_pool_size(default=0):
+    """Returns the connection pool size set in OMAM_CONNECTION_POOL_SIZE or the default"""
+    return get_env_int(POOL_SIZE_ENV, default)
+
+
+def basic_auth_header(username, password):
+    """Builds the value of a basic authorization header"""
+    credentials = to_bytes("{0}:{1}".format(username, password or ""), errors='surrogate_or_strict')
+    return "Basic {0}".format(to_native(base64.b64encode(credentials)))
+
+
+class PooledResponse(object):
+    """Fully read response returned by :class:`HTTPSConnectionPool`, mimics the open_url response"""
+
+    def __init__(self, url, status, reason, headers, body):
+        self.url = url
+        self.status = status
+        self.code = status
+        self.reason = reason
+        self.headers = headers
+        self.msg = headers
+        self._fp = io.BytesIO(body)
+
+    def read(self, amt=None):
+        return self._fp.read() if amt is None else self._fp.read(amt)
+
+    def getcode(self):
+        return self.status
+
+    def geturl(self):
+        return self.url
+
+    def info(self):
+        return self.headers
+
+    def getheaders(self):
+        return list(self.headers.items())
+
+    def close(self):
+        self._fp.close()
+
+
+class _PooledHTTPSConnection(http_client.HTTPSConnection):
+    """HTTPS connection which reports every new socket to the owning pool"""
+
+    def __init__(self, pool, *args, **kwargs):
+        self._pool = pool
+        super(_PooledHTTPSConnection, self).__init__(*args, **kwargs)
+
+    def connect(self):
+        super(_PooledHTTPSConnection, self).connect()
+        self._pool.connection_opened()
+
+
+class _PooledHTTPConnection(http_client.HTTPConnection):
+    """HTTP connection which reports every new socket to the owning pool"""
+
+    def __init__(self, pool, *args, **kwargs):
+        self._pool = pool
+        super(_PooledHTTPConnection, self).__init__(*args, **kwargs)
+
+    def connect(self):
+        super(_PooledHTTPConnection, self).connect()
+        self._pool.connection_opened()
+
+
+class HTTPSConnectionPool(object):
+    """
+    Bounded pool of keep-alive connections to a single appliance.
+    :meth:`open` accepts the same keyword arguments as open_url. Requests for another origin, through
+    a proxy or with options the pool does not handle are sent through open_url.
+    """
+
+    def __init__(self, base_url, maxsize=1, block_timeout=None):
+        parsed = urlparse(base_url)
+        self.scheme = parsed.scheme
+        self.host = parsed.hostname
+        self.port = parsed.port or (443 if self.scheme == 'https' else 80)
+        self.maxsize = max(int(maxsize), 1)
+        self.block_timeout = block_timeout
+        self.connections_opened = 0
+        self.requests_sent = 0
+        self._idle = queue.LifoQueue(self.maxsize)
+        self._slots = threading.BoundedSemaphore(self.maxsize)
+        self._lock = threading.Lock()
+        self.closed = False
+
+    def connection_opened(self):
+        with self._lock:
+            self.connections_opened += 1
+
+    def _same_origin(self, url):
+        parsed = urlparse(url)
+        port = parsed.port or (443 if parsed.scheme == 'https' else 80)
+        return parsed.scheme == self.scheme and parsed.hostname == self.host and port == self.port
+
+    def _uses_proxy(self, use_proxy):
+        if not use_proxy:
+            return False
+        return bool(getproxies().get(self.scheme)) and not proxy_bypass(self.host)
+
+    def _get_conn(self, timeout, context):
+        acquired = self._slots.acquire(timeout=self.block_timeout) if self.block_timeout else self._slots.acquire()
+        if not acquired:
+            raise URLError("Timed out waiting for a free connection to {0}:{1}.".format(self.host, self.port))
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            if self.scheme == 'https':
+                conn = _PooledHTTPSConnection(self, self.host, self.port, timeout=timeout, context=context)
+            else:
+                conn = _PooledHTTPConnection(self, self.host, self.port, timeout=timeout)
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn
+
+    def _put_conn(self, conn):
+        if self.closed:
+            conn.close()
+        else:
+            self._idle.put_nowait(conn)
+        self._slots.release()
+
+    def _send(self, method, url, body, headers, timeout, context, retry_stale=True):
+        parsed = urlparse(url)
+        target = parsed.path or '/'
+        if parsed.query:
+            target = "{0}?{1}".format(target, parsed.query)
+        conn = self._get_conn(timeout, context)
+        reused = conn.sock is not None
+        try:
+            conn.request(method, target, body=body, headers=headers)
+            resp = conn.getresponse()
+            resp_body = resp.read()
+        except STALE_CONNECTION_ERRORS as err:
+            conn.close()
+            self._put_conn(conn)
+            if reused and retry_stale:
+                # the appliance closed an idle keep-alive connection, retry once on a new socket
+                return self._send(method, url, body, headers, timeout, context, retry_stale=False)
+            raise URLError(err)
+        except ssl.CertificateError as err:
+            conn.close()
+            self._put_conn(conn)
+            raise SSLValidationError(SSL_VALIDATION_MSG.format(self.host, self.port, to_native(err)))
+        except (socket.timeout, OSError, http_client.HTTPException) as err:
+            conn.close()
+            self._put_conn(conn)
+            raise URLError(err)
+        with self._lock:
+            self.requests_sent += 1
+        if resp.will_close:
+            conn.close()
+        self._put_conn(conn)
+        return resp.status, resp.reason, resp.msg, resp_body
+
+    @staticmethod
+    def _follow(follow_redirects, method):
+        if follow_redirects in ('all', 'yes', True, 'urllib2', 'urllib'):
+            return True
+        return follow_redirects == 'safe' and method in ('GET', 'HEAD')
+
+    def open(self, url, data=None, method=None, headers=None, validate_certs=True, ca_path=None,
+             use_proxy=True, timeout=10, follow_redirects='urllib2', url_username=None,
+             url_password=None, force_basic_auth=False, **kwargs):
+        """
+        Sends a request over a pooled connection.
+        Returns a :class:`PooledResponse` and raises HTTPError for non 2xx responses, like open_url.
+        """
+        url_args = {"data": data, "method": method, "headers": headers, "validate_certs": validate_certs,
+                    "ca_path": ca_path, "use_proxy": use_proxy, "timeout": timeout,
+                    "follow_redirects": follow_redirects, "url_username": url_username,
+                    "url_password": url_password, "force_basic_auth": force_basic_auth}
+        url_args.update(kwargs)
+        if (kwargs or self.closed or not self._same_origin(url) or self._uses_proxy(use_proxy) or
+                (url_username is not None and not force_basic_auth)):
+            return open_url(url, **url_args)
+        req_headers = accept_encoding_headers(headers)
+        if url_username is not None:
+            req_headers["Authorization"] = basic_auth_header(url_username, url_password)
+        body = to_bytes(data, nonstring='passthru')
+        method = (method or ('POST' if body else 'GET')).upper()
+        context = get_ssl_context(validate_certs, ca_path) if self.scheme == 'https' else None
+        for dummy in range(MAX_REDIRECTS):
+            status, reason, resp_headers, resp_body = self._send(method, url, body, req_headers, timeout, context)
+            location = resp_headers.get("Location")
+            if status not in REDIRECT_CODES or not location or not self._follow(follow_redirects, method):
+                break
+            new_url = urljoin(url, location)
+            if status == 303 or (status in (301, 302) and method == 'POST'):
+                method, body = 'GET', None
+                url_args.update({"method": method, "data": None})
+            if not self._same_origin(new_url):
+                return open_url(new_url, **url_args)
+            url = new_url
+        if status >= 300:
+            raise HTTPError(url, status, reason, resp_headers, io.BytesIO(decode_content(resp_body, resp_headers)))
+        return PooledResponse(url, status, reason, resp_headers, resp_body)
+
+    def close(self):
+        """Closes every idle connection, connections in use are closed when they are returned"""
+        self.closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
@@ -51,6 +51,7 @@ GET_IDRAC_FIRMWARE_VER_URI = "/redfish/v1/Managers/iDRAC.Embedded.1?$select=Firm
 HOSTNAME_REGEX = r"^(([a-zA-Z0-9]|[a-zA-Z0-9][a-zA-Z0-9\-]*[a-zA-Z0-9])\.)*([A-Za-z0-9]|[A-Za-z0-9][A-Za-z0-9\-]*[A-Za-z0-9])$"
 OME_INFO = "ApplicationService/Info"
 ODATA_ID = "@odata.id"
+SELECT_UNSUPPORTED_CODES = (400, 501)
 POWER_CHECK_RETRIES = 30
 POWER_CHECK_INTERVAL = 10
 
@@ -61,6 +62,15 @@ import re
 from ansible.module_utils.six.moves.urllib.error import HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
+from ansible_collections.dellemc.openmanage.plugins.module_utils.job_state import JobStateMap, JobStateEngine, \
+    OME_JOB_STATES, IDRAC_JOB_STATES, IDRAC_JOB_PROGRESS_STATES, REDFISH_JOB_PROGRESS_STATES, json_document
+from ansible_collections.dellemc.openmanage.plugins.module_utils.job_events import job_events
+from ansible_collections.dellemc.openmanage.plugins.module_utils.retry_policy import RetryPolicy
+
+# The iDRAC is often restarting while its power state is read, so server errors and any other
+# failure of the request are retried for up to about a minute, in place of the transport retries.
+POWER_STATE_RETRY = RetryPolicy(attempts=9, status_codes=(429,) + tuple(range(500, 600)), methods=("GET",),
+                                backoff=1, max_backoff=10, errors=(Exception,))
 
 
 def strip_substr_dict(odata_dict, chkstr='@odata.', case_sensitive=False):
@@ -138,49 +148,22 @@ def job_tracking(rest_obj, job_uri, max_job_wait_sec=600, job_state_var=('LastRu
     #     2103: "Canceled"
     # }
     # ensure job states are mutually exclusive
-    max_retries = max_job_wait_sec // sleep_interval_secs
-    unresp = max_unresponsive_wait // sleep_interval_secs
-    loop_ctr = 0
-    job_failed = True
-    job_dict = {}
-    wait_time = 0
     if set(job_complete_states) & set(job_fail_states):
-        return job_failed, "Overlapping job states found.", job_dict, wait_time
-    msg = "Job tracking started."
-    time.sleep(initial_wait)
-    while loop_ctr < max_retries:
-        loop_ctr += 1
-        try:
-            job_resp = rest_obj.invoke_request('GET', job_uri)
-            job_dict = job_resp.json_data
-            job_status = job_dict
-            for x in job_state_var:
-                job_status = job_status.get(x, {})
-            if job_status in job_complete_states:
-                job_failed = False
-                msg = "Job tracking completed."
-                loop_ctr = max_retries
-            elif job_status in job_fail_states:
-                job_failed = True
-                msg = "Job is in Failed state."
-                loop_ctr = max_retries
-            if job_running_states:
-                if job_status in job_running_states:
-                    time.sleep(sleep_interval_secs)
-                    wait_time = wait_time + sleep_interval_secs
-            else:
-                time.sleep(sleep_interval_secs)
-                wait_time = wait_time + sleep_interval_secs
-        except Exception as err:
-            if unresp:
-                time.sleep(sleep_interval_secs)
-                wait_time = wait_time + sleep_interval_secs
-            else:
-                job_failed = True
-                msg = "Exception in job tracking " + str(err)
-                break
-            unresp = unresp - 1
-    return job_failed, msg, job_dict, wait_time
+        return True, "Overlapping job states found.", {}, 0
+    state_map = JobStateMap(OME_JOB_STATES.name, job_state_var, complete_states=job_complete_states,
+                            failed_states=job_fail_states)
+    engine = JobStateEngine(state_map, max_job_wait_sec, sleep_interval_secs, first_delay=initial_wait,
+                            max_errors=max_unresponsive_wait // sleep_interval_secs)
+    try:
+        outcome = engine.wait(lambda: rest_obj.invoke_request('GET', job_uri).json_data, job_id=job_uri)
+    except Exception as err:
+        return True, "Exception in job tracking " + str(err), engine.last_document or {}, int(engine.poller.elapsed)
+    job_dict = outcome.job or {}
+    if not outcome.done:
+        return True, "Job tracking started.", job_dict, int(engine.poller.elapsed)
+    if outcome.failed:
+        return True, "Job is in Failed state.", job_dict, int(engine.poller.elapsed)
+    return False, "Job tracking completed.", job_dict, int(engine.poller.elapsed)
 
 
 def idrac_redfish_job_tracking(
@@ -193,47 +176,24 @@ def idrac_redfish_job_tracking(
     # idrac_redfish_job_sates = [ "New", "Scheduled", "Running", "Completed", "Downloading", "Downloaded",
     # "Scheduling", "ReadyForExecution", "Waiting", "Paused", "Failed", "CompletedWithErrors", "RebootPending",
     # "RebootFailed", "RebootCompleted", "PendingActivation", "Unknown"]
-    max_retries = max_job_wait_sec // sleep_interval_secs
-    unresp = max_unresponsive_wait // sleep_interval_secs
-    loop_ctr = 0
-    job_failed = True
-    job_dict = {}
-    wait_time = 0
     if set(job_complete_states) & set(job_fail_states):
-        return job_failed, "Overlapping job states found.", job_dict, wait_time
-    msg = "Job tracking started."
-    time.sleep(initial_wait)
-    while loop_ctr < max_retries:
-        loop_ctr += 1
+        return True, "Overlapping job states found.", {}, 0
+    state_map = JobStateMap(IDRAC_JOB_STATES.name, (job_state_var,), complete_states=job_complete_states,
+                            failed_states=job_fail_states, running_states=job_running_states,
+                            default=IDRAC_JOB_STATES.default)
+    with job_events(rest_obj, job_uri) as events:
+        engine = JobStateEngine(state_map, max_job_wait_sec, sleep_interval_secs, first_delay=initial_wait,
+                                max_errors=max_unresponsive_wait // sleep_interval_secs, events=events)
         try:
-            job_resp = rest_obj.invoke_request(job_uri, 'GET')
-            job_dict = job_resp.json_data
-            job_status = job_dict
-            job_status = job_status.get(job_state_var, "Unknown")
-            if job_status in job_running_states:
-                time.sleep(sleep_interval_secs)
-                wait_time = wait_time + sleep_interval_secs
-            elif job_status in job_complete_states:
-                job_failed = False
-                msg = "Job tracking completed."
-                loop_ctr = max_retries
-            elif job_status in job_fail_states:
-                job_failed = True
-                msg = "Job is in {0} state.".format(job_status)
-                loop_ctr = max_retries
-            else:  # unrecognised states, just wait
-                time.sleep(sleep_interval_secs)
-                wait_time = wait_time + sleep_interval_secs
+            outcome = engine.wait(lambda: rest_obj.invoke_request(job_uri, 'GET').json_data, job_id=job_uri)
         except Exception as err:
-            if unresp:
-                time.sleep(sleep_interval_secs)
-                wait_time = wait_time + sleep_interval_secs
-            else:
-                job_failed = True
-                msg = "Exception in job tracking " + str(err)
-                break
-            unresp = unresp - 1
-    return job_failed, msg, job_dict, wait_time
+            return True, "Exception in job tracking " + str(err), engine.last_document or {}, int(engine.poller.elapsed)
+    job_dict = outcome.job or {}
+    if not outcome.done:
+        return True, "Job tracking started.", job_dict, int(engine.poller.elapsed)
+    if outcome.failed:
+        return True, "Job is in {0} state.".format(outcome.state), job_dict, int(engine.poller.elapsed)
+    return False, "Job tracking completed.", job_dict, int(engine.poller.elapsed)
 
 
 def get_rest_items(rest_obj, uri="DeviceService/Devices", key="Id", value="Identifier", selector="value"):
@@ -266,20 +226,11 @@ def apply_diff_key(src, dest, klist):
 
 
 def wait_for_job_completion(redfish_obj, uri, job_wait=True, wait_timeout=120, sleep_time=10):
-    max_sleep_time = wait_timeout
-    sleep_interval = sleep_time
     if job_wait:
-        while max_sleep_time:
-            if max_sleep_time > sleep_interval:
-                max_sleep_time = max_sleep_time - sleep_interval
-            else:
-                sleep_interval = max_sleep_time
-                max_sleep_time = 0
-            time.sleep(sleep_interval)
-            job_resp = redfish_obj.invoke_request("GET", uri)
-            if job_resp.json_data.get("PercentComplete") == 100:
-                time.sleep(10)
-                return job_resp, ""
+        outcome = JobStateEngine(REDFISH_JOB_PROGRESS_STATES, wait_timeout, sleep_time, document=json_document).wait(
+            lambda: redfish_obj.invoke_request("GET", uri), job_id=uri)
+        if outcome.done:
+            return outcome.job, ""
     else:
         job_resp = redfish_obj.invoke_request("GET", uri)
         time.sleep(10)
@@ -333,29 +284,17 @@ def get_manager_res_id(idrac):
 
 
 def wait_for_idrac_job_completion(idrac, uri, job_wait=True, wait_timeout=120, sleep_time=10):
-    max_sleep_time = wait_timeout
-    sleep_interval = sleep_time
     job_msg = "The job is not complete after {0} seconds.".format(wait_timeout)
     if job_wait:
-        while max_sleep_time:
-            if max_sleep_time > sleep_interval:
-                max_sleep_time = max_sleep_time - sleep_interval
-            else:
-                sleep_interval = max_sleep_time
-                max_sleep_time = 0
-            time.sleep(sleep_interval)
-            job_resp = idrac.invoke_request(uri, "GET")
-            if job_resp.json_data.get("PercentComplete") == 100:
-                time.sleep(10)
-                return job_resp, ""
-            if job_resp.json_data.get("JobState") == "RebootFailed":
-                time.sleep(10)
-                return job_resp, job_msg
+        outcome = JobStateEngine(IDRAC_JOB_PROGRESS_STATES, wait_timeout, sleep_time, document=json_document).wait(
+            lambda: idrac.invoke_request(uri, "GET"), job_id=uri)
+        if outcome.done:
+            return outcome.job, job_msg if outcome.failed else ""
     else:
         job_resp = idrac.invoke_request(uri, "GET")
         time.sleep(10)
         return job_resp, ""
-    return {}, "The job is not complete after {0} seconds.".format(wait_timeout)
+    return {}, job_msg
 
 
 def idrac_system_reset(idrac, res_id, payload=None, job_wait=True, wait_time_sec=300, interval=30):
@@ -395,21 +334,91 @@ def get_system_res_id(idrac):
     return res_id, error_msg
 
 
-def get_all_data_with_pagination(ome_obj, uri, query_param=None):
-    """To get all the devices with pagination based on the filter provided."""
-    query, resp, report_list = "", None, []
-    try:
-        resp = ome_obj.invoke_request('GET', uri, query_param=query_param)
+def select_fields(resp, select):
+    """
+    Trims every item of the collection response to the selected top level fields, keeping the
+    '@odata.' annotations of the item and of the selected fields.
+    :param resp: OpenURLResponse of a collection
+    :param select: list of the top level field names
+    :return: OpenURLResponse
+    """
+    if not select:
+        return resp
+    data = resp.json_data
+    value = data.get("value")
+    selected = set(select)
+
+    def is_selected(key):
+        return key.split("@")[0] in selected or key.startswith("@odata.")
+
+    if isinstance(value, list) and value and isinstance(value[0], dict) and not all(map(is_selected, value[0])):
+        data["value"] = [dict((k, v) for k, v in item.items() if is_selected(k)) for item in value]
+    return resp
+
+
+def invoke_select_request(rest_obj, uri, query_param=None, select=None):
+    """
+    Sends a GET request with '$select' of the given fields. The request is repeated without
+    '$select' when the appliance rejects it and the result is remembered in
+    ``rest_obj.select_supported``. Fields which are not selected are trimmed client side
+    when the appliance ignores the projection.
+    :param rest_obj: RestOME object
+    :param uri: uri of the collection
+    :param query_param: (optional) query parameters of the request
+    :param select: (optional) list of the top level field names
+    :return: OpenURLResponse
+    """
+    if not select:
+        return rest_obj.invoke_request('GET', uri, query_param=query_param)
+    if getattr(rest_obj, "select_supported", None) is not False:
+        query = dict(query_param or {})
+        query["$select"] = ",".join(select)
+        try:
+            resp = rest_obj.invoke_request('GET', uri, query_param=query)
+            rest_obj.select_supported = True
+            return select_fields(resp, select)
+        except HTTPError as err:
+            if err.code not in SELECT_UNSUPPORTED_CODES:
+                raise
+            rest_obj.select_supported = False
+    return select_fields(rest_obj.invoke_request('GET', uri, query_param=query_param), select)
+
+
+def iter_pages_with_pagination(ome_obj, uri, query_param=None, select=None):
+    """Yields the response of every page based on the filter provided, following '@odata.nextLink'."""
+    resp = invoke_select_request(ome_obj, uri, query_param=query_param, select=select)
+    next_uri = resp.json_data.get("@odata.nextLink", None)
+    query_param = dict(query_param or {})
+    if select and ome_obj.select_supported and "select=" not in (next_uri or ""):
+        query_param["$select"] = ",".join(select)
+    query = "&".join("{0}={1}".format(k, v.replace(" ", "%20")) for k, v in query_param.items())
+    yield resp
+    while next_uri is not None:
+        next_uri_query = "{0}&{1}".format(next_uri.strip("/api"), query) if query else next_uri.strip("/api")
+        resp = select_fields(ome_obj.invoke_request('GET', next_uri_query), select)
         next_uri = resp.json_data.get("@odata.nextLink", None)
+        yield resp
+
+
+def iter_data_with_pagination(ome_obj, uri, query_param=None, select=None):
+    """Yields the devices page by page, holding only one page in memory, based on the filter provided."""
+    for resp in iter_pages_with_pagination(ome_obj, uri, query_param=query_param, select=select):
+        for item in resp.json_data.get("value") or []:
+            yield item
+
+
+def get_all_data_with_pagination(ome_obj, uri, query_param=None, select=None):
+    """
+    To get all the devices with pagination based on the filter provided.
+    Only the fields in ``select`` are returned for each item when it is provided.
+    """
+    resp, report_list = None, []
+    try:
+        pages = iter_pages_with_pagination(ome_obj, uri, query_param=query_param, select=select)
+        resp = next(pages)
         report_list = resp.json_data.get("value")
-        if query_param is not None:
-            for k, v in query_param.items():
-                query += "{0}={1}".format(k, v.replace(" ", "%20"))
-        while next_uri is not None:
-            next_uri_query = "{0}&{1}".format(next_uri.strip("/api"), query) if query else next_uri.strip("/api")
-            resp = ome_obj.invoke_request('GET', next_uri_query)
+        for resp in pages:
             report_list.extend(resp.json_data.get("value"))
-            next_uri = resp.json_data.get("@odata.nextLink", None)
     except (URLError, HTTPError, SSLValidationError, ConnectionError, TypeError, ValueError) as err:
         raise err
     return {"resp_obj": resp, "report_list": report_list}
@@ -455,30 +464,16 @@ def wait_for_redfish_reboot_job(redfish_obj, res_id, payload=None, wait_time_sec
 
 
 def wait_for_redfish_job_complete(redfish_obj, job_uri, job_wait=True, wait_timeout=120, sleep_time=10):
-    max_sleep_time = wait_timeout
-    sleep_interval = sleep_time
     job_msg = "The job is not complete after {0} seconds.".format(wait_timeout)
-    job_resp = {}
     if job_wait:
-        while max_sleep_time:
-            if max_sleep_time > sleep_interval:
-                max_sleep_time = max_sleep_time - sleep_interval
-            else:
-                sleep_interval = max_sleep_time
-                max_sleep_time = 0
-            time.sleep(sleep_interval)
-            job_resp = redfish_obj.invoke_request("GET", job_uri, api_timeout=120)
-            if job_resp.json_data.get("PercentComplete") == 100:
-                time.sleep(10)
-                return job_resp, ""
-            if job_resp.json_data.get("JobState") == "RebootFailed":
-                time.sleep(10)
-                return job_resp, job_msg
-    else:
-        time.sleep(10)
-        job_resp = redfish_obj.invoke_request("GET", job_uri, api_timeout=120)
-        return job_resp, ""
-    return job_resp, job_msg
+        outcome = JobStateEngine(IDRAC_JOB_PROGRESS_STATES, wait_timeout, sleep_time, document=json_document).wait(
+            lambda: redfish_obj.invoke_request("GET", job_uri, api_timeout=120), job_id=job_uri)
+        if outcome.done and not outcome.failed:
+            return outcome.job, ""
+        return outcome.job or {}, job_msg
+    time.sleep(10)
+    job_resp = redfish_obj.invoke_request("GET", job_uri, api_timeout=120)
+    return job_resp, ""
 
 
 def get_dynamic_uri(idrac_obj, base_uri, search_label=''):
@@ -700,15 +695,12 @@ def track_power_state(idrac, base_uri, desired_state, retries=POWER_CHECK_RETRIE
 
 
 def get_power_state(idrac, base_uri):
-    retries = 10
     pstate = "Unknown"
-    while retries > 0:
-        try:
-            resp = idrac.invoke_request(base_uri, "GET")
-            pstate = resp.json_data.get("PowerState")
-            break
-        except Exception:
-            retries = retries - 1
+    try:
+        resp = idrac.invoke_request(base_uri, "GET", retry_policy=POWER_STATE_RETRY)
+        pstate = resp.json_data.get("PowerState")
+    except Exception:
+        pass
     return pstate
 
 
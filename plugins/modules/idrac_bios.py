@@ -608,7 +608,7 @@ def clear_pending_bios(module, redfish_obj):
 def get_attributes_registry(idrac):
     reggy = {}
     try:
-        resp = idrac.invoke_request(BIOS_REGISTRY, "GET")
+        resp = idrac.invoke_request(BIOS_REGISTRY, "GET", cache=True)
         attr_list = resp.json_data.get("RegistryEntries").get("Attributes")
         reggy = dict((x["AttributeName"], x) for x in attr_list)
     except Exception:
@@ -45,7 +45,10 @@ options:
           - This option is not applicable for HTTP, HTTPS, and FTP shares.
         type: str
     job_wait:
-        description: Whether to wait for job completion or not.
+        description:
+          - Whether to wait for job completion or not.
+          - When C(false) and I(apply_update) is C(true), the module returns C(job_handle), which
+            M(dellemc.openmanage.ome_idrac_job_wait) tracks.
         type: bool
         default: true
     catalog_file_name:
@@ -228,6 +231,20 @@ update_status:
         'JobStartTime': 'NA',
         'Status': 'Success',
     }
+job_handle:
+  type: dict
+  description:
+    - Handle of the firmware update job, which M(dellemc.openmanage.ome_idrac_job_wait) tracks.
+    - It contains the host and port but no credentials.
+  returned: when I(apply_update) is C(true) and I(job_wait) is C(false)
+  sample: {
+        "api": "idrac",
+        "host": "192.168.0.1",
+        "port": 443,
+        "job_uri": "/redfish/v1/JobService/Jobs/JID_XXXXXXXXXXXX",
+        "job_id": "JID_XXXXXXXXXXXX",
+        "state_map": "idrac"
+    }
 """
 
 
@@ -238,6 +255,9 @@ from ssl import SSLError
 from xml.etree import ElementTree as ET
 from ansible_collections.dellemc.openmanage.plugins.module_utils.dellemc_idrac import iDRACConnection, idrac_auth_params
 from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI
+from ansible_collections.dellemc.openmanage.plugins.module_utils.job_state import JobStateMap, JobStateEngine, \
+    IDRAC_JOB_STATES, IDRAC_JOB_STAGED_STATES, json_document
+from ansible_collections.dellemc.openmanage.plugins.module_utils.job_handle import job_handle
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.six.moves.urllib.parse import urlparse
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
@@ -290,28 +310,25 @@ def wait_for_job_completion(module, job_uri, job_wait=False, reboot=False, apply
             time.sleep(10)
     if track_counter < 5:
         msg = None
-    #  reset track counter
-    track_counter = 0
-    while job_wait and track_counter <= WAIT_COUNT:
-        try:
+    if job_wait:
+        def is_done(job):
+            if job.get("PercentComplete") == 100 and job.get("JobState") == "Completed":  # apply now
+                return True
+            return job.get("JobState") in ["Starting", "Running", "Pending", "New"] and not reboot and apply_update
+
+        def fetch():
             with iDRACRedfishAPI(module.params) as redfish:
-                response = redfish.invoke_request(job_uri, "GET")
-                job_state = response.json_data.get("JobState")
-            msg = None
-        except Exception as error_message:
-            msg = str(error_message)
-            track_counter += 2
-            time.sleep(INTERVAL)
-        else:
-            if response.json_data.get("PercentComplete") == 100 and job_state == "Completed":  # apply now
-                break
-            if job_state in ["Starting", "Running", "Pending", "New"] and not reboot and apply_update:  # apply on
-                break
-            track_counter += 1
-            time.sleep(INTERVAL)
-    if track_counter > WAIT_COUNT:
-        # TIMED OUT
-        msg = JOB_WAIT_MSG.format((WAIT_COUNT * INTERVAL) / 60)
+                return redfish.invoke_request(job_uri, "GET")
+
+        engine = JobStateEngine(JobStateMap("idrac_firmware", ("JobState",), terminal=is_done),
+                                WAIT_COUNT * INTERVAL, INTERVAL, first_delay=0, max_errors=None,
+                                document=json_document)
+        outcome = engine.wait(fetch, job_id=job_uri)
+        response = outcome.job or response
+        msg = None
+        if not outcome.done:
+            # TIMED OUT
+            msg = JOB_WAIT_MSG.format((WAIT_COUNT * INTERVAL) / 60)
     return response, msg
 
 
@@ -793,8 +810,14 @@ def main():
     except Exception as exc:
         module.fail_json(msg="Unhandled Exception {0}".format(exc))
 
+    result = {}
+    job_id = status['update_status'].get('Id') if isinstance(status['update_status'], dict) else None
+    if redfish_check and job_id and module.params['apply_update'] and not module.params['job_wait']:
+        state_map = IDRAC_JOB_STATES if module.params['reboot'] else IDRAC_JOB_STAGED_STATES
+        result['job_handle'] = job_handle("idrac", module.params, JOB_URI.format(job_id=job_id), job_id=job_id,
+                                          state_map=state_map.name)
     module.exit_json(msg=status['update_msg'], update_status=status['update_status'],
-                     changed=status['changed'], failed=status['failed'])
+                     changed=status['changed'], failed=status['failed'], **result)
 
 
 if __name__ == '__main__':
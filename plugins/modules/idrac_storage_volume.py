@@ -289,6 +289,7 @@ from urllib.error import HTTPError, URLError
 from copy import deepcopy
 from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI, IdracAnsibleModule
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
+from ansible_collections.dellemc.openmanage.plugins.module_utils.concurrency import fan_out
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import (
     get_dynamic_uri, validate_and_get_first_resource_id_uri, xml_data_conversion, idrac_redfish_job_tracking, remove_key, get_idrac_firmware_version)
 
@@ -482,6 +483,11 @@ class StorageData:
         uri_data = self.idrac.invoke_request(uri, "GET")
         return key, uri_data
 
+    def fetch_members_data(self, members):
+        """Fetches the members, concurrently when fan out workers are configured, and returns them by ID"""
+        responses = fan_out(lambda member: self.fetch_api_data(member[ODATA_ID], -1), members)
+        return dict((key, uri_data.json_data) for key, uri_data in responses)
+
     def all_storage_data(self):
         storage_info = {"Controllers": {}}
         controllers_details_uri = self.fetch_controllers_uri()[ODATA_ID] + "?$expand=*($levels=1)"
@@ -495,20 +501,16 @@ class StorageData:
             storage_info["Controllers"][controller_id]["Volumes"] = {}
             storage_info["Controllers"][controller_id]["Links"]["Enclosures"] = {}
             # To fetch drives data
-            for each_drive_uri in each_controller["Drives"]:
-                key, uri_data = self.fetch_api_data(each_drive_uri[ODATA_ID], -1)
-                storage_info["Controllers"][controller_id]["Drives"][key] = uri_data.json_data
+            storage_info["Controllers"][controller_id]["Drives"].update(
+                self.fetch_members_data(each_controller["Drives"]))
 
             # To fetch volumes data
             volume_uri = each_controller['Volumes'][ODATA_ID]
             volumes_list = get_dynamic_uri(self.idrac, volume_uri, "Members")
-            for each_volume_uri in volumes_list:
-                key, uri_data = self.fetch_api_data(each_volume_uri[ODATA_ID], -1)
-                storage_info["Controllers"][controller_id]["Volumes"][key] = uri_data.json_data
+            storage_info["Controllers"][controller_id]["Volumes"].update(self.fetch_members_data(volumes_list))
             # To fetch enclosures
-            for each_enclosure_uri in each_controller["Links"]["Enclosures"]:
-                key, uri_data = self.fetch_api_data(each_enclosure_uri[ODATA_ID], -1)
-                storage_info["Controllers"][controller_id]["Links"]["Enclosures"][key] = uri_data.json_data
+            storage_info["Controllers"][controller_id]["Links"]["Enclosures"].update(
+                self.fetch_members_data(each_controller["Links"]["Enclosures"]))
         return storage_info
 
     def fetch_storage_data(self):
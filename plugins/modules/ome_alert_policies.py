@@ -618,7 +618,7 @@ def get_target_payload(module, rest_obj):
 
 
 def get_category_data_tree(rest_obj):
-    resp = rest_obj.invoke_request("GET", CATEGORY_URI)
+    resp = rest_obj.invoke_request("GET", CATEGORY_URI, cache=True)
     cat_raw = resp.json_data.get("value", [])
     cat_dict = dict(
         (category.get("Name"),
@@ -633,7 +633,7 @@ def get_category_data_tree(rest_obj):
 
 
 def get_all_actions(rest_obj):
-    resp = rest_obj.invoke_request("GET", ACTIONS_URI)
+    resp = rest_obj.invoke_request("GET", ACTIONS_URI, cache=True)
     actions = resp.json_data.get("value", [])
     cmp_actions = dict((x.get("Name"), {"Id": x.get("Id"),
                                         "Disabled": x.get("Disabled"),
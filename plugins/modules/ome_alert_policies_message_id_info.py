@@ -106,7 +106,7 @@ error_info:
 import json
 from ssl import SSLError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, OmeAnsibleModule
-from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import remove_key, get_all_data_with_pagination
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import remove_key, iter_data_with_pagination
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 
@@ -123,10 +123,9 @@ def main():
     )
     try:
         with RestOME(module.params, req_session=True) as rest_obj:
-            message_id_info = get_all_data_with_pagination(rest_obj, ALERT_MESSAGE_URI)
-            if not message_id_info.get("report_list", []):
+            message_ids = [remove_key(message_id) for message_id in iter_data_with_pagination(rest_obj, ALERT_MESSAGE_URI)]
+            if not message_ids:
                 module.exit_json(msg=EMPTY_MSG, message_ids=[])
-            message_ids = remove_key(message_id_info['report_list'])
             module.exit_json(msg=SUCCESSFUL_MSG, message_ids=message_ids)
     except HTTPError as err:
         module.exit_json(msg=str(err), error_info=json.load(err), failed=True)
@@ -256,7 +256,7 @@ import time
 from ssl import SSLError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError
-from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, OmeAnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, OmeAnsibleModule, JobBatchTracker
 from ansible.module_utils.common.dict_transformations import recursive_diff
 
 DEVICE_URI = "DeviceService/Devices"
@@ -381,36 +381,21 @@ def start_slot_name_jobs(rest_obj, slot_data):
 
 def get_job_states(module, rest_obj, slot_data):
     job_dict = dict([(slot['JobId'], k) for k, slot in slot_data.items() if slot['JobId']])
-    query_params = {"$filter": "JobType/Id eq 3"}  # optimize this
-    count = JOB_TIMEOUT // SETTLING_TIME
-    job_incomplete = [2050, 2030, 2040, 2080]  # Running, Queued, Starting, New
-    while count > 0 and job_dict:
-        try:
-            job_resp = rest_obj.invoke_request("GET", JOB_URI, query_param=query_params)
-            jobs = job_resp.json_data.get('value')
-        except HTTPError:
-            count = count - 50  # 3 times retry for HTTP error
-            time.sleep(SETTLING_TIME)
+    tracker = JobBatchTracker(rest_obj, job_dict)
+    try:
+        tracker.wait(job_wait_sec=JOB_TIMEOUT, sleep_time=SETTLING_TIME, max_errors=3, initial_wait=0)
+    except HTTPError:
+        pass
+    for job_id, job in tracker.jobs.items():
+        if job_id in tracker.pending:
             continue
-        job_over = []
-        for job in jobs:
-            id = job.get('Id')
-            if id in job_dict:
-                lrs = job.get('LastRunStatus')
-                slot = slot_data[job_dict[id]]
-                if lrs.get('Id') in job_incomplete:  # Running, not failed, not completed state
-                    job_over.append(False)
-                elif lrs.get('Id') == 2060:
-                    job_over.append(True)
-                    slot['SlotName'] = slot.pop('new_name')
-                    job_dict.pop(id)
-                else:
-                    slot['JobStatus'] = lrs.get('Name')
-                    job_over.append(True)  # Failed states - job not running
-        if all(job_over) or not job_dict:
-            break
-        count = count - 1
-        time.sleep(SETTLING_TIME)
+        lrs = job.get('LastRunStatus')
+        slot = slot_data[job_dict[job_id]]
+        if lrs.get('Id') == 2060:
+            slot['SlotName'] = slot.pop('new_name')
+            job_dict.pop(job_id)
+        else:
+            slot['JobStatus'] = lrs.get('Name')
     failed_jobs = dict([(k, slot_data.pop(k)) for k in job_dict.values()])
     return failed_jobs
 
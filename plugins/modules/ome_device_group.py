@@ -291,6 +291,7 @@ except ImportError:
 
 GROUP_URI = "GroupService/Groups"
 DEVICE_URI = "DeviceService/Devices"
+DEVICE_ID_FIELDS = ["Id", "DeviceServiceTag", "DeviceManagement"]
 ADD_MEMBER_URI = "GroupService/Actions/GroupService.AddMemberDevices"
 REMOVE_MEMBER_URI = "GroupService/Actions/GroupService.RemoveMemberDevices"
 ADD_STATIC_GROUP_MESSAGE = "Devices can be added only to the static device groups created using OpenManage Enterprise."
@@ -386,20 +387,21 @@ def get_device_id(rest_obj, module):
     device_id_list = module.params.get("device_ids")
     device_tag_list = module.params.get("device_service_tags")
     ip_addresses = module.params.get("ip_addresses")
-    device_list = rest_obj.get_all_report_details(DEVICE_URI)
     invalid, each_device_list, each_tag_to_id = [], [], []
     if device_id_list or device_tag_list:
         if device_id_list:
             key = "Id"
             each_device_list = device_id_list
+            devices = rest_obj.resolve_devices(device_ids=device_id_list, select=DEVICE_ID_FIELDS)[key]
         elif device_tag_list:
             key = "DeviceServiceTag"
             each_device_list = device_tag_list
+            devices = rest_obj.resolve_devices(service_tags=device_tag_list, select=DEVICE_ID_FIELDS)[key]
 
         for each in each_device_list:
-            each_device = list(filter(lambda d: d[key] in [each], device_list["report_list"]))
+            each_device = devices.get(each)
             if key == "DeviceServiceTag" and each_device:
-                each_tag_to_id.append(each_device[0]["Id"])
+                each_tag_to_id.append(each_device["Id"])
             if not each_device:
                 invalid.append(str(each))
         if invalid:
@@ -409,6 +411,7 @@ def get_device_id(rest_obj, module):
         if each_tag_to_id:
             each_device_list = each_tag_to_id
     else:
+        device_list = rest_obj.get_all_report_details(DEVICE_URI, select=DEVICE_ID_FIELDS)
         all_ips = get_all_ips(ip_addresses, module)
         each_device_list = get_device_id_from_ip(all_ips, device_list["report_list"], module)
         key = "IPAddresses"
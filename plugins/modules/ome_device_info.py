@@ -195,9 +195,12 @@ device_info:
 '''
 
 from ssl import SSLError
+from functools import partial
 
-from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, OmeAnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, OmeAnsibleModule, \
+    DEVICE_IDENTITY_FIELDS
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import get_all_data_with_pagination
+from ansible_collections.dellemc.openmanage.plugins.module_utils.concurrency import fan_out
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 
@@ -247,11 +250,8 @@ def _get_device_id_from_service_tags(service_tags, rest_obj):
     :arg rest_obj: RestOME class object in case of request with session.
     :returns: dict eg: {1345:"MXL1245"}
     """
-    device_list = rest_obj.get_all_report_details(DEVICE_RESOURCE_COLLECTION[DEVICE_LIST]["resource"])["report_list"]
-    service_tag_dict = {}
-    for item in device_list:
-        if item["DeviceServiceTag"] in service_tags:
-            service_tag_dict.update({item["Id"]: item["DeviceServiceTag"]})
+    devices = rest_obj.resolve_devices(service_tags=service_tags, select=DEVICE_IDENTITY_FIELDS)["DeviceServiceTag"]
+    service_tag_dict = dict((device["Id"], tag) for tag, device in devices.items())
     available_service_tags = service_tag_dict.values()
     missing_service_tags = list(set(service_tags) - set(available_service_tags))
     update_device_details_with_filtering(missing_service_tags, service_tag_dict, rest_obj)
@@ -346,6 +346,15 @@ def _get_resource_parameters(module_params, rest_obj):
     return path_dict
 
 
+def _get_device_detail(rest_obj, path):
+    """Returns the response data of the path and its status code, or the HTTP error message and None"""
+    try:
+        resp = rest_obj.invoke_request('GET', path)
+    except HTTPError as err:
+        return str(err), None
+    return resp.json_data, resp.status_code
+
+
 def _check_mutually_inclusive_arguments(val, module_params, required_args):
     """"
      Throws error if arguments detailed_inventory, subsystem_health
@@ -408,13 +417,12 @@ def main():
                         module.exit_json(msg="No devices present.", device_info=[])
             else:
                 for identifier_type, path_dict_map in device_facts.items():
-                    for identifier, path in path_dict_map.items():
-                        try:
-                            resp = rest_obj.invoke_request('GET', path)
-                            data = resp.json_data
-                            resp_status.append(resp.status_code)
-                        except HTTPError as err:
-                            data = str(err)
+                    identifiers = list(path_dict_map)
+                    details = fan_out(partial(_get_device_detail, rest_obj),
+                                      [path_dict_map[identifier] for identifier in identifiers])
+                    for identifier, (data, status_code) in zip(identifiers, details):
+                        if status_code is not None:
+                            resp_status.append(status_code)
                         path_dict_map[identifier] = data
                 if any(device_fact_error_report):
                     if "device_service_tag" in device_facts:
@@ -326,6 +326,20 @@ update_status:
       'Id': 5,
       'Name': 'Update_Task'}
 }
+job_handle:
+  type: dict
+  description:
+    - Handle of the firmware update job, which M(dellemc.openmanage.ome_idrac_job_wait) tracks.
+    - It contains the host and port but no credentials.
+  returned: success
+  sample: {
+    "api": "ome",
+    "host": "192.168.0.1",
+    "port": 443,
+    "job_uri": "JobService/Jobs(11117)",
+    "job_id": "11117",
+    "state_map": "ome_info"
+  }
 error_info:
   description: Details of the HTTP Error.
   returned: on HTTP error
@@ -351,7 +365,9 @@ error_info:
 
 import json
 from ssl import SSLError
-from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, OmeAnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, OmeAnsibleModule, \
+    DEVICE_IDENTITY_FIELDS, DEVICE_URI, JOB_URI
+from ansible_collections.dellemc.openmanage.plugins.module_utils.job_handle import job_handle
 from ansible.module_utils.urls import ConnectionError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 
@@ -471,25 +487,26 @@ def upload_dup_file(rest_obj, module):
 def get_device_ids(rest_obj, module, device_id_tags):
     """Getting the list of device ids filtered from the device inventory."""
     device_id = []
-    resp = rest_obj.get_all_report_details("DeviceService/Devices")
-    if resp.get("report_list"):
-        device_resp = dict([(str(device['Id']), device['DeviceServiceTag']) for device in resp["report_list"]])
-        device_tags = map(str, device_id_tags)
-        invalid_tags = []
-        for tag in device_tags:
-            if tag in device_resp.keys():
-                device_id.append(tag)
-            elif tag in device_resp.values():
-                ids = list(device_resp.keys())[list(device_resp.values()).index(tag)]
-                device_id.append(ids)
-            else:
-                invalid_tags.append(tag)
-        if invalid_tags:
-            module.fail_json(
-                msg="Unable to complete the operation because the entered target device service"
-                    " tag(s) or device id(s) '{0}' are invalid.".format(",".join(set(invalid_tags))))
-    else:
+    device_tags = list(map(str, device_id_tags))
+    devices = rest_obj.resolve_devices(device_ids=[tag for tag in device_tags if tag.isdigit()],
+                                       service_tags=[tag for tag in device_tags if not tag.isdigit()],
+                                       select=DEVICE_IDENTITY_FIELDS)
+    device_resp = dict((str(device['Id']), device['DeviceServiceTag'])
+                       for resolved in (devices["Id"], devices["DeviceServiceTag"]) for device in resolved.values())
+    if not device_resp and not rest_obj.invoke_request("GET", DEVICE_URI, query_param={"$top": 1}).json_data.get("value"):
         module.fail_json(msg="Failed to fetch the device facts.")
+    invalid_tags = []
+    for tag in device_tags:
+        if tag.isdigit() and int(tag) in devices["Id"]:
+            device_id.append(tag)
+        elif tag in devices["DeviceServiceTag"]:
+            device_id.append(str(devices["DeviceServiceTag"][tag]["Id"]))
+        else:
+            invalid_tags.append(tag)
+    if invalid_tags:
+        module.fail_json(
+            msg="Unable to complete the operation because the entered target device service"
+                " tag(s) or device id(s) '{0}' are invalid.".format(",".join(set(invalid_tags))))
     return device_id, device_resp
 
 
@@ -679,7 +696,12 @@ def main():
         module.exit_json(msg=str(err), unreachable=True)
     except (IOError, ValueError, SSLError, TypeError, ConnectionError, AttributeError, OSError) as err:
         module.fail_json(msg=str(err))
-    module.exit_json(msg="Successfully submitted the firmware update job.", update_status=update_status, changed=True)
+    result = {}
+    if isinstance(update_status, dict) and update_status.get("Id") is not None:
+        result["job_handle"] = job_handle("ome", module.params, JOB_URI.format(job_id=update_status["Id"]),
+                                          job_id=str(update_status["Id"]))
+    module.exit_json(msg="Successfully submitted the firmware update job.", update_status=update_status, changed=True,
+                     **result)
 
 
 if __name__ == "__main__":
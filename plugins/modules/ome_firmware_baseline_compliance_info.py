@@ -225,7 +225,8 @@ error_info:
 
 import json
 from ssl import SSLError
-from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, OmeAnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, OmeAnsibleModule, \
+    DEVICE_IDENTITY_FIELDS
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 
@@ -249,16 +250,13 @@ def _get_device_id_from_service_tags(service_tags, rest_obj, module):
     :returns: dict eg: {1345:"MXL1245"}
     """
     try:
-        resp = rest_obj.get_all_report_details("DeviceService/Devices")
-        devices_list = resp["report_list"]
-        if devices_list:
-            service_tag_dict = {}
-            for item in devices_list:
-                if item["DeviceServiceTag"] in service_tags:
-                    service_tag_dict.update({item["Id"]: item["DeviceServiceTag"]})
-            return service_tag_dict
-        else:
-            module.exit_json(msg="Unable to fetch the device information.", baseline_compliance_info=[])
+        devices = rest_obj.resolve_devices(service_tags=service_tags, select=DEVICE_IDENTITY_FIELDS)["DeviceServiceTag"]
+        if devices:
+            return dict((device["Id"], tag) for tag, device in devices.items())
+        resp = rest_obj.invoke_request('GET', device_is_list_path, query_param={"$top": 1})
+        if resp.json_data.get("value"):
+            return {}
+        module.exit_json(msg="Unable to fetch the device information.", baseline_compliance_info=[])
     except (URLError, HTTPError, SSLValidationError, ConnectionError, TypeError, ValueError) as err:
         raise err
 
@@ -0,0 +1,270 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.8.0
+# Copyright (C) 2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+DOCUMENTATION = r"""
+---
+module: ome_idrac_job_wait
+short_description: Wait for jobs on many iDRACs and OpenManage Enterprise appliances
+version_added: "9.8.0"
+description:
+  - This module waits for the jobs of the job handles returned by M(dellemc.openmanage.idrac_firmware),
+    M(dellemc.openmanage.ome_firmware) and M(dellemc.openmanage.redfish_firmware).
+  - All the jobs are polled concurrently from a single process until every job is over or
+    I(job_wait_timeout) expires, so that long running jobs do not hold an Ansible fork each.
+options:
+  jobs:
+    description:
+      - List of job handles, as returned in C(job_handle) by the job producing modules.
+    type: list
+    elements: dict
+    required: true
+    suboptions:
+      api:
+        description:
+          - The interface through which the job is tracked.
+        type: str
+        choices: [idrac, ome, redfish]
+        required: true
+      host:
+        description:
+          - IP address or hostname of the iDRAC or OpenManage Enterprise.
+        type: str
+        required: true
+      port:
+        description:
+          - Port of the iDRAC or OpenManage Enterprise.
+          - The port is C(443) when not provided.
+        type: int
+      job_uri:
+        description:
+          - URI of the job resource.
+        type: str
+        required: true
+      job_id:
+        description:
+          - ID of the job.
+        type: str
+      state_map:
+        description:
+          - Name of the table of job states which tells when the job is over and whether it failed.
+          - C(idrac) waits until an iDRAC job is completed, and C(idrac_staged) also accepts a scheduled job.
+          - C(ome_info) and C(ome) wait for OpenManage Enterprise jobs, C(redfish_task) for Redfish tasks
+            and C(redfish_job) for Redfish jobs.
+          - The default is C(idrac) for I(api) C(idrac), C(ome_info) for C(ome) and C(redfish_task) for C(redfish).
+        type: str
+        choices: [idrac, idrac_staged, idrac_progress, ome, ome_info, ome_progress, redfish_task, redfish_progress,
+                  redfish_job]
+      username:
+        description:
+          - Username of the host of the job, which overrides I(username).
+        type: str
+      password:
+        description:
+          - Password of the host of the job, which overrides I(password).
+        type: str
+  username:
+    description:
+      - Username used for all jobs which do not provide their own I(username).
+    type: str
+  password:
+    description:
+      - Password used for all jobs which do not provide their own I(password).
+    type: str
+  validate_certs:
+    description:
+     - If C(false), the SSL certificates will not be validated.
+     - Configure C(false) only on personally controlled sites where self-signed certificates are used.
+    type: bool
+    default: true
+  ca_path:
+    description:
+     - The Privacy Enhanced Mail (PEM) file that contains a CA certificate to be used for the validation.
+    type: path
+  timeout:
+    description:
+     - The https socket level timeout in seconds.
+    type: int
+    default: 30
+  job_wait_timeout:
+    description:
+      - The maximum wait time in seconds for all the jobs together.
+    type: int
+    default: 3600
+  poll_interval:
+    description:
+      - The longest interval in seconds between two polls of the same job.
+      - Jobs are polled within seconds after the module starts and the interval then doubles up to
+        I(poll_interval).
+    type: int
+    default: 30
+  workers:
+    description:
+      - The maximum number of jobs polled at the same time.
+    type: int
+    default: 16
+requirements:
+  - "python >= 3.9.6"
+author:
+  - "Dell Technologies (@dell)"
+notes:
+    - Run this module from a system that has direct access to the iDRACs and OpenManage Enterprise appliances.
+    - Unreachable hosts are polled again until I(job_wait_timeout) expires, because hosts often restart while a job runs.
+    - This module supports C(check_mode).
+"""
+
+EXAMPLES = r"""
+---
+- name: Stage firmware updates without waiting for them
+  dellemc.openmanage.idrac_firmware:
+    idrac_ip: "{{ inventory_hostname }}"
+    idrac_user: "user_name"
+    idrac_password: "user_password"
+    ca_path: "/path/to/ca_cert.pem"
+    share_name: "http://192.168.0.1/firmware_repo"
+    reboot: true
+    job_wait: false
+  register: firmware
+
+- name: Wait for the firmware update jobs of all the hosts
+  dellemc.openmanage.ome_idrac_job_wait:
+    username: "user_name"
+    password: "user_password"
+    ca_path: "/path/to/ca_cert.pem"
+    jobs: "{{ ansible_play_hosts | map('extract', hostvars, ['firmware', 'job_handle']) | list }}"
+    job_wait_timeout: 7200
+  run_once: true
+
+- name: Wait for an OpenManage Enterprise job with its own credentials
+  dellemc.openmanage.ome_idrac_job_wait:
+    jobs:
+      - api: ome
+        host: 192.168.0.1
+        job_uri: "JobService/Jobs(10011)"
+        job_id: "10011"
+        username: "user_name"
+        password: "user_password"
+    ca_path: "/path/to/ca_cert.pem"
+"""
+
+RETURN = r'''
+---
+msg:
+  description: Overall status of the jobs.
+  returned: always
+  type: str
+  sample: "Successfully completed all the 2 jobs."
+summary:
+  description: Number of jobs by status.
+  returned: always
+  type: dict
+  sample: {"completed": 1, "failed": 1, "timeout": 0, "error": 0}
+jobs:
+  description:
+    - Result of every job in the order of I(jobs).
+    - C(status) is C(completed), C(failed), C(timeout) or C(error). C(error) means that the host
+      rejected the request for the job, for example because the job does not exist.
+  returned: always
+  type: list
+  sample: [{
+      "api": "idrac",
+      "host": "192.168.0.2",
+      "port": 443,
+      "job_uri": "/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/JID_123456789012",
+      "job_id": "JID_123456789012",
+      "state_map": "idrac",
+      "status": "completed",
+      "state": "Completed",
+      "job": {
+          "Id": "JID_123456789012",
+          "JobState": "Completed",
+          "JobStatus": "OK",
+          "Message": "Job completed successfully.",
+          "PercentComplete": 100
+      },
+      "polls": 7,
+      "errors": 2,
+      "error": null,
+      "elapsed": 412.5
+  }]
+'''
+
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.job_handle import JobFleet, DEFAULT_STATE_MAPS
+from ansible_collections.dellemc.openmanage.plugins.module_utils.instrumentation import InstrumentedModuleMixin
+
+SUCCESS_MSG = "Successfully completed all the {0} jobs."
+NOT_COMPLETED_MSG = "{0} of the {1} jobs did not complete successfully."
+CREDENTIALS_MSG = "Unable to track the job {0} on {1} because the username and password are not provided."
+JOB_STATUSES = ("completed", "failed", "timeout", "error")
+
+
+class JobWaitAnsibleModule(InstrumentedModuleMixin, AnsibleModule):
+    """Module which returns the job timings under debug when OMAM_INSTRUMENTATION is set"""
+
+
+def validate_credentials(module):
+    for job in module.params["jobs"]:
+        if not ((job.get("username") or module.params.get("username")) and
+                (job.get("password") or module.params.get("password"))):
+            module.fail_json(msg=CREDENTIALS_MSG.format(job.get("job_id") or job["job_uri"], job["host"]))
+
+
+def main():
+    specs = {
+        "jobs": {
+            "type": "list", "elements": "dict", "required": True,
+            "options": {
+                "api": {"type": "str", "required": True, "choices": ["idrac", "ome", "redfish"]},
+                "host": {"type": "str", "required": True},
+                "port": {"type": "int"},
+                "job_uri": {"type": "str", "required": True},
+                "job_id": {"type": "str"},
+                "state_map": {"type": "str", "choices": ["idrac", "idrac_staged", "idrac_progress", "ome", "ome_info",
+                                                         "ome_progress", "redfish_task", "redfish_progress",
+                                                         "redfish_job"]},
+                "username": {"type": "str"},
+                "password": {"type": "str", "no_log": True},
+            },
+        },
+        "username": {"type": "str"},
+        "password": {"type": "str", "no_log": True},
+        "validate_certs": {"type": "bool", "default": True},
+        "ca_path": {"type": "path"},
+        "timeout": {"type": "int", "default": 30},
+        "job_wait_timeout": {"type": "int", "default": 3600},
+        "poll_interval": {"type": "int", "default": 30},
+        "workers": {"type": "int", "default": 16},
+    }
+    module = JobWaitAnsibleModule(argument_spec=specs, supports_check_mode=True)
+    validate_credentials(module)
+    handles = []
+    for job in module.params["jobs"]:
+        handle = dict(job)
+        handle["state_map"] = job.get("state_map") or DEFAULT_STATE_MAPS[job["api"]]
+        handles.append(handle)
+    fleet = JobFleet(handles, module.params, module.params["job_wait_timeout"], module.params["poll_interval"],
+                     workers=module.params["workers"])
+    results = fleet.wait()
+    summary = dict((status, len([job for job in results if job["status"] == status])) for status in JOB_STATUSES)
+    if summary["completed"] == len(results):
+        module.exit_json(msg=SUCCESS_MSG.format(len(results)), summary=summary, jobs=results)
+    module.fail_json(msg=NOT_COMPLETED_MSG.format(len(results) - summary["completed"], len(results)),
+                     summary=summary, jobs=results)
+
+
+if __name__ == '__main__':
+    main()
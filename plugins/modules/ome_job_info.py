@@ -292,8 +292,10 @@ job_info:
 '''
 
 import json
+from functools import partial
 from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, OmeAnsibleModule
 from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import strip_substr_dict, remove_key
+from ansible_collections.dellemc.openmanage.plugins.module_utils.concurrency import fan_out
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 
@@ -395,14 +397,12 @@ def main():
                     resp_status.append(resp.status_code)
                 else:
                     # Fetch all jobs, filter and pagination options
-                    job_report = rest_obj.get_all_report_details(JOBS_URI)
-                    job_facts = {"value": job_report["report_list"]}
-                    job_facts = remove_key(job_facts)
+                    job_facts = {"value": [remove_key(job) for job in rest_obj.iter_items_with_pagination(JOBS_URI)]}
                     if len(job_facts["value"]) > 0:
                         resp_status.append(200)
-                for each_value in job_facts["value"]:
-                    job_id = each_value["Id"] if "Id" in each_value else None
-                    last_execution = last_execution_detail_of_a_job(rest_obj, job_id)
+                job_ids = [each_value["Id"] if "Id" in each_value else None for each_value in job_facts["value"]]
+                last_executions = fan_out(partial(last_execution_detail_of_a_job, rest_obj), job_ids)
+                for each_value, last_execution in zip(job_facts["value"], last_executions):
                     each_value.update({'ExecutionHistories': [],
                                        'LastExecutionDetail': last_execution})
     except HTTPError as httperr:
@@ -37,7 +37,9 @@ options:
         default: HTTP
         choices: ["CIFS", "FTP", "HTTP", "HTTPS", "NSF", "OEM", "SCP", "SFTP", "TFTP"]
     job_wait:
-        description: Provides the option to wait for job completion.
+        description:
+          - Provides the option to wait for job completion.
+          - When C(false), the module returns C(job_handle), which M(dellemc.openmanage.ome_idrac_job_wait) tracks.
         type: bool
         default: true
     job_wait_timeout:
@@ -111,6 +113,20 @@ task:
         "id": "JID_XXXXXXXXXXXX",
         "uri": "/redfish/v1/TaskService/Tasks/JID_XXXXXXXXXXXX"
     }
+job_handle:
+  type: dict
+  description:
+    - Handle of the firmware update job, which M(dellemc.openmanage.ome_idrac_job_wait) tracks.
+    - It contains the host and port but no credentials.
+  returned: when I(job_wait) is C(false)
+  sample: {
+        "api": "redfish",
+        "host": "192.168.0.1",
+        "port": null,
+        "job_uri": "/redfish/v1/JobService/Jobs/JID_XXXXXXXXXXXX",
+        "job_id": "JID_XXXXXXXXXXXX",
+        "state_map": "redfish_job"
+    }
 error_info:
   type: dict
   description: Details of http error.
@@ -142,9 +158,11 @@ error_info:
 
 import json
 import os
-import time
 from ssl import SSLError
 from ansible_collections.dellemc.openmanage.plugins.module_utils.redfish import Redfish, RedfishAnsibleModule
+from ansible_collections.dellemc.openmanage.plugins.module_utils.job_handle import job_handle
+from ansible_collections.dellemc.openmanage.plugins.module_utils.job_state import JobStateEngine, REDFISH_JOB_STATES, \
+    json_document
 from ansible.module_utils.basic import missing_required_lib
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
@@ -228,25 +246,20 @@ def firmware_update(obj, module):
 def wait_for_job_completion(module, job_uri, job_wait_timeout=900, interval=30):
     try:
         with Redfish(module.params, req_session=False) as obj:
-            track_counter = 0
             final_jobstatus = ""
             job_msg = ""
-            while track_counter <= job_wait_timeout:
-                try:
-                    response = obj.invoke_request("GET", "{0}{1}".format(obj.root_uri, job_uri))
-                    if response.json_data.get("PercentComplete") == 100 and response.json_data.get("JobState") == "Completed":
-                        if response.json_data.get("JobStatus") == "OK":
-                            final_jobstatus = JOBSTATUS_SUCCESS
-                            job_msg = SUCCESS_JOB_MSG
-                        else:
-                            final_jobstatus = JOBSTATUS_FAILED
-                            job_msg = FAIL_JOB_MSG
-                        break
-                    track_counter += interval
-                    time.sleep(interval)
-                except (HTTPError, URLError):
-                    track_counter += interval
-                    time.sleep(interval)
+            engine = JobStateEngine(REDFISH_JOB_STATES, job_wait_timeout, interval, first_delay=0, max_errors=None,
+                                    tolerated=(HTTPError, URLError), document=json_document)
+            outcome = engine.wait(lambda: obj.invoke_request("GET", "{0}{1}".format(obj.root_uri, job_uri)),
+                                  job_id=job_uri)
+            response = outcome.job
+            if outcome.done:
+                if not outcome.failed:
+                    final_jobstatus = JOBSTATUS_SUCCESS
+                    job_msg = SUCCESS_JOB_MSG
+                else:
+                    final_jobstatus = JOBSTATUS_FAILED
+                    job_msg = FAIL_JOB_MSG
             # TIMED OUT
             # when job is scheduled
             if not final_jobstatus:
@@ -297,7 +310,10 @@ def main():
             else:
                 module.exit_json(msg=job_msg, task={"id": job_id, "uri": JOB_URI.format(job_id=job_id)}, changed=True)
         else:
-            module.exit_json(msg=message, task={"id": job_id, "uri": JOB_URI.format(job_id=job_id)}, changed=True)
+            handle = job_handle("redfish", module.params, "/redfish/v1/" + JOB_URI.format(job_id=job_id),
+                                job_id=job_id, state_map=REDFISH_JOB_STATES.name)
+            module.exit_json(msg=message, task={"id": job_id, "uri": JOB_URI.format(job_id=job_id)}, changed=True,
+                             job_handle=handle)
     except HTTPError as err:
         module.exit_json(msg=str(err), error_info=json.load(err), failed=True)
     except (RuntimeError, URLError, SSLValidationError, ConnectionError, KeyError,
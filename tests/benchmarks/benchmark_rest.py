@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.8.0
+# Copyright (C) 2024 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+"""
+Wall clock benchmarks of the REST layer against a local HTTPS stand-in of an appliance.
+They print their timings and assert nothing, so they are kept out of the unit tests.
+Run them, all or by name, from the root of the collection with:
+
+    PYTHONPATH=<collections root> python tests/benchmarks/benchmark_rest.py [name ...]
+"""
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import argparse
+import gzip
+import json
+import os
+import shutil
+import tempfile
+import time
+import zlib
+from mock import MagicMock
+from ansible.module_utils.six.moves.urllib.parse import parse_qs, urlparse
+from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME
+from ansible_collections.dellemc.openmanage.plugins.module_utils.transport import COMPRESSION_ENV
+from ansible_collections.dellemc.openmanage.plugins.module_utils import ome, idrac_redfish, redfish, rest_api, \
+    session_utils
+from ansible_collections.dellemc.openmanage.tests.unit.plugins.stand_in import create_stand_in_cert, \
+    start_stand_in, stop_stand_in
+
+BENCHMARKS = []
+JSON_HEADERS = {"Content-Type": "application/json"}
+POOL_REQUESTS = 500
+JSON_READS = 5
+INVENTORY_DEVICES = 20000
+RESPONSE_MODULES = [ome, idrac_redfish, redfish, rest_api, session_utils]
+
+
+def benchmark(func):
+    BENCHMARKS.append(func)
+    return func
+
+
+def ome_params(stand_in):
+    return {"hostname": "127.0.0.1", "username": "admin", "password": "password",
+            "port": stand_in.port, "validate_certs": False, "timeout": 10}
+
+
+def inventory_payload():
+    devices = [{"Id": idx, "DeviceServiceTag": "SVC{0:05d}".format(idx), "Model": "PowerEdge R750",
+                "DeviceManagement": [{"NetworkAddress": "10.0.{0}.{1}".format(idx // 250, idx % 250),
+                                      "MacAddress": "00:00:00:00:00:00", "ManagementType": 2}],
+                "Status": 1000, "Type": 1000, "Actions": None, "SlotConfiguration": {}}
+               for idx in range(INVENTORY_DEVICES)]
+    return json.dumps({"@odata.count": len(devices), "value": devices}).encode()
+
+
+@benchmark
+def keep_alive_pool(stand_in):
+    """Wall clock of 500 requests with and without the keep-alive pool"""
+    for pool_size in (0, 4):
+        connections = stand_in.connections
+        start = time.perf_counter()
+        with RestOME(ome_params(stand_in), pool_size=pool_size) as obj:
+            for dummy in range(POOL_REQUESTS):
+                obj.invoke_request("GET", "DeviceService/Devices")
+        print("pool size {0}: {1} requests in {2:.2f}s over {3} connections".format(
+            pool_size, POOL_REQUESTS, time.perf_counter() - start, stand_in.connections - connections))
+
+
+@benchmark
+def json_data_decoded_once(stand_in):
+    """Repeated json_data reads of a multi-megabyte inventory, decoded on every read and cached"""
+    payload = inventory_payload()
+    start = time.perf_counter()
+    for dummy in range(JSON_READS):
+        json.loads(payload)
+    decode_every_read = time.perf_counter() - start
+    for util in RESPONSE_MODULES:
+        resp = MagicMock()
+        resp.read.return_value = payload
+        response = util.OpenURLResponse(resp)
+        start = time.perf_counter()
+        for dummy in range(JSON_READS):
+            response.json_data
+        print("{0}: {1} reads of {2:.1f} MB, decoded every read {3:.3f}s, cached {4:.3f}s".format(
+            util.__name__.split(".")[-1], JSON_READS, len(payload) / 1e6, decode_every_read,
+            time.perf_counter() - start))
+
+
+def compressing_route(payload):
+    def route(handler, body):
+        accept = handler.headers.get("Accept-Encoding", "")
+        if "gzip" in accept:
+            return 200, dict(JSON_HEADERS, **{"Content-Encoding": "gzip"}), gzip.compress(payload)
+        if "deflate" in accept:
+            return 200, dict(JSON_HEADERS, **{"Content-Encoding": "deflate"}), zlib.compress(payload)
+        return 200, JSON_HEADERS, payload
+    return route
+
+
+@benchmark
+def compressed_inventory(stand_in):
+    """Bytes on the wire and wall clock of a 5 MB inventory fetch with and without compression"""
+    stand_in.routes["/api/DeviceService/Devices"] = compressing_route(inventory_payload())
+    compression = os.environ.get(COMPRESSION_ENV)
+    try:
+        for enabled in ("false", "true"):
+            os.environ[COMPRESSION_ENV] = enabled
+            with RestOME(ome_params(stand_in), pool_size=1) as obj:
+                start = time.perf_counter()
+                resp = obj.invoke_request("GET", "DeviceService/Devices")
+                resp.json_data
+                print("compression {0}: {1:.2f} MB in {2:.3f}s".format(
+                    enabled, int(resp.resp.headers["Content-Length"]) / 1e6, time.perf_counter() - start))
+    finally:
+        if compression is None:
+            os.environ.pop(COMPRESSION_ENV, None)
+        else:
+            os.environ[COMPRESSION_ENV] = compression
+
+
+def paged_route(total, latency):
+    """Serves $top/$skip pages of a collection of ``total`` devices after ``latency`` seconds"""
+    def route(handler, body):
+        query = parse_qs(urlparse(handler.path).query)
+        skip = int(query.get("$skip", [0])[0])
+        top = int(query.get("$top", [100])[0])
+        time.sleep(latency)
+        value = [{"Id": idx} for idx in range(skip, min(skip + top, total))]
+        return 200, JSON_HEADERS, {"@odata.count": total, "value": value}
+    return route
+
+
+@benchmark
+def concurrent_pages(stand_in):
+    """Wall clock of an 8000 device collection paged 100 at a time, sequential and with 8 workers"""
+    stand_in.routes["/api/DeviceService/Devices"] = paged_route(8000, 0.01)
+    for workers in (1, 8):
+        with RestOME(ome_params(stand_in), pool_size=workers, page_workers=workers) as obj:
+            start = time.perf_counter()
+            obj.get_all_report_details("DeviceService/Devices")
+            print("{0} workers: 80 pages in {1:.2f}s".format(workers, time.perf_counter() - start))
+
+
+def selecting_route(payload, supported=True):
+    """Serves the inventory, projected to $select when supported and rejecting $select otherwise"""
+    devices = json.loads(payload)
+    projections = {}
+
+    def route(handler, body):
+        query = parse_qs(urlparse(handler.path).query)
+        if "$select" not in query:
+            return 200, JSON_HEADERS, payload
+        if not supported:
+            return 400, JSON_HEADERS, {"error": {"message": "Invalid $select"}}
+        fields = query["$select"][0].split(",")
+        if query["$select"][0] not in projections:
+            value = [dict((k, v) for k, v in item.items() if k in fields) for item in devices["value"]]
+            projections[query["$select"][0]] = json.dumps({"@odata.count": len(value), "value": value}).encode()
+        return 200, JSON_HEADERS, projections[query["$select"][0]]
+    return route
+
+
+@benchmark
+def select_inventory(stand_in):
+    """Payload size and wall clock of a device collection fetched in full and with $select"""
+    stand_in.routes["/api/DeviceService/Devices"] = selecting_route(inventory_payload())
+    for select in (None, ["Id", "DeviceServiceTag", "DeviceManagement"]):
+        with RestOME(ome_params(stand_in), pool_size=1) as obj:
+            start = time.perf_counter()
+            report = obj.get_all_report_details("DeviceService/Devices", select=select)
+            print("{0}: {1:.1f} MB in {2:.3f}s".format(
+                "$select " + ",".join(select) if select else "full", int(
+                    report["resp_obj"].resp.headers["Content-Length"]) / 1e6, time.perf_counter() - start))
+
+
+def device_filter_route(total, page_size=1000):
+    """Serves $top/$skip pages of ``total`` devices, narrowed by a '$filter' of 'or' clauses"""
+    devices = [{"Id": 10000 + idx, "DeviceServiceTag": "SVC{0:05d}".format(idx), "Model": "PowerEdge R750",
+                "DeviceManagement": [{"NetworkAddress": "10.0.{0}.{1}".format(idx // 250, idx % 250)}]}
+               for idx in range(total)]
+
+    def route(handler, body):
+        query = parse_qs(urlparse(handler.path).query)
+        value = devices
+        if "$filter" in query:
+            clauses = [clause.split(" eq ") for clause in query["$filter"][0].split(" or ")]
+            value = [device for device in devices
+                     if any(str(device[field]) == match.strip("'") for field, match in clauses)]
+        skip = int(query.get("$skip", [0])[0])
+        top = int(query.get("$top", [page_size])[0])
+        return 200, JSON_HEADERS, {"@odata.count": len(value), "value": value[skip:skip + top]}
+    return route
+
+
+@benchmark
+def resolve_service_tags(stand_in):
+    """Requests and wall clock to resolve 2 and 200 service tags out of 8000 devices"""
+    stand_in.routes["/api/DeviceService/Devices"] = device_filter_route(8000)
+    for count in (2, 200):
+        tags = ["SVC{0:05d}".format(idx * 37) for idx in range(count)]
+        with RestOME(ome_params(stand_in), pool_size=1) as obj:
+            start = time.perf_counter()
+            obj.get_all_report_details("DeviceService/Devices")
+            full_download = time.perf_counter() - start
+            start = time.perf_counter()
+            obj.resolve_devices(service_tags=tags, select=["Id", "DeviceServiceTag"])
+            stats = obj.device_resolutions[0]
+            print("{0} tags: {1} strategy, {2} requests in {3:.3f}s, full download {4:.3f}s".format(
+                count, stats["strategy"], stats["requests"], time.perf_counter() - start, full_download))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("names", nargs="*", help="benchmarks to run, all of them by default: {0}".format(
+        ", ".join(func.__name__ for func in BENCHMARKS)))
+    names = parser.parse_args().names
+    unknown = set(names).difference(func.__name__ for func in BENCHMARKS)
+    if unknown:
+        parser.error("unknown benchmarks: {0}".format(", ".join(sorted(unknown))))
+    cert_dir = tempfile.mkdtemp()
+    try:
+        cert = create_stand_in_cert(cert_dir)
+        for func in BENCHMARKS:
+            if names and func.__name__ not in names:
+                continue
+            print("{0}: {1}".format(func.__name__, func.__doc__))
+            stand_in = start_stand_in(cert)
+            try:
+                func(stand_in)
+            finally:
+                stop_stand_in(stand_in)
+    finally:
+        shutil.rmtree(cert_dir)
+
+
+if __name__ == "__main__":
+    main()
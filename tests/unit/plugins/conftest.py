@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.8.0
+# Copyright (C) 2024 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import pytest
+from ansible_collections.dellemc.openmanage.tests.unit.plugins.stand_in import create_stand_in_cert, \
+    start_stand_in, stop_stand_in
+
+
+@pytest.fixture(scope="session")
+def stand_in_cert(tmp_path_factory):
+    pytest.importorskip("cryptography")
+    return create_stand_in_cert(str(tmp_path_factory.mktemp("stand_in")))
+
+
+@pytest.fixture
+def https_stand_in(stand_in_cert, monkeypatch):
+    """Starts a local HTTPS stand-in for an OME or iDRAC appliance"""
+    for proxy in ("https_proxy", "HTTPS_PROXY", "http_proxy", "HTTP_PROXY"):
+        monkeypatch.delenv(proxy, raising=False)
+    server = start_stand_in(stand_in_cert)
+    yield server
+    stop_stand_in(server)
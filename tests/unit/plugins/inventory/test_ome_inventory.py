@@ -0,0 +1,304 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.8.0
+# Copyright (C) 2024 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import threading
+
+import pytest
+from ansible import constants as C
+from ansible.inventory.data import InventoryData
+from ansible.parsing.dataloader import DataLoader
+from ansible.plugins.loader import fragment_loader
+from ansible.utils.plugin_docs import get_docstring
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible_collections.dellemc.openmanage.plugins.inventory import ome_inventory
+
+PLUGIN = "dellemc.openmanage.ome_inventory"
+JSON = {"Content-Type": "application/json"}
+
+
+def group(group_id, name, parent_id=0):
+    return {"Id": group_id, "Name": name, "ParentId": parent_id, "Visible": True,
+            "AllLeafDevices@odata.navigationLink": "/api/GroupService/Groups({0})/AllLeafDevices".format(group_id),
+            "SubGroups@odata.navigationLink": "/api/GroupService/Groups({0})/SubGroups".format(group_id)}
+
+
+def device(device_id, address):
+    return {"Id": device_id, "DeviceManagement": [{"NetworkAddress": address}]}
+
+
+GROUPS = {"report_list": [group(1, "All Devices"), group(2, "Servers", 1)]}
+DEVICES = {"report_list": [device(10, "192.168.0.2")]}
+
+
+def pages(ome, uri, **kwargs):
+    if uri == "DeviceService/Devices":
+        return DEVICES
+    return {"report_list": [{"Id": 10}]}
+
+
+@pytest.fixture
+def plugin():
+    options = get_docstring(ome_inventory.__file__, fragment_loader)[0]["options"]
+    C.config.initialize_plugin_configuration_definitions("inventory", PLUGIN, options)
+    inventory_plugin = ome_inventory.InventoryModule()
+    inventory_plugin._load_name = PLUGIN
+    inventory_plugin._redirected_names = [PLUGIN]
+    return inventory_plugin
+
+
+@pytest.fixture
+def ome_stub(mocker):
+    mocker.patch.object(ome_inventory, "RestOME")
+    mocker.patch.object(ome_inventory, "get_all_data_with_pagination", side_effect=pages)
+
+
+def inventory_file(tmp_path, hostname="192.168.0.1", **options):
+    config = dict(plugin=PLUGIN, hostname=hostname, username="user", password="pass", **options)
+    path = tmp_path / "ome.yml"
+    path.write_text("\n".join("{0}: {1}".format(key, value) for key, value in config.items()))
+    return str(path)
+
+
+def parse(plugin, path, cache=True):
+    inventory = InventoryData()
+    plugin.parse(inventory, DataLoader(), path, cache=cache)
+    plugin.update_cache_if_changed()
+    return inventory
+
+
+def test_parse_without_cache(plugin, ome_stub, mocker, tmp_path):
+    resp = mocker.patch.object(plugin, "_get_connection_resp", return_value=GROUPS)
+    inventory = parse(plugin, inventory_file(tmp_path))
+    parse(plugin, inventory_file(tmp_path))
+    assert resp.call_count == 2
+    assert inventory.groups["All Devices"].child_groups[0].name == "Servers"
+    assert inventory.hosts["192.168.0.2"].vars["idrac_ip"] == "192.168.0.2"
+
+
+def test_parse_served_from_fresh_cache(plugin, ome_stub, mocker, tmp_path):
+    resp = mocker.patch.object(plugin, "_get_connection_resp", return_value=GROUPS)
+    path = inventory_file(tmp_path, cache="true", cache_plugin="jsonfile",
+                          cache_connection=str(tmp_path / "cache"), cache_timeout=3600)
+    first = parse(plugin, path)
+    second = parse(plugin, path)
+    assert resp.call_count == 1
+    assert sorted(second.groups) == sorted(first.groups)
+    assert second.groups["All Devices"].child_groups[0].name == "Servers"
+    assert second.hosts["192.168.0.2"].vars["baseuri"] == "192.168.0.2"
+    parse(plugin, path, cache=False)
+    assert resp.call_count == 2
+
+
+def test_parse_uses_one_session_and_connection(plugin, https_stand_in, stand_in_cert, tmp_path):
+    sub_groups = [group(group_id, "Group{0}".format(group_id), 1) for group_id in range(2, 12)]
+    routes = {"/api/GroupService/Groups": [group(1, "All Devices")] + sub_groups,
+              "/api/GroupService/Groups(1)/AllLeafDevices": [{"Id": item["Id"]} for item in sub_groups],
+              "/api/DeviceService/Devices": [device(item["Id"], "192.168.1.{0}".format(item["Id"]))
+                                             for item in sub_groups]}
+    for item in sub_groups:
+        routes["/api/GroupService/Groups({0})/AllLeafDevices".format(item["Id"])] = [{"Id": item["Id"]}]
+    for path, value in routes.items():
+        https_stand_in.routes[path] = (200, JSON, {"@odata.count": len(value), "value": value})
+    https_stand_in.routes["/api/SessionService/Sessions"] = (201, dict(JSON, **{"X-Auth-Token": "token"}), {"Id": "1"})
+    inventory = parse(plugin, inventory_file(tmp_path, hostname="127.0.0.1", port=https_stand_in.port,
+                                             validate_certs="true", ca_path=stand_in_cert[0], workers=1))
+    assert len(inventory.groups["All Devices"].child_groups) == 10
+    assert len(inventory.hosts) == 10
+    logins = [request for request in https_stand_in.requests if request["method"] == "POST"]
+    assert len(logins) == 1
+    assert https_stand_in.connections == 1
+    assert all(request["headers"].get("X-Auth-Token") == "token" for request in https_stand_in.requests[1:])
+    assert https_stand_in.requests[-1]["method"] == "DELETE"
+    assert not [request for request in https_stand_in.requests if "SubGroups" in request["path"]]
+    assert len(https_stand_in.requests) == 1 + 1 + 11 + 1 + 1
+
+
+def test_group_tree_built_from_group_listing(plugin, mocker, tmp_path):
+    all_groups = [group(1, "All Devices"), group(2, "Group2", 1), group(3, "Group3", 1), group(4, "Group4", 1),
+                  group(5, "Group5", 2), group(6, "Group6", 2), group(7, "Group7", 4), group(8, "Other", 99),
+                  dict(group(9, "Hidden", 1), Visible=False), group(10, "HiddenChild", 9)]
+    last_group = threading.Event()
+
+    def tree_pages(ome, uri, **kwargs):
+        if uri == "DeviceService/Devices":
+            return {"report_list": [device(group_id, "192.168.1.{0}".format(group_id)) for group_id in range(1, 11)]}
+        group_id = int(uri.split("(")[1].split(")")[0])
+        if group_id == 2:
+            assert last_group.wait(5)
+        elif group_id == 7:
+            last_group.set()
+        return {"report_list": [{"Id": group_id}]}
+    mocker.patch.object(ome_inventory, "RestOME")
+    pages_mock = mocker.patch.object(ome_inventory, "get_all_data_with_pagination", side_effect=tree_pages)
+    mocker.patch.object(plugin, "_get_connection_resp", return_value={"report_list": all_groups})
+    inventory = parse(plugin, inventory_file(tmp_path, workers=4))
+    assert [name for name in inventory.groups if name.startswith(("Group", "Other", "Hidden"))] == \
+        ["Group2", "Group3", "Group4", "Group5", "Group6", "Group7"]
+    assert list(inventory.hosts) == ["192.168.1.{0}".format(group_id) for group_id in range(1, 8)]
+    assert [child.name for child in inventory.groups["Group2"].child_groups] == ["Group5", "Group6"]
+    assert [child.name for child in inventory.groups["Group4"].child_groups] == ["Group7"]
+    assert pages_mock.call_count == 7 + 1
+
+
+def test_device_in_many_groups_added_once(plugin, mocker, tmp_path):
+    all_groups = [group(1, "All Devices"), group(2, "Servers", 1), group(3, "Rack1", 1)]
+    devices = {"report_list": [device(10, "192.168.0.2"), device(11, "192.168.0.3"), device(12, "[fe80::1]")]}
+    members = {1: [10, 11, 12, 13], 2: [10, 11], 3: [10, 10]}
+
+    def member_pages(ome, uri, **kwargs):
+        if uri == "DeviceService/Devices":
+            return devices
+        return {"report_list": [{"Id": device_id} for device_id in members[int(uri.split("(")[1].split(")")[0])]]}
+    mocker.patch.object(ome_inventory, "RestOME")
+    mocker.patch.object(ome_inventory, "get_all_data_with_pagination", side_effect=member_pages)
+    mocker.patch.object(plugin, "_get_connection_resp", return_value={"report_list": all_groups})
+    set_host_vars = mocker.spy(plugin, "_set_host_vars")
+    inventory = parse(plugin, inventory_file(tmp_path))
+    assert list(inventory.hosts) == ["192.168.0.2", "192.168.0.3", "fe80::1"]
+    assert [item.name for item in inventory.hosts["192.168.0.2"].groups] == ["All Devices", "Servers", "Rack1"]
+    assert [hst.name for hst in inventory.groups["Rack1"].hosts] == ["192.168.0.2"]
+    assert set_host_vars.call_count == 3
+
+
+class IncrementalOME(object):
+    """OME group listing, members and devices which the incremental tests change between runs"""
+
+    def __init__(self):
+        self.groups = [dict(group(1, "All Devices"), UpdatedTime="2024-01-01 00:00:00.000"),
+                       dict(group(2, "Servers", 1), UpdatedTime="2024-01-01 00:00:00.000")]
+        self.members = {1: [10, 11], 2: [10]}
+        self.devices = {10: dict(device(10, "192.168.0.2"), LastInventoryTime="2024-01-02 00:00:00.000"),
+                        11: dict(device(11, "192.168.0.3"), LastInventoryTime="2024-01-03 00:00:00.000")}
+        self.filter_supported = True
+        self.calls = []
+
+    def pages(self, ome, uri, query_param=None, **kwargs):
+        self.calls.append((uri, query_param))
+        if uri != "DeviceService/Devices":
+            return {"report_list": [{"Id": device_id} for device_id in self.members[int(uri.split("(")[1].split(")")[0])]]}
+        if query_param is None:
+            return {"report_list": list(self.devices.values())}
+        if not self.filter_supported:
+            raise HTTPError("https://192.168.0.1/api/DeviceService/Devices", 400, "Bad Request", {}, None)
+        watermark = query_param["$filter"].split("'")[1]
+        return {"report_list": [mgmt for mgmt in self.devices.values() if mgmt["LastInventoryTime"] >= watermark]}
+
+    def resolve_devices(self, device_ids=None, select=None):
+        self.calls.append(("resolve_devices", device_ids))
+        return {"Id": dict((device_id, self.devices[device_id]) for device_id in device_ids if device_id in self.devices),
+                "DeviceServiceTag": {}}
+
+
+@pytest.fixture
+def incremental_ome(plugin, mocker):
+    ome = IncrementalOME()
+    rest_ome = mocker.patch.object(ome_inventory, "RestOME")
+    rest_ome.return_value.__enter__.return_value.resolve_devices.side_effect = ome.resolve_devices
+    mocker.patch.object(ome_inventory, "get_all_data_with_pagination", side_effect=ome.pages)
+    mocker.patch.object(plugin, "_get_connection_resp", side_effect=lambda: {"report_list": ome.groups})
+    return ome
+
+
+def incremental_file(tmp_path, **options):
+    return inventory_file(tmp_path, cache="true", cache_plugin="jsonfile", cache_connection=str(tmp_path / "cache"),
+                          cache_timeout=3600, incremental="true", **options)
+
+
+def test_incremental_refresh_fetches_changed_devices(plugin, incremental_ome, tmp_path):
+    path = incremental_file(tmp_path)
+    parse(plugin, path)
+    assert incremental_ome.calls[0] == ("DeviceService/Devices", None)
+    incremental_ome.calls = []
+    incremental_ome.devices[11] = dict(device(11, "192.168.0.4"), LastInventoryTime="2024-01-04 00:00:00.000")
+    inventory = parse(plugin, path)
+    assert incremental_ome.calls == [("DeviceService/Devices", {"$filter": "LastInventoryTime ge '2024-01-03 00:00:00.000'"})]
+    assert list(inventory.hosts) == ["192.168.0.2", "192.168.0.4"]
+    assert [hst.name for hst in inventory.groups["Servers"].hosts] == ["192.168.0.2"]
+    incremental_ome.calls = []
+    parse(plugin, path, cache=False)
+    assert incremental_ome.calls[0] == ("DeviceService/Devices", None)
+    assert len(incremental_ome.calls) == 1 + 2
+
+
+def test_incremental_refresh_fetches_members_of_updated_groups(plugin, incremental_ome, tmp_path):
+    path = incremental_file(tmp_path)
+    parse(plugin, path)
+    incremental_ome.calls = []
+    incremental_ome.groups[1]["UpdatedTime"] = "2024-01-05 00:00:00.000"
+    incremental_ome.members[2] = [10, 11]
+    incremental_ome.groups.append(dict(group(3, "Storage", 1), UpdatedTime="2024-01-05 00:00:00.000"))
+    incremental_ome.members[3] = [11]
+    inventory = parse(plugin, path)
+    assert [uri for uri, query_param in incremental_ome.calls[1:]] == \
+        ["GroupService/Groups(2)/AllLeafDevices", "GroupService/Groups(3)/AllLeafDevices"]
+    assert [hst.name for hst in inventory.groups["Servers"].hosts] == ["192.168.0.2", "192.168.0.3"]
+    assert [hst.name for hst in inventory.groups["Storage"].hosts] == ["192.168.0.3"]
+
+
+def test_incremental_refresh_fetches_members_of_query_groups(plugin, incremental_ome, tmp_path):
+    incremental_ome.groups.append(dict(group(3, "Idle", 1), UpdatedTime="2024-01-01 00:00:00.000",
+                                       TypeId=3000, MembershipTypeId=24))
+    incremental_ome.members[3] = [10]
+    path = incremental_file(tmp_path)
+    parse(plugin, path)
+    incremental_ome.calls = []
+    incremental_ome.members[3] = [11]
+    inventory = parse(plugin, path)
+    assert [uri for uri, query_param in incremental_ome.calls[1:]] == ["GroupService/Groups(3)/AllLeafDevices"]
+    assert [hst.name for hst in inventory.groups["Idle"].hosts] == ["192.168.0.3"]
+
+
+def test_incremental_refresh_with_new_device(plugin, incremental_ome, tmp_path):
+    path = incremental_file(tmp_path)
+    parse(plugin, path)
+    incremental_ome.calls = []
+    incremental_ome.devices[12] = dict(device(12, "192.168.0.5"), LastInventoryTime="2024-01-05 00:00:00.000")
+    incremental_ome.members[1].append(12)
+    inventory = parse(plugin, path)
+    assert len(incremental_ome.calls) == 1 + 2
+    assert list(inventory.hosts) == ["192.168.0.2", "192.168.0.3", "192.168.0.5"]
+
+
+def test_incremental_refresh_without_filter_support(plugin, incremental_ome, tmp_path):
+    path = incremental_file(tmp_path)
+    parse(plugin, path)
+    incremental_ome.calls = []
+    incremental_ome.filter_supported = False
+    del incremental_ome.devices[11]
+    incremental_ome.members[1].remove(11)
+    inventory = parse(plugin, path)
+    assert incremental_ome.calls[1] == ("DeviceService/Devices", None)
+    assert len(incremental_ome.calls) == 2 + 2
+    assert list(inventory.hosts) == ["192.168.0.2"]
+
+
+def test_group_subtree_resolves_only_its_members(plugin, incremental_ome, tmp_path):
+    incremental_ome.groups.append(dict(group(3, "Rack1", 2), UpdatedTime="2024-01-01 00:00:00.000"))
+    incremental_ome.members.update({2: [10, 12], 3: [12]})
+    incremental_ome.devices[11]["LastInventoryTime"] = "2024-01-01 00:00:00.000"
+    incremental_ome.devices[12] = dict(device(12, "192.168.0.5"), LastInventoryTime="2024-01-01 00:00:00.000")
+    path = incremental_file(tmp_path, ome_group_name="Servers")
+    inventory = parse(plugin, path)
+    assert incremental_ome.calls == [("GroupService/Groups(2)/AllLeafDevices", None),
+                                     ("GroupService/Groups(3)/AllLeafDevices", None), ("resolve_devices", [10, 12])]
+    assert list(inventory.hosts) == ["192.168.0.2", "192.168.0.5"]
+    assert [child.name for child in inventory.groups["Servers"].child_groups] == ["Rack1"]
+    incremental_ome.calls = []
+    incremental_ome.devices[10] = dict(device(10, "192.168.0.6"), LastInventoryTime="2024-01-04 00:00:00.000")
+    inventory = parse(plugin, path)
+    assert incremental_ome.calls == [("DeviceService/Devices", {"$filter": "LastInventoryTime ge '2024-01-02 00:00:00.000'"}),
+                                     ("resolve_devices", [])]
+    assert list(inventory.hosts) == ["192.168.0.6", "192.168.0.5"]
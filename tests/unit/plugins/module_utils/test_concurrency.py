@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.8.0
+# Copyright (C) 2024 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import threading
+import time
+import pytest
+from ansible_collections.dellemc.openmanage.plugins.module_utils.concurrency import FAN_OUT_WORKERS_ENV, \
+    bounded_executor, fan_out, fan_out_workers, map_bounded
+from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME
+
+JSON = {"Content-Type": "application/json"}
+
+
+class InFlight(object):
+    """Route of the stand-in which counts the requests served at the same time"""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.current = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, handler, body):
+        with self._lock:
+            self.current += 1
+            self.peak = max(self.peak, self.current)
+        time.sleep(self.delay)
+        with self._lock:
+            self.current -= 1
+        return 200, JSON, {"Id": handler.path.rsplit("(", 1)[-1].rstrip(")")}
+
+
+def ome_params(stand_in):
+    return {"hostname": "127.0.0.1", "username": "admin", "password": "password",
+            "port": stand_in.port, "validate_certs": False, "timeout": 10}
+
+
+class TestConcurrency(object):
+
+    def test_fan_out_workers_from_env(self, monkeypatch):
+        monkeypatch.delenv(FAN_OUT_WORKERS_ENV, raising=False)
+        assert fan_out_workers() == 1
+        monkeypatch.setenv(FAN_OUT_WORKERS_ENV, "8")
+        assert fan_out_workers() == 8
+        monkeypatch.setenv(FAN_OUT_WORKERS_ENV, "0")
+        assert fan_out_workers() == 1
+
+    def test_map_bounded_keeps_order_and_limit(self):
+        lock = threading.Lock()
+        running = {"now": 0, "peak": 0}
+
+        def call(value):
+            with lock:
+                running["now"] += 1
+                running["peak"] = max(running["peak"], running["now"])
+            time.sleep(0.01 * (5 - value % 5))
+            with lock:
+                running["now"] -= 1
+            return value
+        assert map_bounded(call, range(12), 3) == list(range(12))
+        assert 1 < running["peak"] <= 3
+
+    def test_bounded_executor_cancels_pending_calls(self):
+        started = []
+
+        def call(item):
+            started.append(item)
+            time.sleep(0.1)
+        with pytest.raises(ValueError):
+            with bounded_executor(1) as executor:
+                futures = [executor.submit(call, item) for item in range(3)]
+                raise ValueError()
+        assert started == [0]
+        assert futures[0].done() and not futures[0].cancelled()
+        assert futures[1].cancelled() and futures[2].cancelled()
+
+    def test_fan_out_serial_without_workers(self):
+        threads = set()
+
+        def call(item):
+            threads.add(threading.current_thread().name)
+            return item * 2
+        assert fan_out(call, [1, 2, 3], workers=1) == [2, 4, 6]
+        assert threads == {threading.current_thread().name}
+
+    def test_fan_out_raises_first_error_in_item_order(self):
+        def call(item):
+            if item in (2, 5):
+                time.sleep(0.05 if item == 2 else 0)
+                raise ValueError(item)
+            return item
+        with pytest.raises(ValueError) as err:
+            fan_out(call, range(8), workers=4)
+        assert err.value.args == (2,)
+
+    def test_rest_ome_fan_out(self, https_stand_in):
+        route = InFlight()
+        https_stand_in.default_route = route
+        with RestOME(ome_params(https_stand_in), pool_size=4) as rest_obj:
+            ids = fan_out(lambda device_id: rest_obj.invoke_request(
+                "GET", "DeviceService/Devices({0})".format(device_id)).json_data["Id"], range(12), workers=4)
+        assert ids == [str(device_id) for device_id in range(12)]
+        assert 1 < route.peak <= 4
+        assert rest_obj.requests_sent == 12
+        assert all(request["headers"]["Authorization"].startswith("Basic ") for request in https_stand_in.requests)
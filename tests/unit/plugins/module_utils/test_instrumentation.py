@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.8.0
+# Copyright (C) 2024 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import json
+import pytest
+from mock import MagicMock
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible_collections.dellemc.openmanage.plugins.module_utils import instrumentation
+from ansible_collections.dellemc.openmanage.plugins.module_utils.instrumentation import INSTRUMENTATION_ENV, \
+    SPANS_FILE_ENV, NULL_SPAN, InstrumentedModuleMixin, request_span, request_summary, template_path, \
+    get_spans, reset_spans
+from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME
+from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI
+
+
+@pytest.fixture
+def instrumented(monkeypatch):
+    monkeypatch.setenv(INSTRUMENTATION_ENV, "true")
+    monkeypatch.delenv(SPANS_FILE_ENV, raising=False)
+    reset_spans()
+    yield
+    reset_spans()
+
+
+def span(path, latency, method="GET", status=200, request_bytes=0, response_bytes=10, retries=0):
+    return {"client": "RestOME", "method": method, "path": path, "status": status, "latency": latency,
+            "request_bytes": request_bytes, "response_bytes": response_bytes, "retries": retries}
+
+
+class ModuleBase(object):
+
+    def exit_json(self, **kwargs):
+        self.result = kwargs
+
+    def fail_json(self, msg, **kwargs):
+        self.result = dict(kwargs, msg=msg, failed=True)
+
+
+class InstrumentedModule(InstrumentedModuleMixin, ModuleBase):
+    pass
+
+
+class TestInstrumentation(object):
+
+    @pytest.mark.parametrize("url, path", [
+        ("https://host:443/api/DeviceService/Devices(10074)/InventoryDetails?$top=10",
+         "/api/DeviceService/Devices({id})/InventoryDetails"),
+        ("https://host/api/JobService/Jobs(25011)", "/api/JobService/Jobs({id})"),
+        ("https://host/api/AccountService/Roles('10')", "/api/AccountService/Roles('{id}')"),
+        ("https://host/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/JID_123456789012",
+         "/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/{job_id}"),
+        ("https://host/redfish/v1/SessionService/Sessions/12", "/redfish/v1/SessionService/Sessions/{id}"),
+        ("https://host/api/SessionService/Sessions('0e36ae2e-6b3b-4e4c-a21a-1bd3b5a0dc4e')",
+         "/api/SessionService/Sessions('{id}')"),
+        ("https://host/omevv/GatewayService/v1/Consoles/7b5e6a6c-3d0d-4b45-9c44-0a3c2f0b1a77/Groups",
+         "/omevv/GatewayService/v1/Consoles/{id}/Groups"),
+    ])
+    def test_template_path(self, url, path):
+        assert template_path(url) == path
+
+    def test_disabled_records_nothing(self, monkeypatch):
+        monkeypatch.delenv(INSTRUMENTATION_ENV, raising=False)
+        reset_spans()
+        assert request_span("RestOME", "GET", "https://host/api/Info") is NULL_SPAN
+        with request_span("RestOME", "GET", "https://host/api/Info") as active:
+            active.set_response(MagicMock())
+        assert get_spans() == []
+
+    def test_span_records_response(self, instrumented):
+        resp = MagicMock(status_code=201, body=b"{}")
+        resp.resp.headers = {"Content-Length": "120"}
+        with request_span("RestOME", "POST", "https://host/api/JobService/Jobs", '{"Id": 1}') as active:
+            active.set_response(resp)
+            active.add_retry()
+        recorded = get_spans()[0]
+        assert recorded["latency"] >= 0
+        assert dict(recorded, latency=0) == {"client": "RestOME", "method": "POST", "path": "/api/JobService/Jobs",
+                                             "status": 201, "latency": 0, "request_bytes": 9,
+                                             "response_bytes": 120, "retries": 1}
+
+    def test_span_records_errors(self, instrumented):
+        with pytest.raises(HTTPError):
+            with request_span("Redfish", "GET", "https://host/redfish/v1/Systems/1"):
+                raise HTTPError("https://host/redfish/v1/Systems/1", 404, "Not Found", {}, None)
+        with pytest.raises(ValueError):
+            with request_span("Redfish", "GET", "https://host/redfish/v1"):
+                raise ValueError("broken")
+        assert [recorded["status"] for recorded in get_spans()] == [404, "ValueError"]
+
+    def test_spans_written_to_jsonl(self, instrumented, tmp_path, monkeypatch):
+        spans_file = tmp_path / "spans.jsonl"
+        monkeypatch.setenv(SPANS_FILE_ENV, str(spans_file))
+        for index in range(2):
+            with request_span("RestAPI", "GET", "https://host/api/Devices({0})".format(index)):
+                pass
+        lines = [json.loads(line) for line in spans_file.read_text().splitlines()]
+        assert [line["path"] for line in lines] == ["/api/Devices({id})"] * 2
+
+    def test_request_summary(self):
+        spans = [span("/api/Jobs", latency / 1000.0) for latency in range(1, 21)]
+        spans.append(span("/api/Jobs", 0.5, method="POST", status=400, request_bytes=30, retries=2))
+        summary = request_summary(spans)
+        assert (summary["total_requests"], summary["total_request_bytes"], summary["total_response_bytes"]) == \
+            (21, 30, 210)
+        get_jobs, post_jobs = summary["endpoints"]
+        assert (get_jobs["method"], get_jobs["count"], get_jobs["p50_ms"], get_jobs["p95_ms"]) == ("GET", 20, 10, 19)
+        assert (post_jobs["retries"], post_jobs["statuses"], post_jobs["p95_ms"]) == (2, ["400"], 500)
+
+    def test_module_result_debug_key(self, instrumented, monkeypatch):
+        module = InstrumentedModule()
+        module.exit_json(changed=False)
+        assert "debug" not in module.result
+        instrumentation.record_span(span("/api/Jobs", 0.01))
+        module.exit_json(changed=True)
+        assert module.result["debug"]["requests"]["total_requests"] == 1
+        module.fail_json("failed", error_info={})
+        assert module.result["msg"] == "failed" and module.result["debug"]["requests"]["endpoints"][0]["count"] == 1
+        monkeypatch.delenv(INSTRUMENTATION_ENV)
+        module.exit_json(changed=True)
+        assert "debug" not in module.result
+
+
+class TestInstrumentedClients(object):
+
+    def test_rest_ome_spans(self, https_stand_in, instrumented):
+        https_stand_in.routes["/api/DeviceService/Devices(10)"] = (200, {"Content-Type": "application/json"},
+                                                                   {"Id": 10})
+        https_stand_in.routes["/api/DeviceService/Devices(11)"] = (404, {"Content-Type": "application/json"},
+                                                                   {"error": {}})
+        params = {"hostname": "127.0.0.1", "username": "admin", "password": "password",
+                  "port": https_stand_in.port, "validate_certs": False}
+        with RestOME(params) as obj:
+            obj.invoke_request("GET", "DeviceService/Devices(10)")
+            with pytest.raises(HTTPError):
+                obj.invoke_request("GET", "DeviceService/Devices(11)")
+        summary = request_summary()
+        assert summary["total_requests"] == 2
+        assert summary["total_response_bytes"] == sum(len(json.dumps(body)) for body in ({"Id": 10}, {"error": {}}))
+        endpoint = summary["endpoints"][0]
+        assert (endpoint["path"], endpoint["count"], endpoint["statuses"]) == \
+            ("/api/DeviceService/Devices({id})", 2, ["200", "404"])
+
+    def test_idrac_spans(self, https_stand_in, instrumented):
+        params = {"idrac_ip": "127.0.0.1", "idrac_user": "root", "idrac_password": "calvin",
+                  "idrac_port": https_stand_in.port, "validate_certs": False}
+        with iDRACRedfishAPI(params) as idrac:
+            idrac.invoke_request("/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/JID_000000000001", "GET")
+        assert [(recorded["client"], recorded["path"]) for recorded in get_spans()] == [
+            ("iDRACRedfishAPI", "/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/{job_id}")]
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.8.0
+# Copyright (C) 2024 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import json
+import ssl
+import threading
+import time
+import pytest
+from ansible.module_utils.six.moves.urllib.request import Request, urlopen
+from ansible_collections.dellemc.openmanage.plugins.module_utils.job_events import JobEventListener, \
+    LISTENER_ENV, CERT_ENV, KEY_ENV, GRACE_ENV, SUBSCRIPTION_URI
+from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI
+from ansible_collections.dellemc.openmanage.plugins.module_utils.redfish import Redfish
+from ansible_collections.dellemc.openmanage.plugins.module_utils.job_events import job_events
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import idrac_redfish_job_tracking
+
+JOB_ID = "JID_123456789012"
+JOB_URI = "/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/" + JOB_ID
+SUBSCRIPTION = SUBSCRIPTION_URI + "/c1a71140-ba1d-11ea-b4a4-8d4f2b5c6a1e"
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def post_event(destination, job_id):
+    context = ssl.create_default_context()
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    event = {"@odata.type": "#Event.v1_4_0.Event",
+             "Events": [{"EventType": "Alert", "MessageId": "IDRAC.2.9.JCP037", "MessageArgs": [job_id]}]}
+    request = Request(destination, data=json.dumps(event).encode(), headers=JSON_HEADERS)
+    urlopen(request, context=context).read()
+
+
+class RedfishJob(object):
+    """Stand-in job which finishes, and optionally posts the job event, once the subscription exists"""
+
+    def __init__(self, stand_in, post_events=True, accept_subscription=True):
+        self.state = "Running"
+        self.post_events = post_events
+        self.accept_subscription = accept_subscription
+        self.destination = None
+        stand_in.routes[JOB_URI] = self.job_route
+        stand_in.routes[SUBSCRIPTION_URI] = self.subscription_route
+
+    def job_route(self, handler, body):
+        return 200, JSON_HEADERS, {"Id": JOB_ID, "JobState": self.state, "PercentComplete": 50}
+
+    def finish(self):
+        self.state = "Completed"
+        if self.post_events:
+            post_event(self.destination, "JID_000000000001")
+            post_event(self.destination, JOB_ID)
+
+    def subscription_route(self, handler, body):
+        if not self.accept_subscription:
+            return 405, JSON_HEADERS, {"error": {}}
+        self.destination = json.loads(body)["Destination"]
+        threading.Timer(0.3, self.finish).start()
+        return 201, dict(JSON_HEADERS, Location=SUBSCRIPTION), {}
+
+
+@pytest.fixture
+def events_env(monkeypatch, stand_in_cert):
+    monkeypatch.setenv(LISTENER_ENV, "127.0.0.1:0")
+    monkeypatch.setenv(CERT_ENV, stand_in_cert[0])
+    monkeypatch.setenv(KEY_ENV, stand_in_cert[1])
+    monkeypatch.setenv(GRACE_ENV, "5")
+
+
+def idrac_params(stand_in):
+    return {"idrac_ip": "127.0.0.1", "idrac_user": "root", "idrac_password": "calvin",
+            "idrac_port": stand_in.port, "validate_certs": False}
+
+
+def job_gets(stand_in):
+    return [req for req in stand_in.requests if req["path"] == JOB_URI]
+
+
+class TestJobEventListener(object):
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.delenv(LISTENER_ENV, raising=False)
+        assert JobEventListener.from_env() is None
+        monkeypatch.setenv(LISTENER_ENV, "192.168.0.10:8443")
+        monkeypatch.setenv(CERT_ENV, "/tmp/listener.pem")
+        monkeypatch.setenv(GRACE_ENV, "12")
+        listener = JobEventListener.from_env()
+        assert (listener.host, listener.port, listener.grace) == ("192.168.0.10", 8443, 12)
+        assert JobEventListener("[2001:db8::1]:0", "cert.pem").host == "2001:db8::1"
+
+    def test_events_of_other_jobs_are_ignored(self):
+        listener = JobEventListener("127.0.0.1:0", "cert.pem")
+        events = listener.watch(JOB_ID)
+        listener.receive(json.dumps({"Events": [{"MessageArgs": ["JID_000000000001"]}]}).encode())
+        listener.receive(b"not json")
+        assert events.wait(0) is False
+        listener.receive(json.dumps({"Events": [{"MessageArgs": [JOB_ID]}]}).encode())
+        assert events.wait(0) is True
+        assert events.wait(0) is False
+
+    @pytest.mark.parametrize("event, about_job", [
+        ({"MessageId": "IDRAC.2.9.JCP037", "MessageArgs": [JOB_ID]}, True),
+        ({"MessageId": "IDRAC.2.9.JCP037", "MessageArgs": [JOB_ID + "0"]}, False),
+        ({"OriginOfCondition": {"@odata.id": JOB_URI}}, True),
+        ({"OriginOfCondition": JOB_URI + "/"}, True),
+        ({"OriginOfCondition": {"@odata.id": JOB_URI + "0"}}, False),
+        ({"Message": "The job {0} is successfully completed.".format(JOB_ID)}, False),
+        ({"Context": JOB_ID, "MessageArgs": []}, False),
+    ])
+    def test_event_matches_job(self, event, about_job):
+        listener = JobEventListener("127.0.0.1:0", "cert.pem")
+        events = listener.watch(JOB_ID)
+        listener.receive(json.dumps({"Events": [event]}).encode())
+        assert events.wait(0) is about_job
+
+
+class TestEventDrivenTracking(object):
+
+    def test_job_completes_on_event(self, https_stand_in, events_env):
+        RedfishJob(https_stand_in)
+        start = time.monotonic()
+        with iDRACRedfishAPI(idrac_params(https_stand_in)) as idrac:
+            job_failed, msg, job, wait_time = idrac_redfish_job_tracking(idrac, JOB_URI, sleep_interval_secs=10,
+                                                                         initial_wait=0)
+        assert (job_failed, msg, job["JobState"]) == (False, "Job tracking completed.", "Completed")
+        assert time.monotonic() - start < 5
+        assert len(job_gets(https_stand_in)) == 2
+        assert [req["method"] for req in https_stand_in.requests if req["path"] == SUBSCRIPTION] == ["DELETE"]
+
+    def test_falls_back_to_polling_without_events(self, https_stand_in, events_env, monkeypatch):
+        monkeypatch.setenv(GRACE_ENV, "1")
+        RedfishJob(https_stand_in, post_events=False)
+        with iDRACRedfishAPI(idrac_params(https_stand_in)) as idrac:
+            job_failed, msg, job, wait_time = idrac_redfish_job_tracking(idrac, JOB_URI, sleep_interval_secs=10,
+                                                                         initial_wait=0)
+        assert (job_failed, job["JobState"]) == (False, "Completed")
+        assert len(job_gets(https_stand_in)) == 2
+
+    def test_polls_when_subscription_is_refused(self, https_stand_in, events_env):
+        RedfishJob(https_stand_in, accept_subscription=False).state = "Failed"
+        with iDRACRedfishAPI(idrac_params(https_stand_in)) as idrac:
+            job_failed, msg, job, wait_time = idrac_redfish_job_tracking(idrac, JOB_URI, initial_wait=0)
+        assert (job_failed, msg) == (True, "Job is in Failed state.")
+        assert [req["method"] for req in https_stand_in.requests if req["path"] == SUBSCRIPTION_URI] == ["POST"]
+
+    def test_subscribes_to_alerts(self, https_stand_in, events_env):
+        job = RedfishJob(https_stand_in)
+        with iDRACRedfishAPI(idrac_params(https_stand_in)) as idrac:
+            idrac_redfish_job_tracking(idrac, JOB_URI, initial_wait=0)
+        subscription = [json.loads(req["body"]) for req in https_stand_in.requests if req["path"] == SUBSCRIPTION_URI]
+        assert [request["EventTypes"] for request in subscription] == [["Alert"]]
+        assert subscription[0]["Destination"] == job.destination
+
+    def test_polls_with_other_clients(self, https_stand_in, events_env):
+        RedfishJob(https_stand_in)
+        redfish = Redfish({"baseuri": "127.0.0.1:{0}".format(https_stand_in.port), "username": "root",
+                           "password": "calvin", "validate_certs": False})
+        with job_events(redfish, JOB_URI) as events:
+            assert events is None
+        assert https_stand_in.requests == []
+
+    def test_wait_for_job_completion_on_event(self, https_stand_in, events_env, mocker):
+        mocker.patch('ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish.time.sleep',
+                     return_value=None)
+        job = RedfishJob(https_stand_in)
+        job.job_route = lambda handler, body: (200, JSON_HEADERS, {
+            "Id": JOB_ID, "JobState": job.state, "PercentComplete": 100 if job.state == "Completed" else 50})
+        https_stand_in.routes[JOB_URI] = job.job_route
+        with iDRACRedfishAPI(idrac_params(https_stand_in)) as idrac:
+            resp = idrac.wait_for_job_completion(JOB_URI, job_wait=True)
+        assert resp.json_data["JobState"] == "Completed"
+        assert len(job_gets(https_stand_in)) <= 3
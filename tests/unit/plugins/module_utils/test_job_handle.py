@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.8.0
+# Copyright (C) 2024 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import pytest
+from mock import MagicMock, patch
+from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
+from ansible_collections.dellemc.openmanage.plugins.module_utils import instrumentation
+from ansible_collections.dellemc.openmanage.plugins.module_utils.job_handle import JobFleet, job_handle, \
+    fetch_job, _client
+
+MODULE_UTIL_PATH = 'ansible_collections.dellemc.openmanage.plugins.module_utils.job_handle.'
+SLEEP = MODULE_UTIL_PATH + 'time.sleep'
+IDRAC_JOB_URI = "/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/{0}"
+CREDENTIALS = {"username": "user", "password": "password", "validate_certs": False, "timeout": 30}
+
+
+def idrac_handle(host, job_id="JID_1", state_map="idrac"):
+    return {"api": "idrac", "host": host, "port": 443, "job_uri": IDRAC_JOB_URI.format(job_id), "job_id": job_id,
+            "state_map": state_map}
+
+
+def response(**job):
+    return MagicMock(json_data=job)
+
+
+@pytest.fixture
+def sleep(mocker):
+    return mocker.patch(SLEEP, return_value=None)
+
+
+@pytest.fixture
+def clients(mocker):
+    """Records the clients the fleet opens, by host"""
+    opened = []
+
+    def client(handle, credentials):
+        opened.append((handle["host"], MagicMock()))
+        return opened[-1][1]
+    mocker.patch(MODULE_UTIL_PATH + '_client', side_effect=client)
+    return opened
+
+
+@pytest.fixture
+def fetch(mocker, clients):
+    """Answers every host from its own list of job states, repeating the last one"""
+    states = {}
+
+    def fetch_job(client, handle):
+        answers = states[handle["host"]]
+        answer = answers.pop(0) if len(answers) > 1 else answers[0]
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+    mocker.patch(MODULE_UTIL_PATH + 'fetch_job', side_effect=fetch_job)
+    return states
+
+
+class TestJobHandle(object):
+
+    @pytest.mark.parametrize("api, params, expected", [
+        ("idrac", {"idrac_ip": "192.168.0.2", "idrac_port": 443}, ("192.168.0.2", 443, "idrac")),
+        ("idrac", {"hostname": "192.168.0.2", "port": 8443}, ("192.168.0.2", 8443, "idrac")),
+        ("ome", {"hostname": "192.168.0.1", "port": 443}, ("192.168.0.1", 443, "ome_info")),
+        ("redfish", {"baseuri": "192.168.0.3:443"}, ("192.168.0.3:443", None, "redfish_task")),
+    ])
+    def test_job_handle(self, api, params, expected):
+        params.update({"username": "user", "password": "password"})
+        handle = job_handle(api, params, "JobService/Jobs(10)", job_id="10")
+        assert (handle["host"], handle["port"], handle["state_map"]) == expected
+        assert "password" not in handle and "username" not in handle
+
+    def test_fetch_job_uses_client_of_api(self, mocker):
+        client = mocker.patch(MODULE_UTIL_PATH + 'RestOME')
+        handle = {"api": "ome", "host": "192.168.0.1", "port": None, "job_uri": "JobService/Jobs(10)",
+                  "password": "secret"}
+        fetch_job(_client(handle, CREDENTIALS), handle)
+        params = client.call_args[0][0]
+        assert (params["hostname"], params["port"], params["password"]) == ("192.168.0.1", 443, "secret")
+        client.return_value.invoke_request.assert_called_once_with("GET", "JobService/Jobs(10)")
+
+
+class TestJobFleet(object):
+
+    def test_all_jobs_complete(self, sleep, fetch):
+        fetch["idrac1"] = [response(JobState="Running"), response(JobState="Completed")]
+        fetch["idrac2"] = [response(JobState="Completed")]
+        fetch["idrac3"] = [response(JobState="Running")] * 3 + [response(JobState="Failed")]
+        results = JobFleet([idrac_handle("idrac1"), idrac_handle("idrac2"), idrac_handle("idrac3")],
+                           CREDENTIALS, 600, 30).wait()
+        assert [(job["host"], job["status"], job["polls"]) for job in results] == [
+            ("idrac1", "completed", 2), ("idrac2", "completed", 1), ("idrac3", "failed", 4)]
+        assert results[2]["state"] == "Failed"
+
+    def test_unreachable_host_is_retried(self, sleep, fetch):
+        fetch["idrac1"] = [URLError("rebooting"), URLError("rebooting"), response(JobState="Completed")]
+        job = JobFleet([idrac_handle("idrac1")], CREDENTIALS, 600, 30).wait()[0]
+        assert (job["status"], job["polls"], job["errors"], job["error"]) == ("completed", 1, 2, None)
+
+    def test_missing_job_is_an_error(self, sleep, fetch):
+        fetch["idrac1"] = [HTTPError("https://idrac1", 404, "Not Found", {}, None)]
+        job = JobFleet([idrac_handle("idrac1")], CREDENTIALS, 600, 30).wait()[0]
+        assert (job["status"], job["errors"]) == ("error", 1)
+        assert "404" in job["error"]
+
+    def test_deadline(self, sleep, fetch):
+        fetch["idrac1"] = [response(JobState="Completed")]
+        fetch["idrac2"] = [response(JobState="Scheduled")]
+        results = JobFleet([idrac_handle("idrac1"), idrac_handle("idrac2")], CREDENTIALS, 100, 30).wait()
+        assert [job["status"] for job in results] == ["completed", "timeout"]
+        assert sum(call[0][0] for call in sleep.call_args_list) <= 100
+        assert results[1]["polls"] == 8
+
+    def test_staged_state_map(self, sleep, fetch):
+        fetch["idrac1"] = [response(JobState="Downloading"), response(JobState="Scheduled")]
+        job = JobFleet([idrac_handle("idrac1", state_map="idrac_staged")], CREDENTIALS, 600, 30).wait()[0]
+        assert (job["status"], job["state"]) == ("completed", "Scheduled")
+
+    def test_hosts_polled_concurrently(self, sleep, fetch):
+        fetch.update(("idrac{0}".format(index), [response(JobState="Running"), response(JobState="Completed")])
+                     for index in range(200))
+        handles = [idrac_handle("idrac{0}".format(index)) for index in range(200)]
+        results = JobFleet(handles, CREDENTIALS, 600, 30, workers=16).wait()
+        assert all(job["status"] == "completed" for job in results)
+        assert sum(call[0][0] for call in sleep.call_args_list) <= 2
+
+    def test_job_metrics_recorded(self, sleep, fetch, monkeypatch):
+        monkeypatch.setenv(instrumentation.INSTRUMENTATION_ENV, "1")
+        instrumentation.reset_spans()
+        fetch["idrac1"] = [response(JobState="Completed")]
+        JobFleet([idrac_handle("idrac1")], CREDENTIALS, 600, 30).wait()
+        assert [(job["job"], job["outcome"]) for job in instrumentation.get_jobs()] == [("JID_1", "completed")]
+        instrumentation.reset_spans()
+
+    def test_one_client_per_host(self, sleep, fetch, clients):
+        fetch["idrac1"] = [response(JobState="Running")] * 2 + [response(JobState="Completed")]
+        fetch["idrac2"] = [response(JobState="Completed")]
+        handles = [idrac_handle("idrac1", "JID_1"), idrac_handle("idrac1", "JID_2"), idrac_handle("idrac2")]
+        results = JobFleet(handles, CREDENTIALS, 600, 30).wait()
+        assert [job["status"] for job in results] == ["completed"] * 3
+        assert sum(job["polls"] for job in results) > 3
+        assert sorted(host for host, client in clients) == ["idrac1", "idrac2"]
+        assert all(client.__enter__.call_count == 1 and client.__exit__.call_count == 1 for host, client in clients)
+
+    def test_rejected_session_reopens_client(self, sleep, fetch, clients):
+        fetch["idrac1"] = [HTTPError("https://idrac1", 401, "Unauthorized", {}, None), response(JobState="Completed")]
+        job = JobFleet([idrac_handle("idrac1")], CREDENTIALS, 600, 30).wait()[0]
+        assert (job["status"], job["polls"], job["errors"]) == ("completed", 1, 0)
+        assert len(clients) == 2
+        assert all(client.__exit__.call_count == 1 for host, client in clients)
+
+    def test_close_skips_unreachable_host(self, sleep, fetch, clients):
+        fetch["idrac1"] = [response(JobState="Completed")]
+
+        def client(handle, credentials):
+            opened = MagicMock()
+            opened.__exit__.side_effect = URLError("rebooting")
+            clients.append((handle["host"], opened))
+            return opened
+        with patch(MODULE_UTIL_PATH + '_client', side_effect=client):
+            job = JobFleet([idrac_handle("idrac1")], CREDENTIALS, 600, 30).wait()[0]
+        assert job["status"] == "completed"
+        assert clients[0][1].__exit__.call_count == 1
+
+    def test_no_jobs(self, sleep):
+        assert JobFleet([], CREDENTIALS, 600, 30).wait() == []
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.8.0
+# Copyright (C) 2024 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import pytest
+from mock import MagicMock
+from ansible_collections.dellemc.openmanage.plugins.module_utils.job_poller import JobPoller
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import job_tracking, \
+    idrac_redfish_job_tracking, wait_for_job_completion, wait_for_idrac_job_completion, \
+    wait_for_redfish_job_complete
+
+SLEEP = 'ansible_collections.dellemc.openmanage.plugins.module_utils.job_poller.time.sleep'
+JOB_URI = "/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/JID_123456789012"
+
+
+def job_response(percent, state="Running"):
+    return MagicMock(json_data={"PercentComplete": percent, "JobState": state})
+
+
+@pytest.fixture
+def sleep(mocker):
+    return mocker.patch(SLEEP, return_value=None)
+
+
+def slept(sleep):
+    return [call[0][0] for call in sleep.call_args_list]
+
+
+class TestJobPoller(object):
+
+    def test_backoff_up_to_ceiling(self, sleep):
+        states = iter([False] * 6 + [True])
+        result, completed = JobPoller(600, 10).poll(lambda: next(states), lambda state: state)
+        assert (result, completed) == (True, True)
+        assert slept(sleep) == [1, 1, 2, 4, 8, 10, 10]
+
+    def test_returns_on_terminal_state(self, sleep):
+        poller = JobPoller(600, 60)
+        assert poller.poll(lambda: "Completed", lambda state: state == "Completed") == ("Completed", True)
+        assert (slept(sleep), poller.polls) == ([1], 1)
+
+    def test_deadline_shortens_last_sleep(self, sleep):
+        result, completed = JobPoller(20, 10, first_delay=0).poll(lambda: "Running", lambda state: False)
+        assert (result, completed) == ("Running", False)
+        assert slept(sleep) == [1, 2, 4, 8, 5]
+
+    def test_no_poll_without_time(self, sleep):
+        fetch = MagicMock()
+        assert JobPoller(0, 10).poll(fetch, lambda state: True) == (None, False)
+        assert fetch.call_count == 0
+
+    def test_errors_tolerated_then_raised(self, sleep):
+        fetch = MagicMock(side_effect=[ValueError("busy"), "Completed"])
+        assert JobPoller(60, 10, max_errors=1).poll(fetch, lambda state: True) == ("Completed", True)
+        fetch = MagicMock(side_effect=ValueError("busy"))
+        with pytest.raises(ValueError):
+            JobPoller(60, 10, max_errors=2).poll(fetch, lambda state: False)
+        assert fetch.call_count == 3
+
+
+class TestJobHelpers(object):
+
+    def test_job_tracking_returns_on_completion(self, sleep):
+        rest_obj = MagicMock()
+        rest_obj.invoke_request.side_effect = [MagicMock(json_data={"LastRunStatus": {"Id": 2050}}),
+                                               MagicMock(json_data={"LastRunStatus": {"Id": 2060}})]
+        job_failed, msg, job_dict, wait_time = job_tracking(rest_obj, "JobService/Jobs(10)")
+        assert (job_failed, msg, job_dict, wait_time) == (False, "Job tracking completed.",
+                                                          {"LastRunStatus": {"Id": 2060}}, 2)
+        assert slept(sleep) == [1, 1]
+
+    def test_job_tracking_failure_and_timeout(self, sleep):
+        rest_obj = MagicMock()
+        rest_obj.invoke_request.return_value = MagicMock(json_data={"LastRunStatus": {"Id": 2070}})
+        assert job_tracking(rest_obj, "JobService/Jobs(10)")[:2] == (True, "Job is in Failed state.")
+        rest_obj.invoke_request.return_value = MagicMock(json_data={"LastRunStatus": {"Id": 2050}})
+        job_failed, msg, job_dict, wait_time = job_tracking(rest_obj, "JobService/Jobs(10)", max_job_wait_sec=30)
+        assert (job_failed, msg, wait_time) == (True, "Job tracking started.", 30)
+        rest_obj.invoke_request.reset_mock()
+        rest_obj.invoke_request.side_effect = ValueError("unreachable")
+        assert job_tracking(rest_obj, "JobService/Jobs(10)")[1] == "Exception in job tracking unreachable"
+        assert rest_obj.invoke_request.call_count == 4
+
+    @pytest.mark.parametrize("tracking, uri, job", [
+        (job_tracking, "JobService/Jobs(10)", {"Id": 10, "LastRunStatus": {"Id": 2050}}),
+        (idrac_redfish_job_tracking, JOB_URI, {"Id": "JID_123456789012", "JobState": "Running"}),
+    ])
+    def test_job_tracking_exception_returns_last_job(self, sleep, tracking, uri, job):
+        rest_obj = MagicMock()
+        rest_obj.invoke_request.side_effect = [MagicMock(json_data=job)] + [ValueError("unreachable")] * 4
+        job_failed, msg, job_dict, wait_time = tracking(rest_obj, uri)
+        assert (job_failed, msg, job_dict) == (True, "Exception in job tracking unreachable", job)
+
+    def test_idrac_redfish_job_tracking(self, sleep):
+        idrac = MagicMock()
+        idrac.invoke_request.side_effect = [MagicMock(json_data={"JobState": "Scheduled"}),
+                                            MagicMock(json_data={"JobState": "Failed"})]
+        assert idrac_redfish_job_tracking(idrac, JOB_URI)[:2] == (True, "Job is in Failed state.")
+        assert slept(sleep) == [1, 1]
+
+    def test_wait_for_job_completion(self, sleep):
+        redfish = MagicMock()
+        redfish.invoke_request.side_effect = [job_response(40), job_response(100, "Completed")]
+        job_resp, msg = wait_for_job_completion(redfish, JOB_URI)
+        assert (job_resp.json_data["PercentComplete"], msg) == (100, "")
+        assert slept(sleep) == [1, 1]
+        redfish.invoke_request.side_effect = None
+        redfish.invoke_request.return_value = job_response(40)
+        assert wait_for_job_completion(redfish, JOB_URI, wait_timeout=15) == (
+            {}, "The job is not complete after 15 seconds.")
+
+    def test_wait_for_idrac_job_completion(self, sleep):
+        idrac = MagicMock()
+        idrac.invoke_request.return_value = job_response(100, "Completed")
+        assert wait_for_idrac_job_completion(idrac, JOB_URI)[1] == ""
+        idrac.invoke_request.return_value = job_response(20, "RebootFailed")
+        assert wait_for_idrac_job_completion(idrac, JOB_URI)[1] == "The job is not complete after 120 seconds."
+        assert slept(sleep) == [1, 1]
+
+    def test_wait_for_redfish_job_complete(self, sleep):
+        redfish = MagicMock()
+        redfish.invoke_request.return_value = job_response(100, "Completed")
+        job_resp, msg = wait_for_redfish_job_complete(redfish, JOB_URI)
+        assert (job_resp.json_data["JobState"], msg) == ("Completed", "")
+        redfish.invoke_request.return_value = job_response(50)
+        job_resp, msg = wait_for_redfish_job_complete(redfish, JOB_URI, wait_timeout=3)
+        assert (job_resp.json_data["PercentComplete"], msg) == (50, "The job is not complete after 3 seconds.")
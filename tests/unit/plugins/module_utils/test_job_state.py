@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.8.0
+# Copyright (C) 2024 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import pytest
+from mock import MagicMock
+from ansible.module_utils.six.moves.urllib.error import URLError
+from ansible_collections.dellemc.openmanage.plugins.module_utils import instrumentation
+from ansible_collections.dellemc.openmanage.plugins.module_utils.job_state import JobStateMap, JobStateEngine, \
+    OME_JOB_STATES, OME_JOB_PROGRESS_STATES, IDRAC_JOB_STATES, REDFISH_TASK_STATES, IDRAC_JOB_PROGRESS_STATES, \
+    json_document
+
+SLEEP = 'ansible_collections.dellemc.openmanage.plugins.module_utils.job_poller.time.sleep'
+
+
+@pytest.fixture
+def sleep(mocker):
+    return mocker.patch(SLEEP, return_value=None)
+
+
+@pytest.fixture
+def jobs_recorded(monkeypatch):
+    monkeypatch.setenv(instrumentation.INSTRUMENTATION_ENV, "1")
+    instrumentation.reset_spans()
+    yield instrumentation.get_jobs
+    instrumentation.reset_spans()
+
+
+def ome_job(status_id):
+    return {"Id": 10, "LastRunStatus": {"Id": status_id}}
+
+
+class TestJobStateMap(object):
+
+    @pytest.mark.parametrize("state_map, job, terminal, failed", [
+        (OME_JOB_STATES, ome_job(2060), True, False),
+        (OME_JOB_STATES, ome_job(2070), True, True),
+        (OME_JOB_STATES, ome_job(2050), False, False),
+        (OME_JOB_PROGRESS_STATES, ome_job(2080), False, False),
+        (OME_JOB_PROGRESS_STATES, ome_job(2100), True, False),
+        (IDRAC_JOB_STATES, {"JobState": "Completed"}, True, False),
+        (IDRAC_JOB_STATES, {"JobState": "Scheduled"}, False, False),
+        (IDRAC_JOB_STATES, {}, True, True),
+        (REDFISH_TASK_STATES, {"TaskState": "Exception"}, True, True),
+        (REDFISH_TASK_STATES, {"TaskState": "Running"}, False, False),
+        (IDRAC_JOB_PROGRESS_STATES, {"JobState": "Running", "PercentComplete": 100}, True, False),
+        (IDRAC_JOB_PROGRESS_STATES, {"JobState": "RebootFailed", "PercentComplete": 40}, True, True),
+    ])
+    def test_state_maps(self, state_map, job, terminal, failed):
+        assert state_map.is_terminal(job) is terminal
+        assert state_map.is_failed(job) is failed
+
+    def test_nested_state_and_default(self):
+        state_map = JobStateMap("custom", ("Status", "State"), default="Missing")
+        assert state_map.state({"Status": {"State": "Done"}}) == "Done"
+        assert state_map.state({"Status": None}) == "Missing"
+
+
+class TestJobStateEngine(object):
+
+    def test_completed_job(self, sleep, jobs_recorded):
+        jobs = iter([ome_job(2050), ome_job(2050), ome_job(2060)])
+        engine = JobStateEngine(OME_JOB_STATES, 600, 10, first_delay=0)
+        outcome = engine.wait(lambda: next(jobs), job_id=10)
+        assert (outcome.state, outcome.done, outcome.failed) == (2060, True, False)
+        assert jobs_recorded() == [engine.metrics]
+        assert engine.metrics["outcome"] == "completed"
+        assert engine.metrics["polls"] == 3
+
+    def test_failed_job_from_response(self, sleep):
+        resp = MagicMock(json_data={"JobState": "Failed"})
+        outcome = JobStateEngine(IDRAC_JOB_STATES, 600, 10, document=json_document).wait(lambda: resp)
+        assert (outcome.job, outcome.state, outcome.done, outcome.failed) == (resp, "Failed", True, True)
+
+    def test_timeout(self, sleep):
+        engine = JobStateEngine(REDFISH_TASK_STATES, 30, 10, first_delay=0)
+        outcome = engine.wait(lambda: {"TaskState": "Running"}, job_id="JID_1")
+        assert (outcome.state, outcome.done) == ("Running", False)
+        assert engine.metrics["outcome"] == "timeout"
+
+    def test_tolerated_errors(self, sleep):
+        fetch = MagicMock(side_effect=[URLError("down"), URLError("down"), {"TaskState": "Completed"}])
+        engine = JobStateEngine(REDFISH_TASK_STATES, 600, 10, max_errors=None, tolerated=(URLError,))
+        assert engine.wait(fetch).done
+        assert engine.metrics["errors"] == 2
+
+    def test_error_recorded(self, sleep, jobs_recorded):
+        engine = JobStateEngine(REDFISH_TASK_STATES, 600, 10, tolerated=(URLError,))
+        with pytest.raises(ValueError):
+            engine.wait(MagicMock(side_effect=ValueError("bad")), job_id="JID_2")
+        assert jobs_recorded()[0]["outcome"] == "error"
+        assert jobs_recorded()[0]["job"] == "JID_2"
+
+    def test_no_metrics_recorded_by_default(self, sleep, monkeypatch):
+        monkeypatch.delenv(instrumentation.INSTRUMENTATION_ENV, raising=False)
+        instrumentation.reset_spans()
+        JobStateEngine(OME_JOB_STATES, 600, 10).wait(lambda: ome_job(2060))
+        assert instrumentation.get_jobs() == []
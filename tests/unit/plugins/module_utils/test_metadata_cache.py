@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.8.0
+# Copyright (C) 2024 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import json
+import os
+import time
+import pytest
+from mock import MagicMock
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible_collections.dellemc.openmanage.plugins.module_utils.metadata_cache import MetadataCache, \
+    invoke_cached, CACHE_DIR_ENV, CACHE_TTL_ENV, CACHE_MAX_SIZE_ENV, CACHE_VERSION_TTL_ENV
+from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, OpenURLResponse
+from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI
+
+KEY = ["192.168.0.1", 443, "JobService/JobTypes", "4.1.0"]
+JSON_HEADERS = {"Content-Type": "application/json"}
+JOB_TYPES = {"value": [{"Id": 5, "Name": "Inventory_Task"}, {"Id": 8, "Name": "Update_Task"}]}
+
+
+def etag_route(payload, etag):
+    """Serves the payload with an ETag and answers a matching If-None-Match with 304"""
+    def route(handler, body):
+        if handler.headers.get("If-None-Match") == etag:
+            return 304, {"ETag": etag}, b""
+        return 200, dict(JSON_HEADERS, ETag=etag), payload
+    return route
+
+
+def sent_response(body, etag=None):
+    resp = MagicMock(success=True, body=json.dumps(body).encode())
+    resp.resp.headers = {"ETag": etag} if etag else {}
+    return resp
+
+
+class TestMetadataCache(object):
+
+    def test_from_env(self, tmp_path, monkeypatch):
+        monkeypatch.delenv(CACHE_DIR_ENV, raising=False)
+        assert MetadataCache.from_env() is None
+        monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+        monkeypatch.setenv(CACHE_TTL_ENV, "60")
+        monkeypatch.setenv(CACHE_MAX_SIZE_ENV, "2")
+        monkeypatch.setenv(CACHE_VERSION_TTL_ENV, "30")
+        cache = MetadataCache.from_env()
+        assert (cache.directory, cache.ttl, cache.max_size, cache.version_ttl) == (
+            str(tmp_path), 60, 2 * 1024 * 1024, 30)
+
+    def test_put_and_get(self, tmp_path):
+        cache = MetadataCache(str(tmp_path / "cache"))
+        assert cache.get(KEY) is None
+        cache.put(KEY, b'{"value": []}', '"v1"')
+        entry = cache.get(KEY)
+        assert (entry["body"], entry["etag"]) == ('{"value": []}', '"v1"')
+        assert cache.is_fresh(entry)
+        assert cache.get(KEY[:3] + ["4.2.0"]) is None
+        assert oct(os.stat(str(tmp_path / "cache")).st_mode & 0o777) == oct(0o700)
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path):
+        cache = MetadataCache(str(tmp_path))
+        cache.put(KEY, b'{}')
+        with open(cache._path(KEY), "w") as entry_file:
+            entry_file.write("{not json")
+        assert cache.get(KEY) is None
+
+    def test_evicts_least_recently_used_above_size_cap(self, tmp_path):
+        cache = MetadataCache(str(tmp_path))
+        body = json.dumps({"value": "x" * 200}).encode()
+        for idx in range(3):
+            cache.put(KEY + [idx], body, '"v1"')
+            cache.max_size = os.path.getsize(cache._path(KEY + [0])) * 7 // 2
+            os.utime(cache._path(KEY + [idx]), (time.time() - 100 + idx, time.time() - 100 + idx))
+        cache.get(KEY + [0])
+        cache.put(KEY + [3], body, '"v1"')
+        assert [cache.get(KEY + [idx]) is not None for idx in range(4)] == [True, False, True, True]
+
+    def test_evicts_expired_entries_without_etag(self, tmp_path):
+        cache = MetadataCache(str(tmp_path), ttl=10)
+        cache.put(KEY + ["plain"], b'{}')
+        cache.put(KEY + ["etag"], b'{}', '"v1"')
+        for name in ("plain", "etag"):
+            os.utime(cache._path(KEY + [name]), (time.time() - 20, time.time() - 20))
+        cache.put(KEY, b'{}')
+        assert cache.get(KEY + ["plain"]) is None
+        assert cache.get(KEY + ["etag"]) is not None
+
+    def test_invoke_cached(self, tmp_path):
+        cache = MetadataCache(str(tmp_path), ttl=10)
+        send = MagicMock(return_value=sent_response(JOB_TYPES, '"v1"'))
+        assert invoke_cached(cache, KEY, send, OpenURLResponse) is send.return_value
+        send.assert_called_once_with(None)
+        resp = invoke_cached(cache, KEY, send, OpenURLResponse)
+        assert resp.json_data == JOB_TYPES and resp.status_code == 200
+        assert send.call_count == 1
+        entry = cache.get(KEY)
+        entry["stored"] -= 20
+        cache._write(KEY, entry)
+        send.side_effect = HTTPError("https://192.168.0.1", 304, "Not Modified", {}, None)
+        assert invoke_cached(cache, KEY, send, OpenURLResponse).json_data == JOB_TYPES
+        send.assert_called_with({"If-None-Match": '"v1"'})
+        assert cache.is_fresh(cache.get(KEY))
+
+    def test_unwritable_directory_is_a_miss(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        cache = MetadataCache(str(blocker / "cache"))
+        cache.put(KEY, b'{}', '"v1"')
+        assert cache.get(KEY) is None
+
+    def test_invoke_cached_with_ttl(self, tmp_path):
+        cache = MetadataCache(str(tmp_path), ttl=3600)
+        send = MagicMock(return_value=sent_response({"Version": "4.1.0"}, '"v1"'))
+        invoke_cached(cache, KEY, send, OpenURLResponse, ttl=60)
+        invoke_cached(cache, KEY, send, OpenURLResponse, ttl=60)
+        assert send.call_count == 1
+        send.side_effect = HTTPError("https://192.168.0.1", 304, "Not Modified", {}, None)
+        assert invoke_cached(cache, KEY, send, OpenURLResponse, ttl=0).json_data == {"Version": "4.1.0"}
+        send.assert_called_with({"If-None-Match": '"v1"'})
+
+    def test_invoke_cached_errors_are_raised(self, tmp_path):
+        cache = MetadataCache(str(tmp_path))
+        send = MagicMock(side_effect=HTTPError("https://192.168.0.1", 304, "Not Modified", {}, None))
+        with pytest.raises(HTTPError):
+            invoke_cached(cache, KEY, send, OpenURLResponse)
+        assert cache.get(KEY) is None
+
+
+class TestCachedClients(object):
+
+    def test_rest_ome_skips_round_trips(self, https_stand_in, tmp_path, monkeypatch):
+        monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+        https_stand_in.routes["/api/ApplicationService/Info"] = etag_route({"Version": "4.1.0"}, '"info"')
+        https_stand_in.routes["/api/JobService/JobTypes"] = etag_route(JOB_TYPES, '"types"')
+        params = {"hostname": "127.0.0.1", "username": "admin", "password": "password",
+                  "port": https_stand_in.port, "validate_certs": False}
+        for run in range(3):
+            with RestOME(params) as obj:
+                assert obj.get_job_type_id("Update_Task") == 8
+                assert obj._headers.get("If-None-Match") is None
+        assert [req["path"] for req in https_stand_in.requests] == ["/api/ApplicationService/Info",
+                                                                    "/api/JobService/JobTypes"]
+        monkeypatch.setenv(CACHE_TTL_ENV, "0")
+        with RestOME(params) as obj:
+            assert obj.get_job_type_id("Update_Task") == 8
+        monkeypatch.setenv(CACHE_VERSION_TTL_ENV, "0")
+        with RestOME(params) as obj:
+            assert obj.get_job_type_id("Update_Task") == 8
+        assert [(req["path"], req["headers"].get("If-None-Match")) for req in https_stand_in.requests[2:]] == [
+            ("/api/JobService/JobTypes", '"types"'), ("/api/ApplicationService/Info", '"info"'),
+            ("/api/JobService/JobTypes", '"types"')]
+
+    def test_idrac_registry_keyed_by_firmware(self, https_stand_in, tmp_path, monkeypatch):
+        monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+        manager = "/redfish/v1/Managers/iDRAC.Embedded.1"
+        registry = "/redfish/v1/Systems/System.Embedded.1/Bios/BiosRegistry"
+        https_stand_in.routes[manager] = etag_route({"FirmwareVersion": "7.00.00.00"}, '"fw7"')
+        https_stand_in.routes[registry] = etag_route({"RegistryEntries": {"Attributes": []}}, '"reg"')
+        params = {"idrac_ip": "127.0.0.1", "idrac_user": "root", "idrac_password": "calvin",
+                  "idrac_port": https_stand_in.port, "validate_certs": False}
+        for run in range(2):
+            with iDRACRedfishAPI(params) as idrac:
+                assert idrac.invoke_request(registry, "GET", cache=True).json_data == {
+                    "RegistryEntries": {"Attributes": []}}
+        assert [req["path"].split("?")[0] for req in https_stand_in.requests] == [manager, registry]
+        https_stand_in.routes[manager] = etag_route({"FirmwareVersion": "7.10.00.00"}, '"fw71"')
+        monkeypatch.setenv(CACHE_VERSION_TTL_ENV, "0")
+        with iDRACRedfishAPI(params) as idrac:
+            idrac.invoke_request(registry, "GET", cache=True)
+            idrac.invoke_request(registry, "GET", cache=True)
+        assert [(req["path"].split("?")[0], req["headers"].get("If-None-Match"))
+                for req in https_stand_in.requests[2:]] == [
+            (manager, '"fw7"'), (registry, None)]
@@ -17,9 +17,11 @@ __metaclass__ = type
 import pytest
 from ansible.module_utils.urls import ConnectionError, SSLValidationError
 from ansible.module_utils.six.moves.urllib.error import URLError, HTTPError
-from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, OpenURLResponse
+from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME, OpenURLResponse, JobBatchTracker
 from mock import MagicMock
 import json
+import tracemalloc
+from ansible.module_utils.six.moves.urllib.parse import parse_qs, urlparse
 
 MODULE_UTIL_PATH = 'ansible_collections.dellemc.openmanage.plugins.module_utils.'
 OME_OPENURL = 'ome.open_url'
@@ -32,6 +34,61 @@ BAD_REQUEST = 'Bad Request Error'
 ODATA_COUNT = "@odata.count"
 ODATA_TYPE = "@odata.type"
 DDEVICE_TYPE = "#DeviceService.DeviceType"
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def stand_in_params(stand_in):
+    return {"hostname": "127.0.0.1", "username": "admin", "password": "password",
+            "port": stand_in.port, "validate_certs": False, "timeout": 10}
+
+
+def paged_route(total):
+    """Serves $top/$skip pages of a collection of ``total`` devices"""
+    def route(handler, body):
+        query = parse_qs(urlparse(handler.path).query)
+        skip = int(query.get("$skip", [0])[0])
+        top = int(query.get("$top", [100])[0])
+        value = [{"Id": idx} for idx in range(skip, min(skip + top, total))]
+        return 200, JSON_HEADERS, {"@odata.count": total, "value": value}
+    return route
+
+
+def selecting_route(payload, supported=True):
+    """Serves the inventory, projected to $select when supported and rejecting $select otherwise"""
+    devices = json.loads(payload)
+    projections = {}
+
+    def route(handler, body):
+        query = parse_qs(urlparse(handler.path).query)
+        if "$select" not in query:
+            return 200, JSON_HEADERS, payload
+        if not supported:
+            return 400, JSON_HEADERS, {"error": {"message": "Invalid $select"}}
+        fields = query["$select"][0].split(",")
+        if query["$select"][0] not in projections:
+            value = [dict((k, v) for k, v in item.items() if k in fields) for item in devices["value"]]
+            projections[query["$select"][0]] = json.dumps({"@odata.count": len(value), "value": value}).encode()
+        return 200, JSON_HEADERS, projections[query["$select"][0]]
+    return route
+
+
+def device_filter_route(total, page_size=100):
+    """Serves $top/$skip pages of ``total`` devices, narrowed by a '$filter' of 'or' clauses"""
+    devices = [{"Id": 10000 + idx, "DeviceServiceTag": "SVC{0:05d}".format(idx), "Model": "PowerEdge R750",
+                "DeviceManagement": [{"NetworkAddress": "10.0.{0}.{1}".format(idx // 250, idx % 250)}]}
+               for idx in range(total)]
+
+    def route(handler, body):
+        query = parse_qs(urlparse(handler.path).query)
+        value = devices
+        if "$filter" in query:
+            clauses = [clause.split(" eq ") for clause in query["$filter"][0].split(" or ")]
+            value = [device for device in devices
+                     if any(str(device[field]) == match.strip("'") for field, match in clauses)]
+        skip = int(query.get("$skip", [0])[0])
+        top = int(query.get("$top", [page_size])[0])
+        return 200, JSON_HEADERS, {"@odata.count": len(value), "value": value[skip:skip + top]}
+    return route
 
 
 class TestOMERest(object):
@@ -133,6 +190,59 @@ class TestOMERest(object):
         assert reports == {"resp_obj": mock_response,
                            "report_list": list(range(50)) + (list(range(50)))}
 
+    @pytest.mark.parametrize("page_workers", [1, 4])
+    def test_get_all_report_details_page_workers(self, page_workers, mocker, module_params):
+        def page(method, uri, query_param=None):
+            skip = (query_param or {}).get("$skip", 0)
+            resp = MagicMock()
+            resp.json_data = {ODATA_COUNT: 230, "value": list(range(skip, min(skip + 50, 230)))}
+            return resp
+        invoke = mocker.patch(MODULE_UTIL_PATH + INVOKE_REQUEST, side_effect=page)
+        obj = RestOME(module_params, page_workers=page_workers)
+        reports = obj.get_all_report_details(DEVICE_API)
+        assert reports["report_list"] == list(range(230))
+        assert reports["resp_obj"].json_data["value"] == list(range(200, 230))
+        assert invoke.call_count == 5
+
+    def test_get_all_report_details_concurrent_pages(self, https_stand_in):
+        https_stand_in.routes["/api/DeviceService/Devices"] = paged_route(1000)
+        with RestOME(stand_in_params(https_stand_in), pool_size=8, page_workers=8) as obj:
+            report = obj.get_all_report_details(DEVICE_API)
+        assert [item["Id"] for item in report["report_list"]] == list(range(1000))
+        skips = [int(parse_qs(urlparse(req["path"]).query).get("$skip", [0])[0]) for req in https_stand_in.requests]
+        assert sorted(skips) == list(range(0, 1000, 100))
+        assert obj.requests_sent == 10
+        assert https_stand_in.connections <= 8
+
+    @pytest.mark.parametrize("supported", [True, False])
+    def test_get_all_report_details_select(self, https_stand_in, supported):
+        devices = [{"Id": idx, "DeviceServiceTag": "SVC{0:04d}".format(idx), "Model": "PowerEdge R750",
+                    "DeviceManagement": [{"NetworkAddress": "10.0.0.{0}".format(idx)}]} for idx in range(50)]
+        payload = json.dumps({ODATA_COUNT: len(devices), "value": devices}).encode()
+        https_stand_in.routes["/api/DeviceService/Devices"] = selecting_route(payload, supported)
+        select = ["Id", "DeviceServiceTag", "DeviceManagement"]
+        with RestOME(stand_in_params(https_stand_in), pool_size=1) as obj:
+            for dummy in range(2):
+                report = obj.get_all_report_details(DEVICE_API, select=select)
+        assert [item["Id"] for item in report["report_list"]] == list(range(50))
+        paths = [req["path"] for req in https_stand_in.requests]
+        if supported:
+            assert sorted(report["report_list"][0]) == sorted(select)
+            assert int(report["resp_obj"].resp.headers["Content-Length"]) < len(payload)
+            assert paths == ["/api/DeviceService/Devices?%24select=Id%2CDeviceServiceTag%2CDeviceManagement"] * 2
+        else:
+            assert obj.select_supported is False
+            assert int(report["resp_obj"].resp.headers["Content-Length"]) == len(payload)
+            assert [("%24select" in path) for path in paths] == [True, False, False]
+
+    def test_get_all_report_details_page_error(self, mocker, module_params):
+        first_page = MagicMock()
+        first_page.json_data = {ODATA_COUNT: 200, "value": list(range(50))}
+        mocker.patch(MODULE_UTIL_PATH + INVOKE_REQUEST,
+                     side_effect=[first_page] + [HTTPError(TEST_HOST, 400, BAD_REQUEST, {}, None)] * 3)
+        with pytest.raises(HTTPError):
+            RestOME(module_params, page_workers=3).get_all_report_details(DEVICE_API)
+
     def test_get_report_list_error_case(self, mock_response, mocker, ome_object):
         mocker.patch(MODULE_UTIL_PATH + OME_OPENURL,
                      return_value=mock_response)
@@ -234,6 +344,110 @@ class TestOMERest(object):
         with pytest.raises(HTTPError):
             ome_object.get_all_items_with_pagination(DEVICE_API)
 
+    @pytest.fixture
+    def paged_invoke_request(self, mocker):
+        """Serves 20 pages of 1000 devices linked by '@odata.nextLink', building each page on request"""
+        def page(method, uri, query_param=None):
+            index = 0 if uri == DEVICE_API else int(uri.split("=")[-1])
+            data = {ODATA_COUNT: 20000, "value": [{"Id": idx, "DeviceName": "device-{0:0>120}".format(idx)}
+                                                  for idx in range(index * 1000, (index + 1) * 1000)]}
+            if index < 19:
+                data["@odata.nextLink"] = "/api/DeviceService/Devices?$skip={0}".format(index + 1)
+            resp = MagicMock()
+            resp.json_data = data
+            return resp
+        return mocker.patch(MODULE_UTIL_PATH + INVOKE_REQUEST, side_effect=page)
+
+    def test_iter_items_with_pagination(self, paged_invoke_request, ome_object):
+        pages = ome_object.iter_pages_with_pagination(DEVICE_API)
+        assert paged_invoke_request.call_count == 0
+        assert len(next(pages)["value"]) == 1000
+        assert paged_invoke_request.call_count == 1
+        ids = [item["Id"] for item in ome_object.iter_items_with_pagination(DEVICE_API)]
+        assert ids == list(range(20000))
+        assert paged_invoke_request.call_args_list[-1][0][1] == "/DeviceService/Devices?$skip=19"
+
+    def test_iter_items_with_pagination_peak_memory(self, paged_invoke_request, ome_object):
+        tracemalloc.start()
+        try:
+            count = sum(1 for item in ome_object.iter_items_with_pagination(DEVICE_API) if item["Id"] % 2)
+            streamed_peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.reset_peak()
+            items = ome_object.get_all_items_with_pagination(DEVICE_API)["value"]
+            collected_peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        assert count == 10000 and len(items) == 20000
+        assert streamed_peak * 5 < collected_peak
+
+    @pytest.fixture
+    def device_collection(self, mocker):
+        """Serves 300 devices, answering '$filter' queries of 'or' clauses with the matching devices"""
+        devices = [{"Id": 1000 + idx, "DeviceServiceTag": "SVC{0:04d}".format(idx), "Model": "PowerEdge"}
+                   for idx in range(300)]
+
+        def matches(device, clause):
+            field, value = clause.split(" eq ")
+            return str(device[field]) == value.strip("'")
+
+        def collection(method, uri, query_param=None):
+            resp = MagicMock()
+            clauses = (query_param or {}).get("$filter", "").split(" or ")
+            value = [device for device in devices if any(matches(device, clause) for clause in clauses if clause)] \
+                if "$filter" in (query_param or {}) else devices
+            resp.json_data = {ODATA_COUNT: len(value), "value": list(value)}
+            return resp
+        return mocker.patch(MODULE_UTIL_PATH + INVOKE_REQUEST, side_effect=collection)
+
+    def test_resolve_devices_with_filter(self, device_collection, module_params):
+        obj = RestOME(module_params)
+        resolved = obj.resolve_devices(device_ids=[1001, "1002", 99], service_tags=["SVC0005", "O'NEIL"],
+                                       select=["Model"])
+        assert sorted(resolved["Id"]) == [1001, 1002]
+        assert list(resolved["DeviceServiceTag"]) == ["SVC0005"]
+        assert device_collection.call_count == 1
+        query = device_collection.call_args[1]["query_param"]
+        assert query["$filter"] == "Id eq 1001 or Id eq 1002 or Id eq 99 or DeviceServiceTag eq 'SVC0005' or " \
+                                   "DeviceServiceTag eq 'O''NEIL'"
+        assert query["$select"] == "Model,Id,DeviceServiceTag"
+        assert obj.device_resolutions == [{"strategy": "filter", "identifiers": 5, "requests": 0, "resolved": 3}]
+
+    def test_resolve_devices_batches_filter(self, device_collection, module_params):
+        obj = RestOME(module_params)
+        resolved = obj.resolve_devices(service_tags=["SVC{0:04d}".format(idx) for idx in range(15)])
+        assert len(resolved["DeviceServiceTag"]) == 15
+        assert device_collection.call_count == 2
+
+    def test_resolve_devices_with_index(self, device_collection, module_params, monkeypatch):
+        monkeypatch.setenv("OMAM_DEVICE_FILTER_THRESHOLD", "4")
+        obj = RestOME(module_params)
+        resolved = obj.resolve_devices(device_ids=range(1000, 1005))
+        assert sorted(resolved["Id"]) == list(range(1000, 1005))
+        assert "$filter" not in (device_collection.call_args[1]["query_param"] or {})
+        assert obj.device_resolutions[-1]["strategy"] == "index"
+
+    def test_resolve_devices_filter_rejected(self, device_collection, module_params):
+        collection = device_collection.side_effect
+        device_collection.side_effect = [HTTPError(TEST_HOST, 400, BAD_REQUEST, {}, None)] + [collection(
+            'GET', DEVICE_API)]
+        obj = RestOME(module_params)
+        resolved = obj.resolve_devices(service_tags=["SVC0001"])
+        assert resolved["DeviceServiceTag"]["SVC0001"]["Id"] == 1001
+        assert obj.device_resolutions[-1]["strategy"] == "index"
+        assert obj.device_resolutions[-1]["filter_rejected"] is True
+
+    def test_resolve_devices_requests(self, https_stand_in):
+        https_stand_in.routes["/api/DeviceService/Devices"] = device_filter_route(800)
+        for count, stats in ((2, {"strategy": "filter", "identifiers": 2, "requests": 1, "resolved": 2}),
+                             (200, {"strategy": "index", "identifiers": 200, "requests": 8, "resolved": 200})):
+            tags = ["SVC{0:05d}".format(idx * 3) for idx in range(count)]
+            with RestOME(stand_in_params(https_stand_in), pool_size=1) as obj:
+                resolved = obj.resolve_devices(service_tags=tags, select=["Id", "DeviceServiceTag"])
+            assert sorted(resolved["DeviceServiceTag"]) == sorted(tags)
+            assert [device["Id"] for device in resolved["DeviceServiceTag"].values()] == \
+                [10000 + idx * 3 for idx in range(count)]
+            assert obj.device_resolutions == [stats]
+
     def test_get_device_type(self, mock_response, mocker, ome_object):
         mock_response.success = True
         mock_response.status_code = 200
@@ -286,6 +500,16 @@ class TestOMERest(object):
             obj.json_data
         assert e.value.args[0] == "Unable to parse json"
 
+    def test_json_data_parsed_once(self, mocker):
+        loads_mock = mocker.patch(MODULE_UTIL_PATH + 'ome.json.loads', return_value={"value": "data"})
+        obj = OpenURLResponse({})
+        obj.body = '{"value": "data"}'
+        assert obj.json_data is obj.json_data
+        assert loads_mock.call_count == 1
+        obj.body = '{"value": "new"}'
+        assert obj.json_data == {"value": "data"}
+        assert loads_mock.call_count == 2
+
     @pytest.mark.parametrize("status_assert", [
         {'id': 2060, 'exist_poll': True, 'job_failed': False,
             'message': "Job Completed successfully."},
@@ -316,20 +540,59 @@ class TestOMERest(object):
                 obj.get_job_info(12345)
 
     @pytest.mark.parametrize("ret_val", [
-        (True, False, "My Message"),
-        (False, True, "The job is not complete after 2 seconds.")])
+        (2060, False, "Job Completed successfully."),
+        (2070, True, "Job is in Failed state, and is not completed."),
+        (2050, True, "The job is not complete after 2 seconds.")])
     def test_job_tracking(self, mocker, mock_response, ret_val, ome_object):
-        mocker.patch(MODULE_UTIL_PATH + 'ome.time.sleep',
+        mocker.patch(MODULE_UTIL_PATH + 'job_poller.time.sleep',
                      return_value=())
+        mock_response.json_data = {"LastRunStatus": {"Id": ret_val[0]}}
         mocker.patch(MODULE_UTIL_PATH + INVOKE_REQUEST,
                      return_value=mock_response)
-
-        mocker.patch(MODULE_UTIL_PATH + 'ome.RestOME.get_job_info',
-                     return_value=ret_val)
         job_failed, message = ome_object.job_tracking(12345, 2, 1)
         assert job_failed is ret_val[1]
         assert message == ret_val[2]
 
+    def test_job_tracking_http_error(self, mocker, ome_object):
+        mocker.patch(MODULE_UTIL_PATH + 'job_poller.time.sleep', return_value=())
+        mocker.patch(MODULE_UTIL_PATH + INVOKE_REQUEST,
+                     side_effect=HTTPError(TEST_HOST, 400, BAD_REQUEST, {}, None))
+        assert ome_object.job_tracking(12345, 2, 1) == (True, "Unable to track the job status of 12345.")
+
+    def test_job_batch_tracker(self, mocker):
+        mocker.patch(MODULE_UTIL_PATH + 'job_poller.time.sleep', return_value=None)
+
+        def job(job_id, status):
+            return {"Id": job_id, "LastRunStatus": {"Id": status}}
+
+        polls = [[job(1, 2050), job(2, 2040), job(3, 2060)],
+                 [job(1, 2060), job(2, 2050)],
+                 [job(2, 2070)]]
+        rest_obj = MagicMock()
+        rest_obj.invoke_request.side_effect = [MagicMock(json_data={"value": value}) for value in polls]
+        tracker = JobBatchTracker(rest_obj, [1, 2, 3])
+        assert tracker.wait(job_wait_sec=60, sleep_time=5) is True
+        filters = [call[1]["query_param"]["$filter"] for call in rest_obj.invoke_request.call_args_list]
+        assert filters == ["Id eq 1 or Id eq 2 or Id eq 3", "Id eq 1 or Id eq 2", "Id eq 2"]
+        assert [tracker.status(job_id) for job_id in (1, 2, 3)] == [2060, 2070, 2060]
+        assert tracker.transitions == [
+            {"Id": 1, "From": None, "To": 2050}, {"Id": 2, "From": None, "To": 2040}, {"Id": 3, "From": None, "To": 2060},
+            {"Id": 1, "From": 2050, "To": 2060}, {"Id": 2, "From": 2040, "To": 2050},
+            {"Id": 2, "From": 2050, "To": 2070}]
+
+    def test_job_batch_tracker_timeout(self, mocker):
+        mocker.patch(MODULE_UTIL_PATH + 'job_poller.time.sleep', return_value=None)
+        rest_obj = MagicMock()
+        rest_obj.invoke_request.return_value = MagicMock(
+            json_data={"value": [{"Id": 1, "LastRunStatus": {"Id": 2050}}]})
+        tracker = JobBatchTracker(rest_obj, [1])
+        assert tracker.wait(job_wait_sec=10, sleep_time=5) is False
+        assert tracker.pending == set([1]) and len(tracker.transitions) == 1
+        rest_obj.invoke_request.side_effect = HTTPError(TEST_HOST, 500, BAD_REQUEST, {}, None)
+        with pytest.raises(HTTPError):
+            tracker.wait(job_wait_sec=10, sleep_time=5, max_errors=2)
+        assert JobBatchTracker(rest_obj, []).wait() is True
+
     def test_strip_substr_dict(self, mocker, mock_response, ome_object):
         data_dict = {"@odata.context": "/api/$metadata#Collection(DeviceService.DeviceType)",
                      ODATA_COUNT: 5,
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.8.0
+# Copyright (C) 2024 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import itertools
+import os
+import threading
+import pytest
+from ansible.module_utils.six.moves.urllib.error import URLError
+from ansible_collections.dellemc.openmanage.plugins.module_utils.rate_limit import ApplianceLimiter, NULL_LIMITER, \
+    RATE_LIMIT_DIR_ENV, MAX_CONCURRENT_ENV, MAX_RATE_ENV, SLOT_TIMEOUT_ENV, DEFAULT_SLOT_TIMEOUT, HAS_FCNTL
+from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME
+
+pytestmark = pytest.mark.skipif(not HAS_FCNTL, reason="file locks are not supported")
+
+RATE_LIMIT_PATH = "ansible_collections.dellemc.openmanage.plugins.module_utils.rate_limit."
+
+
+@pytest.fixture
+def limit_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv(RATE_LIMIT_DIR_ENV, str(tmp_path))
+    monkeypatch.delenv(MAX_CONCURRENT_ENV, raising=False)
+    monkeypatch.delenv(MAX_RATE_ENV, raising=False)
+    monkeypatch.delenv(SLOT_TIMEOUT_ENV, raising=False)
+    return tmp_path
+
+
+class TestApplianceLimiter(object):
+
+    def test_disabled_without_limits(self, limit_dir):
+        assert ApplianceLimiter.from_env("192.168.0.1") is NULL_LIMITER
+        assert NULL_LIMITER.call(max, 1, 2) == 2
+
+    def test_from_env(self, limit_dir, monkeypatch):
+        monkeypatch.setenv(MAX_CONCURRENT_ENV, "4")
+        monkeypatch.setenv(MAX_RATE_ENV, "10")
+        limiter = ApplianceLimiter.from_env("192.168.0.1")
+        assert (limiter.directory, limiter.max_concurrent, limiter.rate, limiter.slot_timeout) == \
+            (str(limit_dir), 4, 10, DEFAULT_SLOT_TIMEOUT)
+        monkeypatch.setenv(SLOT_TIMEOUT_ENV, "20")
+        assert ApplianceLimiter.from_env("192.168.0.1").slot_timeout == 20
+
+    def test_slots_are_shared_by_limiters_of_host(self, limit_dir, mocker):
+        sleep = mocker.patch(RATE_LIMIT_PATH + "time.sleep")
+        holder = ApplianceLimiter(str(limit_dir), "192.168.0.1", max_concurrent=1)
+        waiter = ApplianceLimiter(str(limit_dir), "192.168.0.1", max_concurrent=1)
+        other_host = ApplianceLimiter(str(limit_dir), "192.168.0.2", max_concurrent=1)
+        released = threading.Event()
+
+        def release_after_polls(seconds):
+            if sleep.call_count >= 3:
+                released.set()
+        sleep.side_effect = release_after_polls
+        with holder.slot():
+            assert other_host.call(lambda: "sent") == "sent"
+            thread = threading.Thread(target=waiter.call, args=(lambda: None,))
+            thread.start()
+            assert released.wait(10)
+        thread.join(10)
+        assert not thread.is_alive()
+        assert sleep.call_count >= 3
+
+    def test_slot_wait_times_out(self, limit_dir, mocker):
+        sleep = mocker.patch(RATE_LIMIT_PATH + "time.sleep")
+        mocker.patch(RATE_LIMIT_PATH + "time.monotonic", side_effect=itertools.count(100, 4))
+        holder = ApplianceLimiter(str(limit_dir), "192.168.0.1", max_concurrent=1)
+        waiter = ApplianceLimiter(str(limit_dir), "192.168.0.1", max_concurrent=1, slot_timeout=10)
+        func = mocker.MagicMock()
+        with holder.slot():
+            with pytest.raises(URLError) as err:
+                waiter.call(func)
+        assert "192.168.0.1" in str(err.value.reason)
+        assert sleep.call_count == 2
+        assert func.call_count == 0
+        assert waiter.call(lambda: "sent") == "sent"
+
+    def test_lock_free_slot(self, limit_dir):
+        holder = ApplianceLimiter(str(limit_dir), "192.168.0.1", max_concurrent=2)
+        waiter = ApplianceLimiter(str(limit_dir), "192.168.0.1", max_concurrent=2)
+        first = holder._lock_free_slot()
+        second = waiter._lock_free_slot()
+        slot0 = os.stat(holder._path(".slot0")).st_ino
+        assert os.fstat(first.fileno()).st_ino == slot0
+        assert os.fstat(second.fileno()).st_ino == os.stat(holder._path(".slot1")).st_ino
+        assert waiter._lock_free_slot() is None
+        first.close()
+        third = waiter._lock_free_slot()
+        assert os.fstat(third.fileno()).st_ino == slot0
+        second.close()
+        third.close()
+
+    def test_slot_is_released_on_error(self, limit_dir):
+        limiter = ApplianceLimiter(str(limit_dir), "192.168.0.1", max_concurrent=1)
+        with pytest.raises(ValueError):
+            limiter.call(int, "not a number")
+        assert limiter.call(lambda: "sent") == "sent"
+
+    def test_token_bucket(self, limit_dir, mocker):
+        mocker.patch(RATE_LIMIT_PATH + "time.time", return_value=1000.0)
+        first = ApplianceLimiter(str(limit_dir), "192.168.0.1", rate=2)
+        second = ApplianceLimiter(str(limit_dir), "192.168.0.1", rate=2)
+        assert [first.reserve(), second.reserve(), first.reserve(), second.reserve()] == [0, 0, 0.5, 1.0]
+        mocker.patch(RATE_LIMIT_PATH + "time.time", return_value=1010.0)
+        assert first.reserve() == 0
+
+    def test_call_waits_for_token(self, limit_dir, mocker):
+        sleep = mocker.patch(RATE_LIMIT_PATH + "time.sleep")
+        mocker.patch(RATE_LIMIT_PATH + "time.time", return_value=1000.0)
+        limiter = ApplianceLimiter(str(limit_dir), "192.168.0.1", rate=1)
+        assert [limiter.call(lambda: idx) for idx in range(3)] == [0, 1, 2]
+        assert sleep.call_args_list == [((1.0,),), ((2.0,),)]
+
+    def test_unusable_directory_does_not_limit(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        limiter = ApplianceLimiter(str(blocker / "limits"), "192.168.0.1", max_concurrent=1, rate=1)
+        assert limiter.call(lambda: "sent") == "sent"
+
+    def test_rest_ome_respects_limits(self, limit_dir, https_stand_in, monkeypatch, mocker):
+        sleep = mocker.patch(RATE_LIMIT_PATH + "time.sleep")
+        monkeypatch.setenv(MAX_CONCURRENT_ENV, "2")
+        monkeypatch.setenv(MAX_RATE_ENV, "1")
+        params = {"hostname": "127.0.0.1", "username": "admin", "password": "password",
+                  "port": https_stand_in.port, "validate_certs": False, "timeout": 10}
+        with RestOME(params, pool_size=1) as obj:
+            for dummy in range(3):
+                assert obj.invoke_request("GET", "DeviceService/Devices").json_data == {"value": []}
+        assert len(https_stand_in.requests) == 3
+        assert sleep.call_count == 2
+        assert len(list(limit_dir.glob("*.slot*"))) == 1
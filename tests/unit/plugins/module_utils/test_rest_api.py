@@ -132,3 +132,13 @@ class TestRestAPI(object):
         with pytest.raises(ValueError) as e:
             obj.json_data
         assert e.value.args[0] == "Unable to parse json"
+
+    def test_json_data_parsed_once(self, mocker):
+        loads_mock = mocker.patch(MODULE_UTIL_PATH + 'rest_api.json.loads', return_value={"value": "data"})
+        obj = OpenURLResponse({})
+        obj.body = '{"value": "data"}'
+        assert obj.json_data is obj.json_data
+        assert loads_mock.call_count == 1
+        obj.body = '{"value": "new"}'
+        assert obj.json_data == {"value": "data"}
+        assert loads_mock.call_count == 2
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.8.0
+# Copyright (C) 2024 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import pytest
+from mock import MagicMock
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible_collections.dellemc.openmanage.plugins.module_utils.rest_transport import OpenURLResponse, \
+    OpenURLBackend, RecordingBackend, RestTransport, TransportBackend, get_omam_ca_env
+from ansible_collections.dellemc.openmanage.plugins.module_utils.transport import HTTPSConnectionPool
+from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME
+from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI
+from ansible_collections.dellemc.openmanage.plugins.module_utils.redfish import Redfish
+from ansible_collections.dellemc.openmanage.plugins.module_utils.rest_api import RestAPI
+from ansible_collections.dellemc.openmanage.plugins.module_utils.session_utils import SessionAPI
+
+CA_ENVS = ("REQUESTS_CA_BUNDLE", "CURL_CA_BUNDLE", "OMAM_CA_BUNDLE")
+
+
+def clients(port=443):
+    common = {"username": "admin", "password": "password", "validate_certs": False, "ca_path": None, "timeout": 10}
+    return {
+        "RestOME": RestOME(dict(common, hostname="127.0.0.1", port=port)),
+        "iDRACRedfishAPI": iDRACRedfishAPI({"idrac_ip": "127.0.0.1", "idrac_user": "admin", "idrac_password": "password",
+                                            "idrac_port": port, "validate_certs": False, "timeout": 10}),
+        "Redfish": Redfish(dict(common, baseuri="127.0.0.1:{0}".format(port))),
+        "RestAPI": RestAPI("/api/", dict(common, hostname="127.0.0.1", port=port)),
+        "SessionAPI": SessionAPI(dict(common, hostname="127.0.0.1", port=port, state="present")),
+    }
+
+
+@pytest.fixture
+def no_ca_env(monkeypatch):
+    for name in CA_ENVS:
+        monkeypatch.delenv(name, raising=False)
+
+
+class TestRestTransport(object):
+
+    @pytest.mark.parametrize("status, success", [(200, True), (204, True), (299, True), (302, False), (404, False)])
+    def test_response_success(self, status, success):
+        resp = MagicMock()
+        resp.read.return_value = b"{}"
+        resp.getcode.return_value = status
+        assert OpenURLResponse(resp).success is success
+
+    def test_ca_env_order(self, no_ca_env, monkeypatch):
+        assert get_omam_ca_env() is None
+        monkeypatch.setenv("OMAM_CA_BUNDLE", "/omam.pem")
+        monkeypatch.setenv("CURL_CA_BUNDLE", "/curl.pem")
+        assert get_omam_ca_env() == "/curl.pem"
+
+    def test_clients_share_common_args(self, no_ca_env, monkeypatch):
+        monkeypatch.setenv("OMAM_CA_BUNDLE", "/omam.pem")
+        for name, client in clients().items():
+            args = client._url_common_args_spec("GET", None, headers={"X-Trace": "1"})
+            assert args["method"] == "GET", name
+            assert (args["ca_path"], client.ca_path, args["timeout"], args["use_proxy"]) == \
+                ("/omam.pem", "/omam.pem", 10, True), name
+            assert args["headers"]["X-Trace"] == "1", name
+            assert args["headers"] is not client._headers and "X-Trace" not in client._headers, name
+            assert client._url_common_args_spec("GET", 60)["timeout"] == 60, name
+
+    def test_settings_read_per_request(self, no_ca_env):
+        client = clients()["RestOME"]
+        client.validate_certs = True
+        client.ca_path = "/custom.pem"
+        args = client._args_without_session("GET", None)
+        assert (args["validate_certs"], args["ca_path"], args["force_basic_auth"]) == (True, "/custom.pem", True)
+        assert client._args_with_session("GET", None)["force_basic_auth"] is False
+
+    @pytest.mark.parametrize("name", ["iDRACRedfishAPI", "Redfish"])
+    def test_login_without_basic_auth(self, name, no_ca_env):
+        client = clients()[name]
+        assert "url_username" not in client._args_without_session("/redfish/v1/Sessions", "POST", None)
+        assert client._args_without_session("/redfish/v1/Systems", "GET", None)["url_username"] == "admin"
+
+    def test_base_headers_restored(self, no_ca_env):
+        client = clients()["RestAPI"]
+        client._headers["Accept"] = "text/plain"
+        assert client._args_with_session("GET", None)["headers"]["Accept"] == "application/json"
+
+    def test_backend_interface(self):
+        with pytest.raises(TypeError):
+            TransportBackend()
+        assert isinstance(HTTPSConnectionPool("https://127.0.0.1"), TransportBackend)
+        opener = MagicMock()
+        OpenURLBackend(opener).open("https://127.0.0.1/api", data="{}", method="POST")
+        opener.assert_called_once_with("https://127.0.0.1/api", data="{}", method="POST")
+
+    def test_recording_backend_swapped_in(self, https_stand_in, no_ca_env):
+        https_stand_in.routes["/redfish/v1/Missing"] = (404, {"Content-Type": "application/json"}, {"error": {}})
+        recorder = RecordingBackend()
+        idrac = clients(https_stand_in.port)["iDRACRedfishAPI"]
+        idrac.transport.backend = recorder
+        assert idrac.invoke_request("/redfish/v1/Systems", "GET").json_data == {"value": []}
+        with pytest.raises(HTTPError):
+            idrac.invoke_request("/redfish/v1/Missing", "GET")
+        ome = clients(https_stand_in.port)["RestOME"]
+        ome.transport.backend = recorder
+        ome.invoke_request("POST", "DeviceService/Actions", data={"Id": 1})
+        assert [(record["method"], record["url"].split(str(https_stand_in.port))[-1], record["status"])
+                for record in recorder.records] == [("GET", "/redfish/v1/Systems", 200),
+                                                    ("GET", "/redfish/v1/Missing", 404),
+                                                    ("POST", "/api/DeviceService/Actions", 200)]
+        assert recorder.records[-1]["data"] == '{"Id": 1}'
+        assert len(https_stand_in.requests) == 3
+
+    def test_body_read_within_limiter_slot(self):
+        events = []
+
+        class Limiter(object):
+            def call(self, func, *args, **kwargs):
+                events.append("acquire")
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    events.append("release")
+        resp = MagicMock(headers={})
+        resp.read.side_effect = lambda: events.append("read") or b'{"value": []}'
+        backend = MagicMock(spec=TransportBackend)
+        backend.open.return_value = resp
+        transport = RestTransport(MagicMock(), "RestOME", "127.0.0.1", backend=backend)
+        transport.limiter = Limiter()
+        assert transport.send("GET", "https://127.0.0.1/api/DeviceService/Devices").json_data == {"value": []}
+        assert events == ["acquire", "read", "release"]
+
+    def test_transport_backend_overrides_client(self):
+        client = MagicMock(_headers={}, ca_path="/ca.pem", timeout=5)
+        backend, client_backend = MagicMock(), MagicMock()
+        backend.open.return_value.read.return_value = b'{"value": 1}'
+        transport = RestTransport(client, "RestOME", "192.168.0.1", backend=backend)
+        assert transport.send("GET", "https://192.168.0.1/api", backend=client_backend).json_data == {"value": 1}
+        assert client_backend.open.call_count == 0
@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.8.0
+# Copyright (C) 2024 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import socket
+import pytest
+from mock import MagicMock
+from email.message import Message
+from ansible.module_utils.six.moves.urllib.error import HTTPError, URLError
+from ansible.module_utils.urls import SSLValidationError
+from ansible_collections.dellemc.openmanage.plugins.module_utils.retry_policy import RetryPolicy, retry_after, \
+    RETRY_ATTEMPTS_ENV, RETRY_STATUS_CODES_ENV, RETRY_METHODS_ENV, RETRY_BACKOFF_ENV, RETRY_MAX_BACKOFF_ENV
+from ansible_collections.dellemc.openmanage.plugins.module_utils.instrumentation import INSTRUMENTATION_ENV, \
+    SPANS_FILE_ENV, request_summary, reset_spans
+from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME
+from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import get_power_state, POWER_STATE_RETRY
+
+RETRY_SLEEP = "ansible_collections.dellemc.openmanage.plugins.module_utils.retry_policy.time.sleep"
+JSON = {"Content-Type": "application/json"}
+
+
+def http_error(code, retry_after_value=None):
+    headers = Message()
+    if retry_after_value is not None:
+        headers["Retry-After"] = retry_after_value
+    return HTTPError("https://192.168.0.1/api/Jobs", code, "error", headers, None)
+
+
+def busy_then_ok(failures, code=503, retry_after_value="0", payload=None):
+    calls = []
+
+    def route(handler, body):
+        calls.append(handler.path)
+        if len(calls) <= failures:
+            headers = dict(JSON)
+            if retry_after_value is not None:
+                headers["Retry-After"] = retry_after_value
+            return code, headers, {"error": "busy"}
+        return 200, JSON, payload or {"value": []}
+    return route
+
+
+@pytest.fixture
+def sleeps(mocker):
+    return mocker.patch(RETRY_SLEEP)
+
+
+@pytest.fixture
+def instrumented(monkeypatch):
+    monkeypatch.setenv(INSTRUMENTATION_ENV, "true")
+    monkeypatch.delenv(SPANS_FILE_ENV, raising=False)
+    reset_spans()
+    yield
+    reset_spans()
+
+
+class TestRetryPolicy(object):
+
+    @pytest.mark.parametrize("method, calls", [("GET", 3), ("HEAD", 3), ("PUT", 1), ("DELETE", 1), ("POST", 1)])
+    def test_safe_methods_retried_by_default(self, monkeypatch, sleeps, method, calls):
+        for name in (RETRY_ATTEMPTS_ENV, RETRY_STATUS_CODES_ENV, RETRY_METHODS_ENV):
+            monkeypatch.delenv(name, raising=False)
+        send = MagicMock(side_effect=http_error(503))
+        with pytest.raises(HTTPError):
+            RetryPolicy.from_env().call(method, send)
+        assert send.call_count == calls
+        assert sleeps.call_count == calls - 1
+
+    def test_disabled_with_zero_attempts(self, monkeypatch, sleeps):
+        monkeypatch.setenv(RETRY_ATTEMPTS_ENV, "0")
+        send = MagicMock(side_effect=http_error(503))
+        with pytest.raises(HTTPError):
+            RetryPolicy.from_env().call("GET", send)
+        assert send.call_count == 1
+        assert sleeps.call_count == 0
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv(RETRY_ATTEMPTS_ENV, "4")
+        monkeypatch.setenv(RETRY_STATUS_CODES_ENV, "500, 503")
+        monkeypatch.setenv(RETRY_METHODS_ENV, "get,post")
+        monkeypatch.setenv(RETRY_BACKOFF_ENV, "2")
+        monkeypatch.setenv(RETRY_MAX_BACKOFF_ENV, "8")
+        policy = RetryPolicy.from_env()
+        assert (policy.attempts, policy.status_codes, policy.methods, policy.backoff, policy.max_backoff) == \
+            (4, (500, 503), ("GET", "POST"), 2, 8)
+
+    @pytest.mark.parametrize("method, err, retryable", [
+        ("GET", http_error(503), True),
+        ("delete", http_error(429), True),
+        ("GET", http_error(404), False),
+        ("GET", http_error(500), False),
+        ("POST", http_error(503), False),
+        ("PATCH", URLError(ConnectionResetError()), False),
+        ("GET", URLError(ConnectionResetError()), True),
+        ("PUT", ConnectionResetError(), True),
+        ("GET", socket.timeout(), True),
+        ("GET", SSLValidationError("certificate verify failed"), False),
+        ("GET", ValueError("bad json"), False),
+    ])
+    def test_is_retryable(self, method, err, retryable):
+        assert RetryPolicy(attempts=3).is_retryable(method, err) is retryable
+
+    @pytest.mark.parametrize("err, retryable", [
+        (ValueError("bad json"), True),
+        (ConnectionResetError(), True),
+        (http_error(500), True),
+        (http_error(404), False),
+        (SSLValidationError("certificate verify failed"), False),
+    ])
+    def test_is_retryable_with_errors(self, err, retryable):
+        assert POWER_STATE_RETRY.is_retryable("GET", err) is retryable
+
+    def test_full_jitter_backoff(self, mocker):
+        uniform = mocker.patch("ansible_collections.dellemc.openmanage.plugins.module_utils.retry_policy."
+                               "random.uniform", side_effect=lambda low, high: high)
+        policy = RetryPolicy(attempts=8, backoff=1, max_backoff=30)
+        assert [policy.delay(attempt) for attempt in range(7)] == [1, 2, 4, 8, 16, 30, 30]
+        assert all(call[0][0] == 0 for call in uniform.call_args_list)
+
+    @pytest.mark.parametrize("value, expected", [
+        ("5", 5), ("0", 0), ("-3", 0), ("soon", None), (None, None),
+        ("Thu, 01 Jan 1970 00:00:00 GMT", 0),
+    ])
+    def test_retry_after(self, value, expected):
+        assert retry_after(http_error(503, value)) == expected
+
+    def test_retry_after_is_capped(self):
+        policy = RetryPolicy(attempts=2, max_backoff=10)
+        assert policy.delay(0, http_error(503, "7")) == 7
+        assert policy.delay(0, http_error(503, "120")) == 10
+
+    def test_gives_up_after_attempts(self, sleeps):
+        send = MagicMock(side_effect=http_error(503, "1"))
+        span = MagicMock()
+        with pytest.raises(HTTPError):
+            RetryPolicy(attempts=2).call("GET", send, span)
+        assert send.call_count == 3
+        assert sleeps.call_args_list == [((1,),), ((1,),)]
+        assert span.add_retry.call_count == 2
+
+
+class TestClientRetries(object):
+
+    def test_rest_ome_retries_busy_appliance(self, https_stand_in, monkeypatch, sleeps, instrumented):
+        monkeypatch.setenv(RETRY_ATTEMPTS_ENV, "3")
+        https_stand_in.routes["/api/DeviceService/Devices"] = busy_then_ok(2, retry_after_value="2")
+        params = {"hostname": "127.0.0.1", "username": "admin", "password": "password",
+                  "port": https_stand_in.port, "validate_certs": False, "timeout": 10}
+        with RestOME(params, pool_size=1) as obj:
+            assert obj.invoke_request("GET", "DeviceService/Devices").json_data == {"value": []}
+        assert len(https_stand_in.requests) == 3
+        assert sleeps.call_args_list == [((2,),), ((2,),)]
+        endpoint = request_summary()["endpoints"][0]
+        assert (endpoint["count"], endpoint["retries"], endpoint["statuses"]) == (1, 2, ["200"])
+
+    def test_idrac_does_not_retry_post(self, https_stand_in, monkeypatch, sleeps):
+        monkeypatch.setenv(RETRY_ATTEMPTS_ENV, "3")
+        https_stand_in.routes["/redfish/v1/Actions"] = busy_then_ok(1)
+        params = {"idrac_ip": "127.0.0.1", "idrac_user": "admin", "idrac_password": "password",
+                  "idrac_port": https_stand_in.port, "validate_certs": False, "timeout": 10}
+        with pytest.raises(HTTPError) as err:
+            iDRACRedfishAPI(params).invoke_request("/redfish/v1/Actions", "POST", data={})
+        assert err.value.code == 503
+        assert len(https_stand_in.requests) == 1
+        assert sleeps.call_count == 0
+
+    def test_power_state_retries_restarting_idrac(self, https_stand_in, monkeypatch, sleeps):
+        monkeypatch.setenv(RETRY_ATTEMPTS_ENV, "3")
+        https_stand_in.routes["/redfish/v1/Systems/System.Embedded.1"] = busy_then_ok(
+            5, retry_after_value=None, payload={"PowerState": "On"})
+        params = {"idrac_ip": "127.0.0.1", "idrac_user": "admin", "idrac_password": "password",
+                  "idrac_port": https_stand_in.port, "validate_certs": False, "timeout": 10}
+        assert get_power_state(iDRACRedfishAPI(params), "/redfish/v1/Systems/System.Embedded.1") == "On"
+        assert len(https_stand_in.requests) == 6
+        assert sleeps.call_count == 5
+
+    def test_power_state_replaces_transport_retries(self, sleeps):
+        idrac = MagicMock()
+        idrac.invoke_request.return_value = MagicMock(json_data={"PowerState": "On"})
+        assert get_power_state(idrac, "/redfish/v1/Systems/System.Embedded.1") == "On"
+        idrac.invoke_request.assert_called_once_with("/redfish/v1/Systems/System.Embedded.1", "GET",
+                                                     retry_policy=POWER_STATE_RETRY)
+
+    def test_power_state_unknown_on_client_error(self, sleeps):
+        idrac = MagicMock()
+        idrac.invoke_request.side_effect = http_error(401)
+        assert get_power_state(idrac, "/redfish/v1/Systems/System.Embedded.1") == "Unknown"
+        assert idrac.invoke_request.call_count == 1
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.8.0
+# Copyright (C) 2024 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import json
+import os
+import time
+import pytest
+from mock import MagicMock
+from ansible.module_utils.six.moves.urllib.error import URLError
+from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME
+from ansible_collections.dellemc.openmanage.plugins.module_utils.idrac_redfish import iDRACRedfishAPI
+from ansible_collections.dellemc.openmanage.plugins.module_utils.session_cache import SessionCache, \
+    SESSION_CACHE_DIR_ENV, SESSION_CACHE_TTL_ENV
+from ansible_collections.dellemc.openmanage.plugins.module_utils.retry_policy import RETRY_ATTEMPTS_ENV
+
+pytest.importorskip("cryptography")
+
+KEY = ["ome", "192.168.0.1", 443, "admin"]
+JSON = {"Content-Type": "application/json"}
+
+
+@pytest.fixture
+def session_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv(SESSION_CACHE_DIR_ENV, str(tmp_path))
+    monkeypatch.delenv(SESSION_CACHE_TTL_ENV, raising=False)
+    return tmp_path
+
+
+def login(session_id="1", token="token-1"):
+    return MagicMock(return_value=(session_id, token))
+
+
+def requests_by_method(stand_in):
+    methods = {}
+    for request in stand_in.requests:
+        methods[request["method"]] = methods.get(request["method"], 0) + 1
+    return methods
+
+
+class TestSessionCache(object):
+
+    def test_disabled_without_directory(self, monkeypatch):
+        monkeypatch.delenv(SESSION_CACHE_DIR_ENV, raising=False)
+        assert SessionCache.from_env() is None
+
+    def test_reuses_valid_session(self, session_cache_dir):
+        cache = SessionCache.from_env()
+        first = login()
+        assert cache.session(KEY, "password", first, MagicMock()) == ("1", "token-1")
+        validate = MagicMock(return_value=True)
+        assert cache.session(KEY, "password", login("2", "token-2"), validate) == ("1", "token-1")
+        validate.assert_called_once_with("1", "token-1")
+        assert first.call_count == 1
+
+    def test_token_encrypted_at_rest(self, session_cache_dir):
+        cache = SessionCache(str(session_cache_dir))
+        cache.store(KEY, "password", "1", "secret-token")
+        contents = "".join(path.read_text() for path in session_cache_dir.iterdir()
+                           if path.suffix == ".session")
+        assert "secret-token" not in contents and "admin" not in contents
+        assert cache.load(KEY, "other password") is None
+        assert cache.load(["ome", "192.168.0.2", 443, "admin"], "password") is None
+        assert cache.load(KEY, "password")["token"] == "secret-token"
+
+    def test_rejected_session_renewed(self, session_cache_dir):
+        cache = SessionCache.from_env()
+        cache.store(KEY, "password", "1", "token-1")
+        renew = login("2", "token-2")
+        assert cache.session(KEY, "password", renew, MagicMock(return_value=False)) == ("2", "token-2")
+        assert cache.load(KEY, "password")["session_id"] == "2"
+
+    def test_idle_session_renewed_without_validation(self, session_cache_dir, monkeypatch):
+        monkeypatch.setenv(SESSION_CACHE_TTL_ENV, "60")
+        cache = SessionCache.from_env()
+        cache.store(KEY, "password", "1", "token-1")
+        path = [path for path in session_cache_dir.iterdir() if path.suffix == ".session"][0]
+        entry = json.loads(path.read_text())
+        entry["used"] = time.time() - 120
+        path.write_text(json.dumps(entry))
+        validate = MagicMock()
+        logout = MagicMock()
+        assert cache.session(KEY, "password", login("2", "token-2"), validate, logout) == ("2", "token-2")
+        validate.assert_not_called()
+        logout.assert_called_once_with("1", "token-1")
+
+    @pytest.mark.parametrize("validate", [MagicMock(return_value=False), MagicMock(side_effect=URLError("timed out")),
+                                          MagicMock(side_effect=ValueError("Unable to parse json"))])
+    def test_failed_validation_renewed(self, session_cache_dir, validate):
+        cache = SessionCache.from_env()
+        cache.store(KEY, "password", "1", "token-1")
+        logout = MagicMock()
+        assert cache.session(KEY, "password", login("2", "token-2"), validate, logout) == ("2", "token-2")
+        logout.assert_called_once_with("1", "token-1")
+        assert cache.load(KEY, "password")["session_id"] == "2"
+
+    def test_rest_ome_idle_session_deleted(self, https_stand_in, session_cache_dir, monkeypatch):
+        monkeypatch.setenv(SESSION_CACHE_TTL_ENV, "60")
+        https_stand_in.routes["/api/SessionService/Sessions"] = (201, dict(JSON, **{"X-Auth-Token": "token-10"}),
+                                                                 {"Id": "10"})
+        https_stand_in.routes["/api/SessionService/Sessions('1')"] = (404, JSON, {"error": {}})
+        params = {"hostname": "127.0.0.1", "username": "admin", "password": "password",
+                  "port": https_stand_in.port, "validate_certs": False}
+        for stale_id in ("1", "9"):
+            cache = SessionCache.from_env()
+            key = ["ome", "127.0.0.1", https_stand_in.port, "admin"]
+            cache.store(key, "password", stale_id, "token-" + stale_id)
+            path = [path for path in session_cache_dir.iterdir() if path.suffix == ".session"][0]
+            entry = json.loads(path.read_text())
+            entry["used"] = time.time() - 120
+            path.write_text(json.dumps(entry))
+            with RestOME(params, req_session=True) as rest_obj:
+                assert rest_obj._headers["X-Auth-Token"] == "token-10"
+        deletes = [request for request in https_stand_in.requests if request["method"] == "DELETE"]
+        assert [(request["path"], request["headers"]["X-Auth-Token"]) for request in deletes] == [
+            ("/api/SessionService/Sessions('1')", "token-1"), ("/api/SessionService/Sessions('9')", "token-9")]
+        assert requests_by_method(https_stand_in) == {"POST": 2, "DELETE": 2}
+
+    def test_rest_ome_session_per_host(self, https_stand_in, session_cache_dir):
+        https_stand_in.routes["/api/SessionService/Sessions"] = (201, dict(JSON, **{"X-Auth-Token": "token-10"}),
+                                                                 {"Id": "10"})
+        params = {"hostname": "127.0.0.1", "username": "admin", "password": "password",
+                  "port": https_stand_in.port, "validate_certs": False}
+        for task in range(3):
+            with RestOME(params, req_session=True) as rest_obj:
+                rest_obj.invoke_request("GET", "DeviceService/Devices")
+        assert requests_by_method(https_stand_in) == {"POST": 1, "GET": 5}
+        validations = [request for request in https_stand_in.requests if "Sessions" in request["path"] and
+                       request["method"] == "GET"]
+        assert [request["headers"]["X-Auth-Token"] for request in validations] == ["token-10", "token-10"]
+
+    def test_rest_ome_without_cache(self, https_stand_in, monkeypatch):
+        monkeypatch.delenv(SESSION_CACHE_DIR_ENV, raising=False)
+        https_stand_in.routes["/api/SessionService/Sessions"] = (201, dict(JSON, **{"X-Auth-Token": "token-10"}),
+                                                                 {"Id": "10"})
+        params = {"hostname": "127.0.0.1", "username": "admin", "password": "password",
+                  "port": https_stand_in.port, "validate_certs": False}
+        for task in range(2):
+            with RestOME(params, req_session=True) as rest_obj:
+                rest_obj.invoke_request("GET", "DeviceService/Devices")
+        assert requests_by_method(https_stand_in) == {"POST": 2, "GET": 2, "DELETE": 2}
+
+    def test_idrac_expired_session(self, https_stand_in, session_cache_dir):
+        tokens = iter(["token-1", "token-2"])
+
+        def create_session(handler, body):
+            return 201, dict(JSON, **{"X-Auth-Token": next(tokens)}), {"Id": "1"}
+
+        https_stand_in.routes["/redfish/v1/Sessions"] = create_session
+        https_stand_in.routes["/redfish/v1/Sessions/1"] = lambda handler, body: (
+            (401, JSON, {"error": {}}) if handler.headers.get("X-Auth-Token") == "token-1" else (200, JSON, {}))
+        params = {"idrac_ip": "127.0.0.1", "idrac_user": "root", "idrac_password": "calvin",
+                  "idrac_port": https_stand_in.port, "validate_certs": False}
+        with iDRACRedfishAPI(params, req_session=True):
+            pass
+        with iDRACRedfishAPI(params, req_session=True) as idrac:
+            assert idrac._headers["X-Auth-Token"] == "token-2"
+        assert requests_by_method(https_stand_in) == {"POST": 2, "GET": 1, "DELETE": 1}
+
+    @pytest.mark.parametrize("status", [400, 500, 503])
+    def test_rest_ome_failed_validation(self, https_stand_in, session_cache_dir, monkeypatch, status):
+        monkeypatch.setenv(RETRY_ATTEMPTS_ENV, "0")
+        https_stand_in.routes["/api/SessionService/Sessions"] = (201, dict(JSON, **{"X-Auth-Token": "token-10"}),
+                                                                 {"Id": "10"})
+        https_stand_in.routes["/api/SessionService/Sessions('1')"] = (status, JSON, {"error": {}})
+        params = {"hostname": "127.0.0.1", "username": "admin", "password": "password",
+                  "port": https_stand_in.port, "validate_certs": False}
+        SessionCache.from_env().store(["ome", "127.0.0.1", https_stand_in.port, "admin"], "password", "1", "token-1")
+        with RestOME(params, req_session=True) as rest_obj:
+            assert rest_obj._headers["X-Auth-Token"] == "token-10"
+        assert [(request["method"], request["headers"].get("X-Auth-Token")) for request in https_stand_in.requests] == [
+            ("GET", "token-1"), ("DELETE", "token-1"), ("POST", None)]
+
+    def test_directory_private(self, tmp_path):
+        directory = tmp_path / "sessions"
+        SessionCache(str(directory)).store(KEY, "password", "1", "token-1")
+        assert os.stat(str(directory)).st_mode & 0o777 == 0o700
@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.8.0
+# Copyright (C) 2024 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import gzip
+import json
+import zlib
+import pytest
+from mock import MagicMock
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible.module_utils.urls import make_context
+from ansible_collections.dellemc.openmanage.plugins.module_utils.transport import HTTPSConnectionPool, \
+    get_env_int, get_pool_size, basic_auth_header, get_ssl_context, open_url, decode_content, POOL_SIZE_ENV, COMPRESSION_ENV
+from ansible_collections.dellemc.openmanage.plugins.module_utils.ome import RestOME
+from ansible_collections.dellemc.openmanage.plugins.module_utils import ome, idrac_redfish, redfish, rest_api, \
+    session_utils
+
+MODULE_UTIL_PATH = 'ansible_collections.dellemc.openmanage.plugins.module_utils.'
+TRANSPORT_OPENURL = 'transport.open_url'
+MAKE_CONTEXT = 'transport.make_context'
+JSON_HEADERS = {"Content-Type": "application/json"}
+RESPONSE_MODULES = [ome, idrac_redfish, redfish, rest_api, session_utils]
+
+
+def ome_params(stand_in):
+    return {"hostname": "127.0.0.1", "username": "admin", "password": "password",
+            "port": stand_in.port, "validate_certs": False, "timeout": 10}
+
+
+class TestConnectionPool(object):
+
+    @pytest.mark.parametrize("env_value, expected", [(None, 0), ("4", 4), ("-2", 0), ("many", 0)])
+    def test_get_pool_size(self, env_value, expected, monkeypatch):
+        if env_value is None:
+            monkeypatch.delenv(POOL_SIZE_ENV, raising=False)
+        else:
+            monkeypatch.setenv(POOL_SIZE_ENV, env_value)
+        assert get_pool_size() == expected
+
+    def test_basic_auth_header(self):
+        assert basic_auth_header("admin", "password") == "Basic YWRtaW46cGFzc3dvcmQ="
+
+    def test_pool_reuses_keep_alive_connection(self, https_stand_in):
+        with HTTPSConnectionPool(https_stand_in.base_url + "/api", maxsize=2) as pool:
+            for dummy in range(5):
+                resp = pool.open(https_stand_in.base_url + "/api/DeviceService/Devices?$top=1", method="GET",
+                                 validate_certs=False, url_username="admin", url_password="password",
+                                 force_basic_auth=True)
+                assert resp.getcode() == 200
+                assert resp.read() == b'{"value": []}'
+        assert pool.connections_opened == 1
+        assert https_stand_in.connections == 1
+        assert https_stand_in.requests[0]["path"] == "/api/DeviceService/Devices?$top=1"
+        assert https_stand_in.requests[0]["headers"]["Authorization"] == basic_auth_header("admin", "password")
+
+    def test_pool_http_error(self, https_stand_in):
+        https_stand_in.routes["/api/missing"] = (404, JSON_HEADERS, {"error": "not found"})
+        with HTTPSConnectionPool(https_stand_in.base_url, maxsize=1) as pool:
+            with pytest.raises(HTTPError) as err:
+                pool.open(https_stand_in.base_url + "/api/missing", validate_certs=False)
+            assert err.value.code == 404
+            assert err.value.read() == b'{"error": "not found"}'
+            pool.open(https_stand_in.base_url + "/api/next", validate_certs=False)
+        assert https_stand_in.connections == 1
+
+    def test_pool_retries_stale_connection(self, https_stand_in):
+        def close_after_response(handler, body):
+            handler.close_connection = True
+            return 200, JSON_HEADERS, {"value": []}
+        https_stand_in.routes["/api/closing"] = close_after_response
+        with HTTPSConnectionPool(https_stand_in.base_url, maxsize=1) as pool:
+            pool.open(https_stand_in.base_url + "/api/closing", validate_certs=False)
+            resp = pool.open(https_stand_in.base_url + "/api/next", validate_certs=False)
+        assert resp.getcode() == 200
+        assert pool.connections_opened == 2
+
+    def test_pool_follows_same_origin_redirect(self, https_stand_in):
+        https_stand_in.routes["/api/old"] = (302, {"Location": "/api/new"}, b"")
+        with HTTPSConnectionPool(https_stand_in.base_url, maxsize=1) as pool:
+            resp = pool.open(https_stand_in.base_url + "/api/old", validate_certs=False, follow_redirects="all")
+        assert resp.geturl() == https_stand_in.base_url + "/api/new"
+        assert https_stand_in.connections == 1
+
+    def test_pool_falls_back_to_open_url(self, https_stand_in, mocker):
+        open_url_mock = mocker.patch(MODULE_UTIL_PATH + TRANSPORT_OPENURL)
+        with HTTPSConnectionPool(https_stand_in.base_url, maxsize=1) as pool:
+            pool.open("https://other.host:443/api/x", method="GET", validate_certs=False)
+            pool.open(https_stand_in.base_url + "/api/x", method="GET", url_username="admin", url_password="pwd")
+        assert open_url_mock.call_count == 2
+        assert https_stand_in.connections == 0
+
+    def test_rest_ome_owns_pool_for_context(self, https_stand_in):
+        ome = RestOME(ome_params(https_stand_in), pool_size=2)
+        with ome as obj:
+            assert obj._pool is not None
+            pool = obj._pool
+            for dummy in range(3):
+                assert obj.invoke_request("GET", "DeviceService/Devices").json_data == {"value": []}
+        assert ome._pool is None
+        assert pool.closed is True
+        assert pool.connections_opened == 1
+
+    def test_rest_ome_pool_from_env(self, https_stand_in, monkeypatch):
+        monkeypatch.setenv(POOL_SIZE_ENV, "3")
+        with RestOME(ome_params(https_stand_in)) as obj:
+            assert obj._pool.maxsize == 3
+
+    def test_rest_ome_connections_with_and_without_pool(self, https_stand_in):
+        for pool_size, connections in ((0, 20), (4, 1)):
+            opened = https_stand_in.connections
+            with RestOME(ome_params(https_stand_in), pool_size=pool_size) as obj:
+                for dummy in range(20):
+                    obj.invoke_request("GET", "DeviceService/Devices")
+            assert https_stand_in.connections - opened == connections
+        assert len(https_stand_in.requests) == 40
+
+
+class TestSharedSSLContext(object):
+
+    def test_get_ssl_context_cached_per_key(self, stand_in_cert):
+        ca_path = stand_in_cert[0]
+        assert get_ssl_context(False, None) is get_ssl_context(False, None)
+        assert get_ssl_context(True, ca_path) is get_ssl_context(True, ca_path)
+        assert get_ssl_context(True, ca_path) is not get_ssl_context(False, ca_path)
+
+    def test_open_url_loads_ca_bundle_once(self, https_stand_in, stand_in_cert, mocker, tmp_path):
+        ca_path = str(tmp_path / "bundle.pem")
+        with open(stand_in_cert[0]) as src, open(ca_path, "w") as dest:
+            dest.write(src.read())
+        make_context_mock = mocker.patch(MODULE_UTIL_PATH + MAKE_CONTEXT, wraps=make_context)
+        for dummy in range(3):
+            resp = open_url(https_stand_in.base_url + "/api/x", method="GET", validate_certs=True, ca_path=ca_path)
+            assert resp.getcode() == 200
+        assert make_context_mock.call_count == 1
+
+    def test_tls_session_resumed_across_connections(self, https_stand_in):
+        for dummy in range(3):
+            open_url(https_stand_in.base_url + "/api/x", method="GET", validate_certs=False)
+        assert https_stand_in.connections == 3
+        assert https_stand_in.resumed_sessions == 2
+
+    def test_pool_shares_ssl_context(self, https_stand_in):
+        open_url(https_stand_in.base_url + "/api/x", method="GET", validate_certs=False)
+        with HTTPSConnectionPool(https_stand_in.base_url, maxsize=1) as pool:
+            pool.open(https_stand_in.base_url + "/api/x", validate_certs=False)
+        assert https_stand_in.resumed_sessions == 1
+
+
+class TestResponseJsonCache(object):
+
+    @pytest.mark.parametrize("util", RESPONSE_MODULES, ids=lambda mod: mod.__name__.split(".")[-1])
+    def test_json_data_decoded_once(self, util, mocker):
+        resp = MagicMock()
+        resp.read.return_value = json.dumps({"value": [{"Id": idx} for idx in range(100)]}).encode()
+        loads_spy = mocker.spy(util.json, "loads")
+        response = util.OpenURLResponse(resp)
+        for dummy in range(5):
+            assert len(response.json_data["value"]) == 100
+        assert loads_spy.call_count == 1
+
+
+def compressing_route(payload):
+    def route(handler, body):
+        accept = handler.headers.get("Accept-Encoding", "")
+        if "gzip" in accept:
+            return 200, dict(JSON_HEADERS, **{"Content-Encoding": "gzip"}), gzip.compress(payload)
+        if "deflate" in accept:
+            return 200, dict(JSON_HEADERS, **{"Content-Encoding": "deflate"}), zlib.compress(payload)
+        return 200, JSON_HEADERS, payload
+    return route
+
+
+class TestCompression(object):
+
+    @pytest.mark.parametrize("encoding, encode", [
+        ("gzip", gzip.compress), ("x-gzip", gzip.compress), ("deflate", zlib.compress),
+        ("deflate", lambda data: zlib.compress(data)[2:-4]), ("identity", lambda data: data)])
+    def test_decode_content(self, encoding, encode):
+        assert decode_content(encode(b'{"value": []}'), {"Content-Encoding": encoding}) == b'{"value": []}'
+
+    def test_decode_content_without_headers(self):
+        assert decode_content(b'{}', MagicMock()) == b'{}'
+        assert decode_content(b'{}', None) == b'{}'
+
+    def test_open_url_without_compression(self, https_stand_in, monkeypatch):
+        monkeypatch.delenv(COMPRESSION_ENV, raising=False)
+        https_stand_in.routes["/api/x"] = compressing_route(b'{"value": []}')
+        resp = open_url(https_stand_in.base_url + "/api/x", method="GET", validate_certs=False)
+        assert "gzip" not in https_stand_in.requests[0]["headers"].get("Accept-Encoding", "")
+        assert resp.read() == b'{"value": []}'
+
+    def test_rest_ome_negotiates_compression(self, https_stand_in, monkeypatch):
+        monkeypatch.setenv(COMPRESSION_ENV, "true")
+        https_stand_in.routes["/api/DeviceService/Devices"] = compressing_route(b'{"value": [{"Id": 1}]}')
+        for pool_size in (0, 1):
+            with RestOME(ome_params(https_stand_in), pool_size=pool_size) as obj:
+                resp = obj.invoke_request("GET", "DeviceService/Devices")
+            assert resp.json_data == {"value": [{"Id": 1}]}
+        assert all(req["headers"]["Accept-Encoding"] == "gzip, deflate" for req in https_stand_in.requests)
+
+    def test_compressed_http_error_body(self, https_stand_in, monkeypatch):
+        monkeypatch.setenv(COMPRESSION_ENV, "true")
+        error = gzip.compress(b'{"error": {"message": "not found"}}')
+        https_stand_in.routes["/api/missing"] = (404, dict(JSON_HEADERS, **{"Content-Encoding": "gzip"}), error)
+        for pool_size in (0, 1):
+            with pytest.raises(HTTPError) as err:
+                with RestOME(ome_params(https_stand_in), pool_size=pool_size) as obj:
+                    obj.invoke_request("GET", "missing")
+            assert json.load(err.value) == {"error": {"message": "not found"}}
+
+    def test_compressed_inventory_bytes_on_the_wire(self, https_stand_in, monkeypatch):
+        payload = json.dumps({"value": [{"Id": idx, "Model": "PowerEdge R750"} for idx in range(200)]}).encode()
+        https_stand_in.routes["/api/DeviceService/Devices"] = compressing_route(payload)
+        lengths = {}
+        for enabled in ("false", "true"):
+            monkeypatch.setenv(COMPRESSION_ENV, enabled)
+            with RestOME(ome_params(https_stand_in), pool_size=1) as obj:
+                resp = obj.invoke_request("GET", "DeviceService/Devices")
+            assert resp.json_data == json.loads(payload)
+            lengths[enabled] = int(resp.resp.headers["Content-Length"])
+        assert lengths["false"] == len(payload)
+        assert lengths["true"] == len(gzip.compress(payload))
+
+
+class TestConcurrentPages(object):
+
+    @pytest.mark.parametrize("env_value, expected", [(None, 1), ("6", 6), ("-2", 0), ("many", 1)])
+    def test_get_env_int(self, env_value, expected, monkeypatch):
+        monkeypatch.delenv("OMAM_PAGE_WORKERS", raising=False)
+        if env_value is not None:
+            monkeypatch.setenv("OMAM_PAGE_WORKERS", env_value)
+        assert get_env_int("OMAM_PAGE_WORKERS", 1) == expected
+        assert RestOME(ome_params(MagicMock(port=443))).page_workers == expected
@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.8.0
+# Copyright (C) 2024 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import pytest
+from mock import MagicMock
+from ansible.module_utils.six.moves.urllib.error import HTTPError
+from ansible_collections.dellemc.openmanage.plugins.module_utils.utils import iter_data_with_pagination, \
+    get_all_data_with_pagination, invoke_select_request
+
+ALERT_URI = "AlertService/AlertMessageDefinitions"
+NEXT_LINK = "/api/AlertService/AlertMessageDefinitions?$skip=2&$top=2"
+DEVICE_URI = "DeviceService/Devices"
+DEVICE = {"@odata.id": "/api/DeviceService/Devices(10)", "Id": 10, "DeviceServiceTag": "SVC1234",
+          "DeviceManagement": [{"NetworkAddress": "192.168.0.10"}], "Model": "PowerEdge R750",
+          "InventoryDetails@odata.navigationLink": "/api/DeviceService/Devices(10)/InventoryDetails"}
+
+
+def page(value, next_link=None):
+    resp = MagicMock()
+    resp.json_data = {"value": value}
+    if next_link:
+        resp.json_data["@odata.nextLink"] = next_link
+    return resp
+
+
+class TestPagination(object):
+
+    def test_iter_data_with_pagination(self):
+        ome_obj = MagicMock()
+        ome_obj.invoke_request.side_effect = [page([1, 2], NEXT_LINK), page([3])]
+        items = iter_data_with_pagination(ome_obj, ALERT_URI, query_param={"$filter": "Category eq 'Audit'"})
+        assert next(items) == 1
+        assert ome_obj.invoke_request.call_count == 1
+        assert list(items) == [2, 3]
+        assert ome_obj.invoke_request.call_args_list[1][0] == (
+            'GET', "AlertService/AlertMessageDefinitions?$skip=2&$top=2&$filter=Category%20eq%20'Audit'")
+
+    def test_get_all_data_with_pagination(self):
+        ome_obj = MagicMock()
+        last_page = page([3])
+        ome_obj.invoke_request.side_effect = [page([1, 2], NEXT_LINK), last_page]
+        assert get_all_data_with_pagination(ome_obj, ALERT_URI) == {"resp_obj": last_page, "report_list": [1, 2, 3]}
+
+    def test_get_all_data_with_pagination_error(self):
+        ome_obj = MagicMock()
+        ome_obj.invoke_request.side_effect = [page([1], NEXT_LINK), HTTPError(ALERT_URI, 400, "Bad Request", {}, None)]
+        with pytest.raises(HTTPError):
+            get_all_data_with_pagination(ome_obj, ALERT_URI)
+
+
+class TestSelectProjection(object):
+
+    def test_select_sent_and_trimmed(self):
+        ome_obj = MagicMock(select_supported=None)
+        ome_obj.invoke_request.return_value = page([dict(DEVICE)])
+        resp = invoke_select_request(ome_obj, DEVICE_URI, query_param={"$top": 1}, select=["Id", "DeviceManagement"])
+        ome_obj.invoke_request.assert_called_once_with(
+            'GET', DEVICE_URI, query_param={"$top": 1, "$select": "Id,DeviceManagement"})
+        assert resp.json_data["value"] == [{"@odata.id": "/api/DeviceService/Devices(10)", "Id": 10,
+                                            "DeviceManagement": [{"NetworkAddress": "192.168.0.10"}]}]
+        assert ome_obj.select_supported is True
+
+    @pytest.mark.parametrize("code", [400, 501])
+    def test_select_rejected_falls_back(self, code):
+        ome_obj = MagicMock(select_supported=None)
+        ome_obj.invoke_request.side_effect = [HTTPError(DEVICE_URI, code, "Bad Request", {}, None),
+                                              page([dict(DEVICE)]), page([dict(DEVICE)])]
+        for dummy in range(2):
+            resp = invoke_select_request(ome_obj, DEVICE_URI, select=["DeviceServiceTag"])
+            assert resp.json_data["value"][0]["DeviceServiceTag"] == "SVC1234"
+            assert "Model" not in resp.json_data["value"][0]
+        assert ome_obj.select_supported is False
+        assert ome_obj.invoke_request.call_args_list[2][1] == {"query_param": None}
+
+    def test_select_other_error_raised(self):
+        ome_obj = MagicMock(select_supported=None)
+        ome_obj.invoke_request.side_effect = HTTPError(DEVICE_URI, 401, "Unauthorized", {}, None)
+        with pytest.raises(HTTPError):
+            invoke_select_request(ome_obj, DEVICE_URI, select=["Id"])
+
+    def test_get_all_data_with_select(self):
+        ome_obj = MagicMock(select_supported=None)
+        ome_obj.invoke_request.side_effect = [page([dict(DEVICE)], "/api/DeviceService/Devices?$skip=1"),
+                                              page([dict(DEVICE, Id=11)])]
+        report = get_all_data_with_pagination(ome_obj, DEVICE_URI, query_param={"$filter": "Type eq 1000"},
+                                              select=["Id"])
+        assert [sorted(item) for item in report["report_list"]] == [["@odata.id", "Id"]] * 2
+        assert ome_obj.invoke_request.call_args_list[1][0] == (
+            'GET', "DeviceService/Devices?$skip=1&$filter=Type%20eq%201000&$select=Id")
@@ -360,6 +360,19 @@ class TestidracFirmware(FakeAnsibleModule):
         assert result == {'msg': 'Successfully updated the firmware.', 'update_status': 'Success',
                           'changed': False, 'failed': False}
 
+    @pytest.mark.parametrize("reboot, state_map", [(True, "idrac"), (False, "idrac_staged")])
+    def test_main_idrac_firmware_job_handle(self, reboot, state_map, idrac_connection_firmware_redfish_mock,
+                                            idrac_default_args, mocker):
+        idrac_default_args.update({"share_name": "http://192.168.0.1/repo", "reboot": reboot, "job_wait": False})
+        message = {"update_msg": "Successfully triggered the job to update the firmware.",
+                   "update_status": {"Id": "JID_123456789012", "JobState": "New"}, 'changed': False, 'failed': False}
+        idrac_connection_firmware_redfish_mock.json_data = {}
+        mocker.patch(MODULE_PATH + 'idrac_firmware.update_firmware_redfish', return_value=message)
+        result = self._run_module(idrac_default_args)
+        assert result['job_handle'] == {"api": "idrac", "host": "idrac_ip", "port": 443,
+                                        "job_uri": "/redfish/v1/JobService/Jobs/JID_123456789012",
+                                        "job_id": "JID_123456789012", "state_map": state_map}
+
     def test_main_HTTPError_case(self, idrac_default_args, idrac_connection_firmware_redfish_mock, mocker):
         idrac_default_args.update({"share_name": "sharename", "catalog_file_name": CATALOG,
                                    "share_user": "sharename", "share_password": SHARE_PWD,
@@ -84,19 +84,24 @@ class TestOMEDeviceGroup(FakeAnsibleModule):
         assert resp == 1234
 
     def test_ome_device_group_get_device_id(self, ome_connection_mock_for_device_group):
-        report_list = [{"Id": 25011, "DeviceServiceTag": "SEFRG2"}, {"Id": 25012, "DeviceServiceTag": "SEFRG3"}]
-        ome_connection_mock_for_device_group.get_all_report_details.return_value = {"report_list": report_list}
+        devices = {25011: {"Id": 25011, "DeviceServiceTag": "SEFRG2"}, 25012: {"Id": 25012, "DeviceServiceTag": "SEFRG3"}}
+        ome_connection_mock_for_device_group.resolve_devices.return_value = {"Id": devices}
         f_module = self.get_module_mock(params={"name": "Storage Services",
                                                 "device_ids": [25011, 25012]})
         device_list, key = self.module.get_device_id(ome_connection_mock_for_device_group, f_module)
         assert device_list == [25011, 25012]
         assert key == "Id"
+        ome_connection_mock_for_device_group.resolve_devices.assert_called_with(
+            device_ids=[25011, 25012], select=["Id", "DeviceServiceTag", "DeviceManagement"])
+        ome_connection_mock_for_device_group.resolve_devices.return_value = {"DeviceServiceTag": dict(
+            (device["DeviceServiceTag"], device) for device in devices.values())}
         f_module = self.get_module_mock(params={"name": "Storage Services",
                                                 "device_service_tags": ["SEFRG2", "SEFRG3"]})
         device_list, key = self.module.get_device_id(ome_connection_mock_for_device_group, f_module)
         assert device_list == [25011, 25012]
         assert key == "DeviceServiceTag"
 
+        ome_connection_mock_for_device_group.resolve_devices.return_value = {"Id": {25011: devices[25011]}}
         f_module = self.get_module_mock(params={"name": "Storage Services",
                                                 "device_ids": [25011, 25000]})
         with pytest.raises(Exception) as exc:
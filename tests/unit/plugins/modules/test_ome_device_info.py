@@ -196,13 +196,13 @@ class TestOmeDeviceInfo(FakeAnsibleModule):
         mocker.patch(MODULE_PATH + 'ome_device_info.update_device_details_with_filtering')
         ome_response_mock.json_data.update({"@odata.context": "/api/$metadata#Collection(DeviceService.Device)"})
         ome_response_mock.json_data.update({"@odata.count": 1})
-        ome_connection_mock.get_all_report_details.return_value = {"resp_obj": ome_response_mock, "report_list": [
-            {"DeviceServiceTag": Constants.service_tag1,
-             "Id": Constants.device_id1}]}
-        self.module._get_device_id_from_service_tags([Constants.service_tag1, "INVALID"], ome_connection_mock)
+        ome_connection_mock.resolve_devices.return_value = {"Id": {}, "DeviceServiceTag": {
+            Constants.service_tag1: {"DeviceServiceTag": Constants.service_tag1, "Id": Constants.device_id1}}}
+        data = self.module._get_device_id_from_service_tags([Constants.service_tag1, "INVALID"], ome_connection_mock)
+        assert data == {Constants.device_id1: Constants.service_tag1}
 
     def test_get_device_id_from_service_tags_error_case(self, ome_connection_mock, ome_response_mock):
-        ome_connection_mock.get_all_report_details.side_effect = HTTPError(HTTPS_ADDRESS, 400, '', {}, None)
+        ome_connection_mock.resolve_devices.side_effect = HTTPError(HTTPS_ADDRESS, 400, '', {}, None)
         with pytest.raises(HTTPError) as ex:
             self.module._get_device_id_from_service_tags(["INVALID"], ome_connection_mock)
 
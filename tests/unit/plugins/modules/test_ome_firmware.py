@@ -325,23 +325,34 @@ class TestOmeFirmware(FakeAnsibleModule):
     def test_get_device_ids_success_case(self, ome_connection_firmware_mock, ome_response_mock, ome_default_args):
         ome_default_args.update()
         f_module = self.get_module_mock()
-        ome_connection_firmware_mock.get_all_report_details.return_value = {
-            "report_list": [{'Id': 1111, 'DeviceServiceTag': "ABC1111"},
-                            {'Id': 2222, 'DeviceServiceTag': "ABC2222"},
-                            {'Id': 3333, 'DeviceServiceTag': "ABC3333"},
-                            {'Id': 4444, 'DeviceServiceTag': "ABC4444"}]}
+        ome_connection_firmware_mock.resolve_devices.return_value = {
+            "Id": {1111: {'Id': 1111, 'DeviceServiceTag': "ABC1111"},
+                   2222: {'Id': 2222, 'DeviceServiceTag': "ABC2222"},
+                   3333: {'Id': 3333, 'DeviceServiceTag': "ABC3333"}},
+            "DeviceServiceTag": {"ABC4444": {'Id': 4444, 'DeviceServiceTag': "ABC4444"}}}
         data, id_tag_map = self.module.get_device_ids(ome_connection_firmware_mock, f_module, [1111, 2222, 3333, "ABC4444"])
         assert data == ['1111', '2222', '3333', '4444']
+        assert id_tag_map == {'1111': "ABC1111", '2222': "ABC2222", '3333': "ABC3333", '4444': "ABC4444"}
+        ome_connection_firmware_mock.resolve_devices.assert_called_once_with(
+            device_ids=['1111', '2222', '3333'], service_tags=["ABC4444"], select=["Id", "DeviceServiceTag"])
 
     def test_get_device_ids_failure_case01(self, ome_connection_firmware_mock, ome_response_mock):
-        ome_response_mock.json_data = {'value': [{'Id': 'DeviceServiceTag'}]}
-        ome_response_mock.success = False
+        ome_connection_firmware_mock.resolve_devices.return_value = {"Id": {}, "DeviceServiceTag": {}}
+        ome_response_mock.json_data = {"value": [{"Id": 1111, "DeviceServiceTag": "ABC1111"}]}
         f_module = self.get_module_mock()
         with pytest.raises(Exception) as exc:
             self.module.get_device_ids(ome_connection_firmware_mock, f_module, [2222])
         assert exc.value.args[0] == "Unable to complete the operation because the entered target device service" \
                                     " tag(s) or device id(s) '{0}' are invalid.".format("2222")
 
+    def test_get_device_ids_without_devices(self, ome_connection_firmware_mock, ome_response_mock):
+        ome_connection_firmware_mock.resolve_devices.return_value = {"Id": {}, "DeviceServiceTag": {}}
+        ome_response_mock.json_data = {"value": []}
+        f_module = self.get_module_mock()
+        with pytest.raises(Exception) as exc:
+            self.module.get_device_ids(ome_connection_firmware_mock, f_module, [2222, "ABC4444"])
+        assert exc.value.args[0] == "Failed to fetch the device facts."
+
     def test__validate_device_attributes_success_case(self, ome_connection_firmware_mock, ome_response_mock,
                                                       ome_default_args):
         ome_default_args.update({'device_service_tag': ['R9515PT'], 'device_id': [2222]})
@@ -424,6 +435,17 @@ class TestOmeFirmware(FakeAnsibleModule):
         assert data['msg'] == "Successfully submitted the firmware update job."
         assert data['update_status'] == "Success"
 
+    def test_main_firmware_job_handle(self, ome_default_args, mocker, ome_connection_firmware_mock):
+        ome_default_args.update({"baseline_name": "baseline_name"})
+        mocker.patch(MODULE_PATH + 'ome_firmware.validate_inputs')
+        mocker.patch(MODULE_PATH + 'ome_firmware.get_baseline_ids', return_value=[1, 2])
+        mocker.patch(MODULE_PATH + 'ome_firmware.job_payload_for_update', return_value={"job_payload": "values"})
+        mocker.patch(MODULE_PATH + 'ome_firmware.spawn_update_job', return_value={"Id": 11117})
+        mocker.patch(MODULE_PATH + 'ome_firmware.baseline_based_update', return_value="target_data")
+        data = self._run_module(ome_default_args)
+        assert data['job_handle'] == {"api": "ome", "host": "XX.XX.XX.XX", "port": 443,
+                                      "job_uri": "JobService/Jobs(11117)", "job_id": "11117", "state_map": "ome_info"}
+
     def test_job_payload_for_update_case_01(self, ome_connection_firmware_mock):
         """response None case"""
         f_module = self.get_module_mock()
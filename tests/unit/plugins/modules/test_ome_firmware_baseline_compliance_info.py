@@ -39,8 +39,8 @@ class TestOmeFirmwareCatalog(FakeAnsibleModule):
 
     def test__get_device_id_from_service_tags_for_baseline_success_case(self, ome_response_mock,
                                                                         ome_connection_mock_for_firmware_baseline_compliance_info):
-        ome_connection_mock_for_firmware_baseline_compliance_info.get_all_report_details.return_value = {
-            "report_list": [{"DeviceServiceTag": Constants.service_tag1, "Id": Constants.device_id1}]}
+        ome_connection_mock_for_firmware_baseline_compliance_info.resolve_devices.return_value = {"Id": {}, "DeviceServiceTag": {
+            Constants.service_tag1: {"DeviceServiceTag": Constants.service_tag1, "Id": Constants.device_id1}}}
         f_module = self.get_module_mock()
         data = self.module._get_device_id_from_service_tags([Constants.service_tag1],
                                                             ome_connection_mock_for_firmware_baseline_compliance_info,
@@ -49,8 +49,9 @@ class TestOmeFirmwareCatalog(FakeAnsibleModule):
 
     def test__get_device_id_from_service_tags_empty_case(self, ome_response_mock,
                                                          ome_connection_mock_for_firmware_baseline_compliance_info):
-        ome_connection_mock_for_firmware_baseline_compliance_info.get_all_report_details.return_value = {
-            "report_list": []}
+        ome_connection_mock_for_firmware_baseline_compliance_info.resolve_devices.return_value = {
+            "Id": {}, "DeviceServiceTag": {}}
+        ome_response_mock.json_data = {"value": []}
         f_module = self.get_module_mock()
         with pytest.raises(Exception) as exc:
             data = self.module._get_device_id_from_service_tags([Constants.service_tag1],
@@ -61,7 +62,7 @@ class TestOmeFirmwareCatalog(FakeAnsibleModule):
     def test_get_device_id_from_service_tags_for_baseline_error_case(self,
                                                                      ome_connection_mock_for_firmware_baseline_compliance_info,
                                                                      ome_response_mock):
-        ome_connection_mock_for_firmware_baseline_compliance_info.get_all_report_details.side_effect = HTTPError(
+        ome_connection_mock_for_firmware_baseline_compliance_info.resolve_devices.side_effect = HTTPError(
             HTTP_ADDRESS, 400, '', {}, None)
         f_module = self.get_module_mock()
         with pytest.raises(HTTPError) as ex:
@@ -72,14 +73,14 @@ class TestOmeFirmwareCatalog(FakeAnsibleModule):
     def test_get_device_id_from_service_tags_for_baseline_value_error_case(self,
                                                                            ome_connection_mock_for_firmware_baseline_compliance_info,
                                                                            ome_response_mock):
-        ome_connection_mock_for_firmware_baseline_compliance_info.get_all_report_details.return_value = {
-            "report_list": []}
+        ome_connection_mock_for_firmware_baseline_compliance_info.resolve_devices.return_value = {
+            "Id": {}, "DeviceServiceTag": {}}
+        ome_response_mock.json_data = {"value": [{"Id": Constants.device_id1}]}
         f_module = self.get_module_mock()
-        with pytest.raises(Exception) as exc:
-            self.module._get_device_id_from_service_tags(["#$%^&"],
-                                                         ome_connection_mock_for_firmware_baseline_compliance_info,
-                                                         f_module)
-        assert exc.value.args[0] == "Unable to fetch the device information."
+        data = self.module._get_device_id_from_service_tags(["#$%^&"],
+                                                            ome_connection_mock_for_firmware_baseline_compliance_info,
+                                                            f_module)
+        assert data == {}
 
     def test_get_device_ids_from_group_ids_success_case(self, ome_response_mock,
                                                         ome_connection_mock_for_firmware_baseline_compliance_info):
@@ -303,6 +304,17 @@ class TestOmeFirmwareCatalog(FakeAnsibleModule):
                                                            f_module)
         assert exc.value.args[0] == "Device details not available as the service tag(s) provided are invalid."
 
+    def test_get_baselines_report_by_invalid_service_tags_case(self, ome_connection_mock_for_firmware_baseline_compliance_info,
+                                                               ome_response_mock):
+        ome_connection_mock_for_firmware_baseline_compliance_info.resolve_devices.return_value = {
+            "Id": {}, "DeviceServiceTag": {}}
+        ome_response_mock.json_data = {"value": [{"Id": Constants.device_id1}]}
+        f_module = self.get_module_mock(params={"device_service_tags": ["INVALID"]})
+        with pytest.raises(AnsibleFailJSonException) as exc:
+            self.module.get_baselines_report_by_device_ids(ome_connection_mock_for_firmware_baseline_compliance_info,
+                                                           f_module)
+        assert exc.value.args[0] == "Device details not available as the service tag(s) provided are invalid."
+
     def test_get_baselines_report_by_group_names_not_exits_case(self, mocker,
                                                                 ome_connection_mock_for_firmware_baseline_compliance_info,
                                                                 ome_response_mock):
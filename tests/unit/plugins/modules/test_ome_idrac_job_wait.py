@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.8.0
+# Copyright (C) 2024 Dell Inc. or its subsidiaries. All Rights Reserved.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import pytest
+from ansible_collections.dellemc.openmanage.plugins.module_utils import instrumentation
+from ansible_collections.dellemc.openmanage.plugins.modules import ome_idrac_job_wait
+from ansible_collections.dellemc.openmanage.tests.unit.plugins.modules.common import FakeAnsibleModule
+
+MODULE_PATH = 'ansible_collections.dellemc.openmanage.plugins.modules.ome_idrac_job_wait.'
+IDRAC_JOB = {"api": "idrac", "host": "192.168.0.2", "job_uri": "/redfish/v1/JobService/Jobs/JID_1", "job_id": "JID_1"}
+OME_JOB = {"api": "ome", "host": "192.168.0.1", "job_uri": "JobService/Jobs(10)", "job_id": "10",
+           "username": "admin", "password": "secret"}
+
+
+def fleet_result(handle, status):
+    result = dict(handle, status=status)
+    result.pop("username", None)
+    result.pop("password", None)
+    return result
+
+
+class TestRedfishJobWait(FakeAnsibleModule):
+    module = ome_idrac_job_wait
+
+    @pytest.fixture
+    def fleet_mock(self, mocker):
+        fleet = mocker.patch(MODULE_PATH + 'JobFleet')
+        fleet.return_value.wait.side_effect = lambda: [fleet_result(handle, fleet.statuses.pop(0))
+                                                       for handle in fleet.call_args[0][0]]
+        return fleet
+
+    def test_all_jobs_completed(self, fleet_mock):
+        fleet_mock.statuses = ["completed", "completed"]
+        result = self._run_module({"jobs": [IDRAC_JOB, OME_JOB], "username": "root", "password": "calvin",
+                                   "job_wait_timeout": 1800, "workers": 4})
+        assert result["msg"] == "Successfully completed all the 2 jobs."
+        assert result["summary"] == {"completed": 2, "failed": 0, "timeout": 0, "error": 0}
+        handles, credentials, timeout, interval = fleet_mock.call_args[0]
+        assert [handle["state_map"] for handle in handles] == ["idrac", "ome_info"]
+        assert (credentials["username"], timeout, interval) == ("root", 1800, 30)
+        assert fleet_mock.call_args[1] == {"workers": 4}
+        assert not result["changed"]
+
+    def test_jobs_not_completed(self, fleet_mock):
+        fleet_mock.statuses = ["failed", "timeout"]
+        job = dict(IDRAC_JOB, state_map="idrac_staged")
+        result = self._run_module_with_fail_json({"jobs": [job, OME_JOB], "username": "root", "password": "calvin"})
+        assert result["msg"] == "2 of the 2 jobs did not complete successfully."
+        assert result["summary"] == {"completed": 0, "failed": 1, "timeout": 1, "error": 0}
+        assert result["jobs"][0]["state_map"] == "idrac_staged"
+
+    def test_missing_credentials(self, fleet_mock):
+        result = self._run_module_with_fail_json({"jobs": [OME_JOB, IDRAC_JOB]})
+        assert result["msg"] == "Unable to track the job JID_1 on 192.168.0.2 because the username and " \
+                                "password are not provided."
+        fleet_mock.assert_not_called()
+
+    def test_job_metrics_returned(self, fleet_mock, monkeypatch):
+        monkeypatch.setenv(instrumentation.INSTRUMENTATION_ENV, "1")
+        instrumentation.reset_spans()
+
+        def wait():
+            instrumentation.record_job({"job": "JID_1", "outcome": "completed"})
+            return [fleet_result(IDRAC_JOB, "completed")]
+        fleet_mock.return_value.wait.side_effect = wait
+        result = self._run_module({"jobs": [IDRAC_JOB], "username": "root", "password": "calvin"})
+        assert result["debug"]["jobs"] == [{"job": "JID_1", "outcome": "completed"}]
+        instrumentation.reset_spans()
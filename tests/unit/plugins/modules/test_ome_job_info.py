@@ -49,13 +49,24 @@ class TestOmeJobInfo(FakeAnsibleModule):
         ome_response_mock.json_data = {"@odata.context": "/api/$metadata#Collection(JobService.Job)",
                                        "@odata.count": 1}
         ome_response_mock.success = True
-        job_details = {"resp_obj": ome_response_mock,
-                       "report_list": [{"Name": "job1", "Id": 123}, {"Name": "job2", "Id": 124}]}
-        ome_connection_job_info_mock.get_all_report_details.return_value = job_details
+        ome_connection_job_info_mock.iter_items_with_pagination.return_value = iter(
+            [{"@odata.id": "/api/JobService/Jobs(123)", "Name": "job1", "Id": 123}, {"Name": "job2", "Id": 124}])
         result = self._run_module(ome_default_args)
-        assert 'job_info' in result
+        assert [job["Name"] for job in result['job_info']["value"]] == ["job1", "job2"]
+        assert "@odata.id" not in result['job_info']["value"][0]
         assert result['msg'] == "Successfully fetched the job info"
 
+    def test_job_info_fans_out_last_execution_details(self, ome_default_args, ome_connection_job_info_mock,
+                                                      ome_response_mock, mocker, monkeypatch):
+        monkeypatch.setenv("OMAM_FAN_OUT_WORKERS", "4")
+        ome_response_mock.success = True
+        ome_connection_job_info_mock.iter_items_with_pagination.return_value = iter(
+            [{"Name": "job{0}".format(job_id), "Id": job_id} for job_id in range(10)])
+        mocker.patch(MODULE_PATH + 'ome_job_info.get_uri_detail', side_effect=lambda rest_obj, uri: {"uri": uri})
+        result = self._run_module(ome_default_args)
+        assert [job["LastExecutionDetail"]["uri"] for job in result['job_info']["value"]] == \
+            ["JobService/Jobs({0})/LastExecutionDetail".format(job_id) for job_id in range(10)]
+
     def test_job_info_main_success_case_job_id(self, ome_default_args, ome_connection_job_info_mock,
                                                ome_response_mock):
         ome_default_args.update({"job_id": 1})
@@ -125,6 +125,8 @@ class TestRedfishFirmware(FakeAnsibleModule):
         assert result['msg'] == 'Successfully submitted the firmware update task.'
         assert result['task']['id'] == redfish_response_mock.headers.get().split().__getitem__()
         assert result['task']['uri'] == JOB_URI.format(job_id=redfish_response_mock.headers.get().split().__getitem__())
+        assert (result['job_handle']['api'], result['job_handle']['state_map']) == ("redfish", "redfish_job")
+        assert result['job_handle']['job_uri'] == "/redfish/v1/" + result['task']['uri']
 
     @pytest.mark.parametrize("exc_type",
                              [URLError, HTTPError, SSLValidationError, ConnectionError, TypeError, ValueError])
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+#
+# Dell OpenManage Ansible Modules
+# Version 9.8.0
+# Copyright (C) 2024 Dell Inc.
+
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+# All rights reserved. Dell, EMC, and other trademarks are trademarks of Dell Inc. or its subsidiaries.
+# Other trademarks may be trademarks of their respective owners.
+#
+
+from __future__ import (absolute_import, division, print_function)
+
+__metaclass__ = type
+
+import datetime
+import ipaddress
+import json
+import os
+import socket
+import ssl
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+STAND_IN_HOST = "127.0.0.1"
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _dispatch(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        stand_in = self.server
+        stand_in.record(self, body)
+        route = stand_in.routes.get(self.path.split("?")[0], stand_in.default_route)
+        if callable(route):
+            route = route(self, body)
+        status, headers, payload = route
+        if not isinstance(payload, bytes):
+            payload = json.dumps(payload).encode()
+        self.send_response(status)
+        for key, val in headers.items():
+            self.send_header(key, val)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _dispatch
+
+
+class StandInServer(ThreadingHTTPServer):
+    """Local HTTPS appliance stand-in which counts connections and TLS handshakes"""
+
+    daemon_threads = True
+
+    def __init__(self, ssl_context):
+        super(StandInServer, self).__init__((STAND_IN_HOST, 0), StandInHandler)
+        self.ssl_context = ssl_context
+        self.routes = {}
+        self.default_route = (200, {"Content-Type": "application/json"}, {"value": []})
+        self.requests = []
+        self.connections = 0
+        self.resumed_sessions = 0
+        self._lock = threading.Lock()
+
+    @property
+    def base_url(self):
+        return "https://{0}:{1}".format(STAND_IN_HOST, self.server_address[1])
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+    def get_request(self):
+        sock, addr = self.socket.accept()
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with self._lock:
+            self.connections += 1
+        return self.ssl_context.wrap_socket(sock, server_side=True, do_handshake_on_connect=False), addr
+
+    def finish_request(self, request, client_address):
+        try:
+            request.do_handshake()
+        except (ssl.SSLError, OSError):
+            return
+        if request.session_reused:
+            with self._lock:
+                self.resumed_sessions += 1
+        super(StandInServer, self).finish_request(request, client_address)
+
+    def record(self, handler, body):
+        with self._lock:
+            self.requests.append({"method": handler.command, "path": handler.path,
+                                  "headers": dict(handler.headers), "body": body})
+
+
+def create_stand_in_cert(cert_dir):
+    """Writes a self-signed certificate and key of the stand-in to cert_dir and returns their paths"""
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, u"localhost")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (x509.CertificateBuilder().subject_name(name).issuer_name(name).public_key(key.public_key())
+            .serial_number(x509.random_serial_number()).not_valid_before(now - datetime.timedelta(days=1))
+            .not_valid_after(now + datetime.timedelta(days=1))
+            .add_extension(x509.SubjectAlternativeName([x509.DNSName(u"localhost"),
+                                                        x509.IPAddress(ipaddress.ip_address(STAND_IN_HOST))]),
+                           critical=False)
+            .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+            .sign(key, hashes.SHA256()))
+    cert_file = os.path.join(cert_dir, "cert.pem")
+    key_file = os.path.join(cert_dir, "key.pem")
+    with open(cert_file, "wb") as pem:
+        pem.write(cert.public_bytes(serialization.Encoding.PEM))
+    with open(key_file, "wb") as pem:
+        pem.write(key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8,
+                                    serialization.NoEncryption()))
+    return cert_file, key_file
+
+
+def start_stand_in(cert):
+    """Starts a stand-in serving HTTPS with the certificate and key paths of cert"""
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(*cert)
+    server = StandInServer(context)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05})
+    thread.daemon = True
+    thread.start()
+    return server
+
+
+def stop_stand_in(server):
+    server.shutdown()
+    server.server_close()